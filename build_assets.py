@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+"""
+Build static asset bundles for the Drag and Drop V2 XBlock learner view.
+
+Combines learner view CSS and JS files listed in drag_and_drop_v2/assets.py into content-hashed bundles in
+drag_and_drop_v2/public/bundles and writes their manifest. Bundles are minified if `rcssmin` and `rjsmin` are
+installed. This is a build step only - the block never imports this script or the minifiers.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+
+from drag_and_drop_v2.assets import BUNDLES, BUNDLES_DIR, MANIFEST_PATH, PACKAGE_DIR
+
+try:
+    import rcssmin
+except ImportError:
+    rcssmin = None
+
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+
+CSS_URL_RE = re.compile(r'''url\(\s*(['"]?)([^'")]+)\1\s*\)''')
+
+
+def rewrite_css_urls(css, source_path, bundle_path):
+    """
+    Rewrites relative `url()` references in `css` loaded from `source_path`, so that they keep pointing to the same
+    files when served from `bundle_path`.
+    """
+    source_dir = os.path.dirname(source_path)
+    bundle_dir = os.path.dirname(bundle_path)
+
+    def rewrite(match):
+        """ Rewrites single url() """
+        quote, url = match.groups()
+        if re.match(r'^([a-z]+:|/|#)', url):
+            return match.group(0)
+        rewritten = os.path.relpath(os.path.normpath(os.path.join(source_dir, url)), bundle_dir)
+        return 'url({quote}{url}{quote})'.format(quote=quote, url=rewritten.replace(os.sep, '/'))
+
+    return CSS_URL_RE.sub(rewrite, css)
+
+
+def _read(package_dir, path):
+    """ Reads package file """
+    with open(os.path.join(package_dir, path), 'rb') as source_file:
+        return source_file.read()
+
+
+def sources_hash(package_dir=PACKAGE_DIR):
+    """
+    Returns hash of all bundled source files - allows detecting stale bundles
+    """
+    digest = hashlib.sha1()
+    for name in sorted(BUNDLES):
+        for path in BUNDLES[name]:
+            digest.update(path)
+            digest.update(_read(package_dir, path))
+    return digest.hexdigest()
+
+
+def _build_bundle(package_dir, name, sources):
+    """
+    Returns content of bundle `name`, built from `sources`
+    """
+    bundle_path = '{}/{}'.format(BUNDLES_DIR, name)
+    if name.endswith('.css'):
+        parts = [rewrite_css_urls(_read(package_dir, path), path, bundle_path) for path in sources]
+        content = '\n'.join(parts)
+        return rcssmin.cssmin(content) if rcssmin is not None else content
+    parts = [_read(package_dir, path) for path in sources]
+    # Files are separated by semicolons, as some of them may not end with one
+    content = '\n;\n'.join(parts)
+    return rjsmin.jsmin(content) if rjsmin is not None else content
+
+
+def build_bundles(package_dir=PACKAGE_DIR):
+    """
+    Builds content-hashed bundles and manifest into `public/bundles` directory; removes stale bundles.
+    Returns manifest.
+    """
+    output_dir = os.path.join(package_dir, BUNDLES_DIR)
+    if not os.path.isdir(output_dir):
+        os.makedirs(output_dir)
+
+    bundles = {}
+    for name, sources in sorted(BUNDLES.items()):
+        content = _build_bundle(package_dir, name, sources)
+        base, extension = os.path.splitext(name)
+        filename = '{}.{}{}'.format(base, hashlib.sha1(content).hexdigest()[:12], extension)
+        with open(os.path.join(output_dir, filename), 'wb') as bundle_file:
+            bundle_file.write(content)
+        bundles[name] = '{}/{}'.format(BUNDLES_DIR, filename)
+
+    current = set(os.path.basename(path) for path in bundles.values())
+    for filename in os.listdir(output_dir):
+        if filename != os.path.basename(MANIFEST_PATH) and filename not in current:
+            os.remove(os.path.join(output_dir, filename))
+
+    manifest = {
+        'bundles': bundles,
+        'sources_hash': sources_hash(package_dir),
+        'minified': rcssmin is not None and rjsmin is not None,
+    }
+    with open(os.path.join(package_dir, MANIFEST_PATH), 'w') as manifest_file:
+        json.dump(manifest, manifest_file, indent=2, sort_keys=True, separators=(',', ': '))
+        manifest_file.write('\n')
+    return manifest
+
+
+def main(argv=None):
+    """
+    Command line entry point
+    """
+    parser = argparse.ArgumentParser(description="Build learner view asset bundles of drag_and_drop_v2 package.")
+    parser.add_argument(
+        '--package-dir', default=PACKAGE_DIR, help="Directory of the drag_and_drop_v2 package to build bundles in"
+    )
+    args = parser.parse_args(argv)
+
+    manifest = build_bundles(args.package_dir)
+    for name, path in sorted(manifest['bundles'].items()):
+        print "{}: {}".format(name, path)
+    if not manifest['minified']:
+        print "Bundles are not minified - install rcssmin and rjsmin to minify them."
+
+
+if __name__ == "__main__":
+    main()
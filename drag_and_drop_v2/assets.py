@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Drag and Drop v2 XBlock - Static asset bundles
+
+Learner view CSS and JS files are combined into content-hashed bundles by the `build_assets.py` script.
+Bundles are listed in a manifest; when the manifest is missing or `debug_assets` setting is enabled, individual
+files are served instead.
+"""
+import json
+import os
+
+
+STUDENT_VIEW_CSS = (
+    'public/css/vendor/jquery-ui-1.10.4.custom.min.css',
+    'public/css/drag_and_drop.css',
+)
+STUDENT_VIEW_JS = (
+    'public/js/vendor/jquery-ui-1.10.4.custom.min.js',
+    'public/js/vendor/jquery-ui-touch-punch-0.2.3.min.js',  # Makes it work on touch devices
+    'public/js/vendor/virtual-dom-1.3.0.min.js',
+    'public/js/drag_and_drop.js',
+)
+
+BUNDLES = {
+    'student_view.css': STUDENT_VIEW_CSS,
+    'student_view.js': STUDENT_VIEW_JS,
+}
+
+BUNDLES_DIR = 'public/bundles'
+MANIFEST_PATH = BUNDLES_DIR + '/manifest.json'
+DEBUG_SETTINGS_KEY = 'debug_assets'
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_MANIFEST_CACHE = {}
+
+
+def load_manifest(loader):
+    """
+    Returns bundles manifest, loaded once per process. Returns empty manifest if bundles were not built.
+    """
+    if 'manifest' not in _MANIFEST_CACHE:
+        try:
+            _MANIFEST_CACHE['manifest'] = json.loads(loader.load_unicode(MANIFEST_PATH))
+        except (IOError, ValueError):
+            _MANIFEST_CACHE['manifest'] = {}
+    return _MANIFEST_CACHE['manifest']
+
+
+def get_student_view_assets(loader, xblock_settings):
+    """
+    Returns (CSS paths, JS paths) of resources to be added to student view
+    """
+    bundles = load_manifest(loader).get('bundles', {})
+    debug = (xblock_settings or {}).get(DEBUG_SETTINGS_KEY)
+    if debug or not all(name in bundles for name in ('student_view.css', 'student_view.js')):
+        return STUDENT_VIEW_CSS, STUDENT_VIEW_JS
+    return (bundles['student_view.css'],), (bundles['student_view.js'],)
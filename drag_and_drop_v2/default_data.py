@@ -7,6 +7,10 @@ TARGET_IMG_DESCRIPTION = _(
     "and the narrowest layer is located at the top."
 )
 
+# Size of the default target image, public/img/triangle.png, in pixels
+DEFAULT_TARGET_IMG_WIDTH = 514
+DEFAULT_TARGET_IMG_HEIGHT = 486
+
 TOP_ZONE_ID = "top"
 MIDDLE_ZONE_ID = "middle"
 BOTTOM_ZONE_ID = "bottom"
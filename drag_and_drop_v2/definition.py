@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+""" Drag and Drop v2 XBlock - learner-facing problem definition, compiled once per distinct problem data """
+import copy
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict, namedtuple
+
+from .images import file_signature, inline_image
+from .utils import StateMigration
+
+
+# Compiled definitions are shared between blocks and requests, so they must not be modified.
+CompiledDefinition = namedtuple(  # pylint: disable=invalid-name
+    'CompiledDefinition',
+    ["version", "zones", "items", "inline_images", "inline_sources"]
+)
+
+# Maximum number of compiled definitions kept in memory by each process; least recently used ones are evicted
+CACHE_SIZE = 256
+
+_CACHE = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+UNSAFE_ID_CHARS_RE = re.compile(r'[^\w\-]')
+
+# Zone geometry percentages are rounded to this many decimal places; even on very large
+# images the difference is a fraction of a pixel, and the configuration is smaller.
+GEOMETRY_PRECISION = 4
+
+
+def definition_version(data):
+    """
+    Returns a hash identifying the content of problem `data`.
+    """
+    return hashlib.sha1(json.dumps(data, sort_keys=True)).hexdigest()
+
+
+def compile_definition(data, url_name, target_img_dimensions, image_settings=None, version=None):
+    """
+    Returns the learner-facing definition of problem `data`: zones and items without answers, and data URIs
+    of small item images if image inlining is enabled.
+
+    Definitions are cached per content version, so problem data is only compiled again when it changes, or when
+    files of images considered for inlining change.
+
+    Arguments:
+        data - problem data, as stored in the block's `data` field
+        url_name - block's `url_name`, used to make zone element IDs unique within the page
+        target_img_dimensions - (width, height) of the target image; (None, None) if not known
+        image_settings - ImageSettings controlling image inlining
+        version - version of `data`, as recorded when it was saved; computed from `data` if not known
+    """
+    version = version or definition_version(data)
+    inline_key = image_settings.inline_cache_key if image_settings else None
+    key = (version, url_name, tuple(target_img_dimensions), inline_key)
+    with _CACHE_LOCK:
+        definition = _CACHE.pop(key, None)
+        if definition is not None:
+            _CACHE[key] = definition  # Most recently used definitions are kept at the end
+    if definition is not None and _sources_unchanged(definition.inline_sources):
+        return definition
+    inline_images, inline_sources = _inline_images(data, image_settings) if inline_key else ({}, ())
+    definition = CompiledDefinition(
+        version=version,
+        zones=_compile_zones(data, url_name, target_img_dimensions),
+        items=_compile_items(data),
+        inline_images=inline_images,
+        inline_sources=inline_sources,
+    )
+    with _CACHE_LOCK:
+        while len(_CACHE) >= CACHE_SIZE:
+            _CACHE.popitem(last=False)
+        _CACHE[key] = definition
+    return definition
+
+
+def zone_element_id(url_name, zone_uid):
+    """
+    Returns DOM element ID for zone, unique within the page and not containing spaces etc.
+    """
+    return u'{}-{}'.format(url_name, UNSAFE_ID_CHARS_RE.sub('_', u'{}'.format(zone_uid)))
+
+
+def _compile_zones(data, url_name, target_img_dimensions):
+    """
+    Migrates zones to the current format and converts pixel geometry to percentages of the target image size.
+
+    Geometry of zones is left in pixels if target image dimensions are not known; the learner view converts
+    it once the image has loaded.
+    """
+    migrator = StateMigration(None)  # Zone migrations do not depend on the block
+    width, height = target_img_dimensions
+    zones = []
+    for zone in data.get('zones', []):
+        zone = migrator.apply_zone_migrations(zone)
+        zone['prefixed_uid'] = zone_element_id(url_name, zone['uid'])
+        if width and height and 'x_percent' not in zone:
+            try:
+                geometry = {
+                    'x_percent': _percent(zone['x'], width),
+                    'y_percent': _percent(zone['y'], height),
+                    'width_percent': _percent(zone['width'], width),
+                    'height_percent': _percent(zone['height'], height),
+                }
+            except (KeyError, TypeError, ValueError):
+                pass
+            else:
+                for attribute in ('x', 'y', 'width', 'height'):
+                    del zone[attribute]
+                zone.update(geometry)
+        zones.append(zone)
+    return zones
+
+
+def _percent(pixels, total):
+    """
+    Converts `pixels` (a number, or a string containing one) to a percentage of `total`.
+    """
+    return round(float(pixels) / total * 100, GEOMETRY_PRECISION)
+
+
+def _compile_items(data):
+    """
+    Removes feedback and answers from items.
+    """
+    items = copy.deepcopy(data.get('items', []))
+    for item in items:
+        del item['feedback']
+        # Use item.pop to remove both `item['zone']` and `item['zones']`; we don't have
+        # a guarantee that either will be present, so we can't use `del`. Legacy instances
+        # will have `item['zone']`, while current versions will have `item['zones']`.
+        item.pop('zone', None)
+        item.pop('zones', None)
+    return items
+
+
+def _sources_unchanged(sources):
+    """
+    Checks if files listed in `sources` as (path, signature) pairs still have the same signatures.
+    """
+    return all(file_signature(path) == signature for path, signature in sources)
+
+
+def _inline_images(data, image_settings):
+    """
+    Returns data URIs of small, locally available item images, keyed by image URL, and signatures of files of
+    all locally available item images as (path, signature) pairs, so that changes to the files can be detected.
+
+    Images are inlined in item order, as long as the total length of data URIs stays within the budget. A data URI
+    is sent with each item showing the image, so images shared by several items are charged for each of them.
+    """
+    occurrences = OrderedDict()
+    for item in data.get('items', []):
+        # Fall back on "backgroundImage" to be backward-compatible.
+        image_url = item.get('imageURL') or item.get('backgroundImage')
+        if image_url:
+            occurrences[image_url] = occurrences.get(image_url, 0) + 1
+    inline_images = {}
+    sources = []
+    remaining_budget = image_settings.inline_budget
+    for image_url, count in occurrences.iteritems():
+        path = image_settings.resolve(image_url)
+        if not path:
+            continue
+        # Signature is taken before reading the file, so that changes made while it is read are detected later
+        sources.append((path, file_signature(path)))
+        data_uri = inline_image(path, image_settings.inline_max_bytes)
+        if data_uri and len(data_uri) * count <= remaining_budget:
+            inline_images[image_url] = data_uri
+            remaining_budget -= len(data_uri) * count
+    return inline_images, tuple(sources)
@@ -7,7 +7,6 @@
 import copy
 import json
 import logging
-import urllib
 import webob
 
 from xblock.core import XBlock
@@ -18,7 +17,11 @@ from xblockutils.resources import ResourceLoader
 from xblockutils.settings import XBlockWithSettingsMixin, ThemableXBlockMixin
 
 from .utils import _, DummyTranslationService, FeedbackMessage, FeedbackMessages, ItemStats, StateMigration, Constants
-from .default_data import DEFAULT_DATA
+from .default_data import DEFAULT_DATA, DEFAULT_TARGET_IMG_HEIGHT, DEFAULT_TARGET_IMG_WIDTH
+from .grade_publishing import GradePublishingMixin
+from .image_metadata import ImageMetadataMixin
+from .instrumentation import NULL_TIMER, instrumented, timed
+from .tracking import TrackingEventsMixin
 
 
 # Globals ###########################################################
@@ -31,7 +34,10 @@ logger = logging.getLogger(__name__)
 
 @XBlock.wants('settings')
 @XBlock.needs('i18n')
-class DragAndDropBlock(XBlock, XBlockWithSettingsMixin, ThemableXBlockMixin):
+class DragAndDropBlock(
+        XBlock, XBlockWithSettingsMixin, ThemableXBlockMixin,
+        GradePublishingMixin, ImageMetadataMixin, TrackingEventsMixin
+):
     """
     XBlock that implements a friendly Drag-and-Drop problem
     """
@@ -172,24 +178,30 @@ class DragAndDropBlock(XBlock, XBlockWithSettingsMixin, ThemableXBlockMixin):
     block_settings_key = 'drag-and-drop-v2'
     has_score = True
 
+    # Collects handler phase timings; replaced by actual timer in instrumented handlers if instrumentation is enabled
+    timer = NULL_TIMER
+
+    @instrumented('student_view')
     @XBlock.supports("multi_device")  # Enable this block for use in the mobile app via webview
     def student_view(self, context):
         """
         Player view, displayed to the student
         """
+        # Only needed to render views - not imported on worker startup, as most requests are handler calls
+        from .assets import get_student_view_assets
+        from .images import ImageSettings, preload_hints
+        from .template_cache import TEMPLATE_CACHE
+
+        xblock_settings = self.get_xblock_settings(default={})
+        configuration = self.get_configuration()
 
         fragment = Fragment()
-        fragment.add_content(loader.render_template('/templates/html/drag_and_drop.html'))
-        css_urls = (
-            'public/css/vendor/jquery-ui-1.10.4.custom.min.css',
-            'public/css/drag_and_drop.css'
-        )
-        js_urls = (
-            'public/js/vendor/jquery-ui-1.10.4.custom.min.js',
-            'public/js/vendor/jquery-ui-touch-punch-0.2.3.min.js',  # Makes it work on touch devices
-            'public/js/vendor/virtual-dom-1.3.0.min.js',
-            'public/js/drag_and_drop.js',
-        )
+        fragment.add_content(TEMPLATE_CACHE.render_static('/templates/html/drag_and_drop.html'))
+        # Let browsers start downloading images before the scripts that display them have run
+        image_settings = ImageSettings(xblock_settings)
+        for hint in preload_hints(configuration, image_settings.preload_items):
+            fragment.add_resource(hint, 'text/html', placement='head')
+        css_urls, js_urls = get_student_view_assets(loader, xblock_settings)
         for css_url in css_urls:
             fragment.add_css_url(self.runtime.local_resource_url(self, css_url))
         for js_url in js_urls:
@@ -197,7 +209,7 @@ class DragAndDropBlock(XBlock, XBlockWithSettingsMixin, ThemableXBlockMixin):
 
         self.include_theme_files(fragment)
 
-        fragment.initialize_js('DragAndDropBlock', self.get_configuration())
+        fragment.initialize_js('DragAndDropBlock', configuration)
 
         return fragment
 
@@ -208,42 +220,64 @@ class DragAndDropBlock(XBlock, XBlockWithSettingsMixin, ThemableXBlockMixin):
         and feedback.
         """
 
-        def items_without_answers():
+        from .definition import compile_definition  # Not imported on worker startup
+
+        url_name = getattr(self, 'url_name', '')  # SDK doesn't supply url_name.
+        target_img_width, target_img_height = self.target_img_dimensions
+        image_settings = self.get_image_settings()
+        definition = compile_definition(
+            self.data, url_name, (target_img_width, target_img_height), image_settings, version=self.data_version
+        )
+        # Variants and sprite sheets recorded when the problem was saved are only used while still configured
+        image_metadata = self.get_image_metadata(definition.version) if image_settings.variants_configured else {}
+        sprite = self.get_item_sprite(definition.version) if image_settings.sprites_configured else None
+
+        def image_variants(url):
             """
-            Removes feedback and answer from items
+            Returns downscaled variants of image at `url`; empty if there are none.
             """
-            items = copy.deepcopy(self.data.get('items', ''))
-            for item in items:
-                del item['feedback']
-                # Use item.pop to remove both `item['zone']` and `item['zones']`; we don't have
-                # a guarantee that either will be present, so we can't use `del`. Legacy instances
-                # will have `item['zone']`, while current versions will have `item['zones']`.
-                item.pop('zone', None)
-                item.pop('zones', None)
+            return image_metadata.get(url, {}).get('variants', [])
+
+        def items_with_expanded_urls():
+            """
+            Adds expanded image URLs to items; URL expansion depends on the runtime, so it is not cached.
+            Inlined images are given as data URIs instead; images packed into the sprite sheet get their
+            region of the sheet.
+            """
+            items = []
+            for item in definition.items:
                 # Fall back on "backgroundImage" to be backward-compatible.
                 image_url = item.get('imageURL') or item.get('backgroundImage')
-                if image_url:
-                    item['expandedImageURL'] = self._expand_static_url(image_url)
-                else:
-                    item['expandedImageURL'] = ''
+                sprite_region = sprite['regions'].get(image_url) if sprite else None
+                inline_url = None if sprite_region else definition.inline_images.get(image_url)
+                expanded_url = inline_url or (self._expand_static_url(image_url) if image_url else '')
+                item = dict(item, expandedImageURL=expanded_url)
+                if sprite_region:
+                    item['spriteRegion'] = sprite_region
+                elif image_url and not inline_url and image_variants(image_url):
+                    item['expandedImageVariants'] = image_variants(image_url)
+                items.append(item)
             return items
 
         return {
             "mode": self.mode,
-            "zones": self.zones,
+            "zones": definition.zones,
             "max_attempts": self.max_attempts,
             "max_items_per_zone": self.max_items_per_zone,
-            # SDK doesn't supply url_name.
-            "url_name": getattr(self, 'url_name', ''),
+            "url_name": url_name,
             "display_zone_labels": self.data.get('displayLabels', False),
             "display_zone_borders": self.data.get('displayBorders', False),
-            "items": items_without_answers(),
+            "items": items_with_expanded_urls(),
             "title": self.display_name,
             "show_title": self.show_title,
             "problem_text": self.question_text,
             "show_problem_header": self.show_question_header,
             "target_img_expanded_url": self.target_img_expanded_url,
             "target_img_description": self.target_img_description,
+            "target_img_width": target_img_width,
+            "target_img_height": target_img_height,
+            "target_img_variants": image_variants(self.data.get("targetImg")),
+            "item_sprite": {key: sprite[key] for key in ('url', 'width', 'height')} if sprite else None,
             "item_background_color": self.item_background_color or None,
             "item_text_color": self.item_text_color or None,
             # final feedback (data.feedback.finish) is not included - it may give away answers.
@@ -253,8 +287,9 @@ class DragAndDropBlock(XBlock, XBlockWithSettingsMixin, ThemableXBlockMixin):
         """
         Editing view in Studio
         """
+        from .template_cache import TEMPLATE_CACHE  # Only needed to render views - not imported on startup
 
-        js_templates = loader.load_unicode('/templates/html/js_templates.html')
+        js_templates = TEMPLATE_CACHE.load_unicode('/templates/html/js_templates.html')
         # Get a 'html_id' string that is unique for this block.
         # We append it to HTML element ID attributes to ensure multiple instances of the DnDv2 block
         # on the same page don't share the same ID value.
@@ -267,11 +302,10 @@ class DragAndDropBlock(XBlock, XBlockWithSettingsMixin, ThemableXBlockMixin):
             'id_suffix': id_suffix,
             'fields': self.fields,
             'self': self,
-            'data': urllib.quote(json.dumps(self.data)),
         }
 
         fragment = Fragment()
-        fragment.add_content(loader.render_template('/templates/html/drag_and_drop_edit.html', context))
+        fragment.add_content(TEMPLATE_CACHE.render('/templates/html/drag_and_drop_edit.html', context))
 
         css_urls = (
             'public/css/vendor/jquery-ui-1.10.4.custom.min.css',
@@ -323,11 +357,16 @@ class DragAndDropBlock(XBlock, XBlockWithSettingsMixin, ThemableXBlockMixin):
         self.item_background_color = submissions['item_background_color']
         self.item_text_color = submissions['item_text_color']
         self.max_items_per_zone = self._get_max_items_per_zone(submissions)
-        self.data = submissions['data']
+        data = submissions['data']
+        warnings = self._probe_images(data)
+        self.data = data
 
-        return {
+        response = {
             'result': 'success',
         }
+        if warnings:
+            response['warnings'] = warnings
+        return response
 
     @staticmethod
     def _get_max_items_per_zone(submissions):
@@ -362,6 +401,7 @@ class DragAndDropBlock(XBlock, XBlockWithSettingsMixin, ThemableXBlockMixin):
         except (ValueError, TypeError):
             return None
 
+    @instrumented('drop_item')
     @XBlock.json_handler
     def drop_item(self, item_attempt, suffix=''):
         """
@@ -370,15 +410,16 @@ class DragAndDropBlock(XBlock, XBlockWithSettingsMixin, ThemableXBlockMixin):
         self._validate_drop_item(item_attempt)
 
         if self.mode == Constants.ASSESSMENT_MODE:
-            return self._drop_item_assessment(item_attempt)
+            return self._json_response(self._drop_item_assessment(item_attempt))
         elif self.mode == Constants.STANDARD_MODE:
-            return self._drop_item_standard(item_attempt)
+            return self._json_response(self._drop_item_standard(item_attempt))
         else:
             raise JsonHandlerError(
                 500,
                 self.i18n_service.gettext("Unknown DnDv2 mode {mode} - course is misconfigured").format(self.mode)
             )
 
+    @instrumented('do_attempt')
     @XBlock.json_handler
     def do_attempt(self, data, suffix=''):
         """
@@ -410,13 +451,22 @@ class DragAndDropBlock(XBlock, XBlockWithSettingsMixin, ThemableXBlockMixin):
 
         feedback_msgs = [FeedbackMessage(item['feedback']['incorrect'], None) for item in misplaced_items]
 
-        return {
+        return self._json_response({
             'correct': correct,
             'attempts': self.attempts,
             'misplaced_items': list(misplaced_ids),
             'feedback': self._present_feedback(feedback_msgs),
             'overall_feedback': self._present_feedback(overall_feedback_msgs)
-        }
+        })
+
+    def _json_response(self, data):
+        """
+        Returns JSON response with `data`, as `XBlock.json_handler` would, attributing encoding time to
+        serialization phase of instrumented handlers.
+        """
+        with self.timer.phase('serialization'):
+            body = json.dumps(data)
+        return webob.Response(body=body, content_type='application/json', charset='utf8')
 
     @XBlock.json_handler
     def publish_event(self, data, suffix=''):
@@ -428,7 +478,7 @@ class DragAndDropBlock(XBlock, XBlockWithSettingsMixin, ThemableXBlockMixin):
         except KeyError:
             return {'result': 'error', 'message': 'Missing event_type in JSON data'}
 
-        self.runtime.publish(self, event_type, data)
+        self._publish_tracking_event(event_type, data)
         return {'result': 'success'}
 
     @XBlock.json_handler
@@ -483,6 +533,19 @@ class DragAndDropBlock(XBlock, XBlockWithSettingsMixin, ThemableXBlockMixin):
         else:
             return self.default_background_image_url
 
+    @property
+    def target_img_dimensions(self):
+        """
+        Get the (width, height) of the target image in pixels, or (None, None) if they are not known.
+        Dimensions of custom images are recorded by the editor when the block is saved.
+        """
+        if not self.data.get("targetImg"):
+            return DEFAULT_TARGET_IMG_WIDTH, DEFAULT_TARGET_IMG_HEIGHT
+        width, height = self.data.get("targetImgWidth"), self.data.get("targetImgHeight")
+        if all(isinstance(value, int) and value > 0 for value in (width, height)):
+            return width, height
+        return None, None
+
     @property
     def target_img_description(self):
         """ Get the description for the target image (the image items are dragged onto). """
@@ -500,13 +563,17 @@ class DragAndDropBlock(XBlock, XBlockWithSettingsMixin, ThemableXBlockMixin):
         """
         return self.max_attempts is None or self.max_attempts == 0 or self.attempts < self.max_attempts
 
+    @instrumented('get_user_state')
     @XBlock.handler
     def get_user_state(self, request, suffix=''):
         """ GET all user-specific data, and any applicable feedback """
         data = self._get_user_state()
 
-        return webob.Response(body=json.dumps(data), content_type='application/json')
+        with self.timer.phase('serialization'):
+            body = json.dumps(data)
+        return webob.Response(body=body, content_type='application/json')
 
+    @timed('validation')
     def _validate_do_attempt(self):
         """
         Validates if `do_attempt` handler should be executed
@@ -522,6 +589,7 @@ class DragAndDropBlock(XBlock, XBlockWithSettingsMixin, ThemableXBlockMixin):
                 self.i18n_service.gettext("Max number of attempts reached")
             )
 
+    @timed('feedback')
     def _get_feedback(self, include_item_feedback=False):
         """
         Builds overall feedback for both standard and assessment modes
@@ -630,6 +698,7 @@ class DragAndDropBlock(XBlock, XBlockWithSettingsMixin, ThemableXBlockMixin):
 
         return {}
 
+    @timed('validation')
     def _validate_drop_item(self, item):
         """
         Validates `drop_item` parameters
@@ -669,22 +738,11 @@ class DragAndDropBlock(XBlock, XBlockWithSettingsMixin, ThemableXBlockMixin):
         grade = self._get_grade()
         # ... and from higher grade to lower
         if grade > self.grade:
+            if self.published_grade is None:
+                # Before grade publishing policies were introduced, every grade increase was published
+                self.published_grade = self.grade
             self.grade = grade
-            self._publish_grade()
-
-    def _publish_grade(self):
-        """
-        Publishes grade
-        """
-        try:
-            self.runtime.publish(self, 'grade', {
-                'value': self.grade,
-                'max_value': self.weight,
-            })
-        except NotImplementedError:
-            # Note, this publish method is unimplemented in Studio runtimes,
-            # so we have to figure that we're running in Studio for now
-            pass
+        self._publish_grade_if_due()
 
     def _publish_item_dropped_event(self, attempt, is_correct):
         """
@@ -698,7 +756,7 @@ class DragAndDropBlock(XBlock, XBlockWithSettingsMixin, ThemableXBlockMixin):
         if not item_label:
             item_label = item.get("imageURL")
 
-        self.runtime.publish(self, 'edx.drag_and_drop_v2.item.dropped', {
+        self._publish_tracking_event('edx.drag_and_drop_v2.item.dropped', {
             'item': item_label,
             'item_id': item['id'],
             'location': zone.get("title"),
@@ -790,8 +848,12 @@ class DragAndDropBlock(XBlock, XBlockWithSettingsMixin, ThemableXBlockMixin):
         state = {}
         migrator = StateMigration(self)
 
-        for item_id, item in self.item_state.iteritems():
-            state[item_id] = migrator.apply_item_state_migrations(item_id, item)
+        with self.timer.phase('state_load'):
+            item_state = self.item_state
+
+        with self.timer.phase('migration'):
+            for item_id, item in item_state.iteritems():
+                state[item_id] = migrator.apply_item_state_migrations(item_id, item)
 
         return state
 
@@ -820,6 +882,7 @@ class DragAndDropBlock(XBlock, XBlockWithSettingsMixin, ThemableXBlockMixin):
             return []
 
     @property
+    @timed('migration')
     def zones(self):
         """
         Get drop zone data, defined by the author.
@@ -848,6 +911,7 @@ class DragAndDropBlock(XBlock, XBlockWithSettingsMixin, ThemableXBlockMixin):
 
         return correct_count, total_count
 
+    @timed('stats')
     def _get_item_raw_stats(self):
         """
         Returns a named tuple containing required, decoy, placed, correctly
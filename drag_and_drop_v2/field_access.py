@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+""" Drag and Drop v2 XBlock - Field access accounting """
+import json
+from collections import defaultdict
+
+from xblock.field_data import FieldData
+
+
+class FieldAccessRecorder(FieldData):
+    """
+    FieldData wrapper counting reads and writes, and their serialized sizes, per scope and field.
+
+    Blocks are built around the recorder like around any other field data, i.e. in tests:
+
+        recorder = FieldAccessRecorder(KvsFieldData(key_value_store))
+        block = DragAndDropBlock(runtime, recorder, scope_ids=scope_ids)
+
+    Handlers called via `runtime.handle` are followed by saving the block, so both reads and writes they cause are
+    counted. To count accesses of a single handler call, build a new block and recorder for it, as the runtime
+    would for each request.
+
+    Only accesses reaching the wrapped field data are counted - XBlock caches field values, so repeated reads of
+    the same field by the same block instance and unchanged fields are not counted, just like they don't reach the
+    store.
+    """
+    def __init__(self, field_data):
+        super(FieldAccessRecorder, self).__init__()
+        self._field_data = field_data
+        self._counts = defaultdict(lambda: {'reads': 0, 'writes': 0, 'read_bytes': 0, 'write_bytes': 0})
+
+    @staticmethod
+    def _size(value):
+        """ Returns size of JSON-serialized `value` """
+        try:
+            return len(json.dumps(value))
+        except (TypeError, ValueError):
+            return 0
+
+    @staticmethod
+    def _scope_name(block, name):
+        """ Returns name of the scope of field `name` """
+        field = block.fields.get(name)
+        return field.scope.name if field is not None else 'unknown'
+
+    def _record(self, block, name, access, value=None):
+        """ Records single field access """
+        counts = self._counts[(self._scope_name(block, name), name)]
+        counts[access + 's'] += 1
+        if value is not None:
+            counts[access + '_bytes'] += self._size(value)
+
+    def get(self, block, name):
+        value = None
+        try:
+            value = self._field_data.get(block, name)
+            return value
+        finally:
+            self._record(block, name, 'read', value)
+
+    def set(self, block, name, value):
+        self._record(block, name, 'write', value)
+        self._field_data.set(block, name, value)
+
+    def set_many(self, block, update_dict):
+        for name, value in update_dict.iteritems():
+            self._record(block, name, 'write', value)
+        self._field_data.set_many(block, update_dict)
+
+    def delete(self, block, name):
+        self._record(block, name, 'write')
+        self._field_data.delete(block, name)
+
+    def has(self, block, name):
+        self._record(block, name, 'read')
+        return self._field_data.has(block, name)
+
+    def default(self, block, name):
+        return self._field_data.default(block, name)
+
+    def summary(self):
+        """
+        Returns recorded counts as {scope name: {field name: {reads, writes, read_bytes, write_bytes}}}
+        """
+        summary = defaultdict(dict)
+        for (scope_name, name), counts in self._counts.iteritems():
+            summary[scope_name][name] = dict(counts)
+        return dict(summary)
+
+    def totals(self):
+        """
+        Returns total number of reads and writes, and their serialized sizes
+        """
+        totals = {'reads': 0, 'writes': 0, 'read_bytes': 0, 'write_bytes': 0}
+        for counts in self._counts.itervalues():
+            for key, value in counts.iteritems():
+                totals[key] += value
+        return totals
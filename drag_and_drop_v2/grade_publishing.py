@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+""" Drag and Drop v2 XBlock - grade publishing """
+import time
+
+from xblock.core import XBlockMixin
+from xblock.fields import Float, Scope
+
+from .instrumentation import timed
+from .utils import _, Constants, GradePublishingPolicy
+
+
+class GradePublishingMixin(XBlockMixin):
+    """
+    Publishes grades subject to grade publishing policy. Used by DragAndDropBlock, which provides the `mode`, `grade`,
+    `weight` and `completed` fields and block settings.
+    """
+
+    published_grade = Float(
+        help=_("Last score published to the LMS; lower than maximum score achieved if publishing is deferred"),
+        scope=Scope.user_state,
+        default=None
+    )
+
+    grade_published_at = Float(
+        help=_("Time when the score was last published to the LMS, in seconds since the epoch"),
+        scope=Scope.user_state,
+        default=None
+    )
+
+    @timed('publish')
+    def _publish_grade_if_due(self):
+        """
+        Publishes grade if it is higher than last published grade and grade publishing policy allows it.
+        Called by every item drop and attempt, so that a grade deferred by an earlier call is published as soon as
+        it is due, even if the grade did not change since.
+
+        Grade publishing policies only apply to standard mode; in assessment mode grade is published after each
+        attempt that improves it.
+        """
+        published_grade = self.published_grade if self.published_grade is not None else self.grade
+        if self.grade <= published_grade:
+            return
+
+        if self.mode == Constants.STANDARD_MODE:
+            policy = GradePublishingPolicy(self.get_xblock_settings(default={}))
+        else:
+            policy = GradePublishingPolicy({})
+
+        if self.grade_published_at is not None:
+            seconds_since_publish = time.time() - self.grade_published_at
+        else:
+            seconds_since_publish = None
+
+        if policy.is_publish_due(self.grade, published_grade, self.weight, self.completed, seconds_since_publish):
+            self._publish_grade()
+
+    def _publish_grade(self):
+        """
+        Publishes grade
+        """
+        try:
+            self.runtime.publish(self, 'grade', {
+                'value': self.grade,
+                'max_value': self.weight,
+            })
+            self.published_grade = self.grade
+            self.grade_published_at = time.time()
+        except NotImplementedError:
+            # Note, this publish method is unimplemented in Studio runtimes,
+            # so we have to figure that we're running in Studio for now
+            pass
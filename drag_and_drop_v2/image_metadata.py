@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+""" Drag and Drop v2 XBlock - metadata of images used by the problem """
+from xblock.core import XBlockMixin
+from xblock.fields import Dict, Scope
+
+from .utils import _
+
+
+class ImageMetadataMixin(XBlockMixin):
+    """
+    Records metadata of images used by the problem when it is saved. Used by DragAndDropBlock, which provides the
+    `data` field, block settings and translations.
+    """
+
+    image_metadata = Dict(
+        help=_(
+            "Format, dimensions and size of images used by the problem, recorded when the problem is saved, "
+            "along with the version of problem data they were recorded for."
+        ),
+        scope=Scope.content,
+        default={},
+    )
+
+    def get_image_settings(self):
+        """
+        Returns ImageSettings configured by block settings
+        """
+        from .images import ImageSettings  # Not imported on worker startup
+        return ImageSettings(
+            self.get_xblock_settings(default={}), resource_url_prefix=self.runtime.local_resource_url(self, 'public/')
+        )
+
+    def _probe_images(self, data):
+        """
+        Records format, dimensions and size of locally available images used by problem `data`.
+
+        Image dimensions are also stored in `data`, where the learner view uses them for layout.
+        Returns warnings about images that are too large.
+        """
+        from .images import probe_image  # Only needed when the problem is saved
+
+        image_settings = self.get_image_settings()
+        images = {}
+        paths = {}
+        variants = {}
+
+        def probe(url):
+            """ Probes image at `url`, at most once per URL """
+            if url not in images:
+                path = paths[url] = image_settings.resolve(url)
+                images[url] = probe_image(path) if path else None
+                if images[url]:
+                    variants[url] = image_settings.generate_variants(path, images[url])
+            return images[url]
+
+        if data.get('targetImg'):
+            info = probe(data['targetImg'])
+            if info:
+                data['targetImgWidth'], data['targetImgHeight'] = info.width, info.height
+        sprite_images = []
+        for item in data.get('items', []):
+            # Fall back on "backgroundImage" to be backward-compatible.
+            image_url = item.get('imageURL') or item.get('backgroundImage')
+            info = probe(image_url) if image_url else None
+            if info:
+                item['imageWidth'], item['imageHeight'] = info.width, info.height
+                if sprite_images is not None:
+                    sprite_images.append((image_url, paths[image_url], info))
+            else:
+                sprite_images = None  # Items without images can't be rendered from a sprite sheet
+
+        metadata = {url: dict(info._asdict(), variants=variants[url]) for url, info in images.iteritems() if info}
+        self.image_metadata = {
+            'version': self._definition_version(data),
+            'images': metadata,
+            'sprite': image_settings.generate_sprite(sprite_images),
+        }
+
+        warning_template = self.i18n_service.gettext(
+            "Image {url} is {width}x{height} pixels and {size} KB. Images larger than {max_dimension} pixels "
+            "or {max_size} KB slow down loading the problem for learners."
+        )
+        return [
+            warning_template.format(
+                url=url, width=info.width, height=info.height, size=info.bytes // 1024,
+                max_dimension=image_settings.max_dimension, max_size=image_settings.max_bytes // 1024,
+            )
+            for url, info in sorted(images.iteritems()) if info and image_settings.oversized(info)
+        ]
+
+    def get_image_metadata(self, version=None):
+        """
+        Returns metadata of images used by the problem, keyed by image URL as it appears in problem data.
+        Metadata recorded for a different version of problem data (i.e. imported or edited outside Studio)
+        is ignored.
+
+        Arguments:
+            version - version of current problem data, if already known
+        """
+        return self._current_image_metadata(version).get('images', {})
+
+    def get_item_sprite(self, version=None):
+        """
+        Returns the sprite sheet holding all item images, as produced by ImageSettings.generate_sprite;
+        None if the problem has no sprite sheet.
+
+        Arguments:
+            version - version of current problem data, if already known
+        """
+        return self._current_image_metadata(version).get('sprite')
+
+    @property
+    def data_version(self):
+        """
+        Returns version of problem data, as recorded when the problem was saved in Studio, so that it is not
+        computed on every view. Computed from problem data for problems saved before versions were recorded.
+
+        Problem data changed outside Studio keeps the recorded version, along with the recorded image metadata,
+        until the problem is saved in Studio again.
+        """
+        return self.image_metadata.get('version') or self._definition_version(self.data)
+
+    @staticmethod
+    def _definition_version(data):
+        """ Returns version of problem `data` """
+        from .definition import definition_version  # Not imported on worker startup
+        return definition_version(data)
+
+    def _current_image_metadata(self, version):
+        """
+        Returns image metadata if it was recorded for the current version of problem data.
+        """
+        if self.image_metadata.get('version') != (version or self._definition_version(self.data)):
+            return {}
+        return self.image_metadata
@@ -0,0 +1,428 @@
+# -*- coding: utf-8 -*-
+""" Drag and Drop v2 XBlock - image probing """
+import base64
+import cgi
+import hashlib
+import logging
+import math
+import os
+import struct
+import urlparse
+from collections import namedtuple
+
+from .utils import parse_positive
+
+
+logger = logging.getLogger(__name__)
+
+ImageInfo = namedtuple('ImageInfo', ["format", "width", "height", "bytes"])  # pylint: disable=invalid-name
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+PUBLIC_DIR = os.path.join(PACKAGE_DIR, 'public')
+
+PNG_SIGNATURE = '\x89PNG\r\n\x1a\n'
+GIF_SIGNATURES = ('GIF87a', 'GIF89a')
+JPEG_SOI = '\xff\xd8'
+# JPEG start-of-frame markers, which hold image dimensions: SOF0-SOF15, except DHT, JPG and DAC
+JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - frozenset((0xC4, 0xC8, 0xCC))
+# JPEG markers without a length field
+JPEG_STANDALONE_MARKERS = frozenset(range(0xD0, 0xDA)) | frozenset((0x01,))
+
+
+class ImageSettings(object):
+    """
+    Image probing settings.
+
+    Configured via the settings service, under the `images` key of the block settings bucket, e.g.:
+
+        "drag-and-drop-v2": {
+            "images": {
+                "asset_root": "/edx/var/course_assets", "max_bytes": 512000, "max_dimension": 2000,
+                "variants": {"directory": "/edx/var/dnd_variants", "url": "/media/dnd_variants/", "widths": [480]},
+                "inline": {"max_bytes": 2048, "budget": 32768},
+                "sprites": {"max_bytes": 16384},
+                "preload_items": 4
+            }
+        }
+
+    Settings:
+        * asset_root - local directory holding files of course assets; `/static/<name>` URLs are looked up
+          in it. If not set, only images shipped with this package can be probed.
+        * max_bytes - images larger than this many bytes are reported as oversized (default 1MB)
+        * max_dimension - images wider or taller than this many pixels are reported as oversized (default 2400)
+        * variants - if set, and Pillow is installed, downscaled variants of PNG and JPEG images are saved to
+          `directory`, which is served at `url`; one variant is made for each of `widths` smaller than the image
+          (default 480, 960 and 1440 pixels)
+        * inline - if set, item images of up to `max_bytes` bytes (default 2KB) are embedded in the learner
+          view configuration as data URIs, until their total length reaches `budget` (default 32KB)
+        * sprites - if set, and variants are enabled, images of problems where every item shows an image of up to
+          `max_bytes` bytes (default 16KB) are packed into a sprite sheet, saved along with the variants
+        * preload_items - number of item images the learner view asks browsers to preload, in addition to the
+          target image (default 0)
+    """
+    SETTINGS_KEY = "images"
+    DEFAULT_MAX_BYTES = 1024 * 1024
+    DEFAULT_MAX_DIMENSION = 2400
+    DEFAULT_VARIANT_WIDTHS = (480, 960, 1440)
+    VARIANT_FORMATS = {'png': 'PNG', 'jpeg': 'JPEG'}
+    DEFAULT_INLINE_MAX_BYTES = 2048
+    DEFAULT_INLINE_BUDGET = 32 * 1024
+    DEFAULT_SPRITE_MAX_BYTES = 16 * 1024
+    # Gap between images in sprite sheets, so that neighbouring images don't bleed into scaled ones
+    SPRITE_PADDING = 2
+    STATIC_PREFIX = '/static/'
+
+    def __init__(self, xblock_settings, resource_url_prefix=None):
+        """
+        Arguments:
+            xblock_settings - settings of the block
+            resource_url_prefix - URL of the `public/` directory of this package, as produced by
+                `runtime.local_resource_url(block, 'public/')`; if not given, only relative `public/...` URLs of
+                package images are resolved
+        """
+        config = (xblock_settings or {}).get(self.SETTINGS_KEY) or {}
+        self.resource_url_prefix = resource_url_prefix
+        self.asset_root = config.get('asset_root')
+        self.max_bytes = parse_positive(config.get('max_bytes'), int, self.DEFAULT_MAX_BYTES)
+        self.max_dimension = parse_positive(config.get('max_dimension'), int, self.DEFAULT_MAX_DIMENSION)
+        variants_config = config.get('variants') or {}
+        self.variants_directory = variants_config.get('directory')
+        self.variants_url = variants_config.get('url')
+        widths = [parse_positive(width, int, None) for width in variants_config.get('widths') or []]
+        self.variant_widths = sorted(set(width for width in widths if width)) or list(self.DEFAULT_VARIANT_WIDTHS)
+        inline_config = config.get('inline')
+        self.inline_enabled = bool(inline_config)
+        if not isinstance(inline_config, dict):
+            inline_config = {}
+        self.inline_max_bytes = parse_positive(inline_config.get('max_bytes'), int, self.DEFAULT_INLINE_MAX_BYTES)
+        self.inline_budget = parse_positive(inline_config.get('budget'), int, self.DEFAULT_INLINE_BUDGET)
+        sprites_config = config.get('sprites')
+        self.sprites_requested = bool(sprites_config)
+        if not isinstance(sprites_config, dict):
+            sprites_config = {}
+        self.sprite_max_bytes = parse_positive(sprites_config.get('max_bytes'), int, self.DEFAULT_SPRITE_MAX_BYTES)
+        self.preload_items = parse_positive(config.get('preload_items'), int, 0)
+
+    @property
+    def inline_cache_key(self):
+        """
+        Returns a value identifying settings that affect which images are inlined; None if inlining is disabled.
+        """
+        if not self.inline_enabled:
+            return None
+        return (self.asset_root, self.resource_url_prefix, self.inline_max_bytes, self.inline_budget)
+
+    def resolve(self, url):
+        """
+        Returns path to the local file behind image `url`, or None if the image is not available locally.
+
+        Images shipped with this package are resolved from relative `public/...` URLs and from URLs starting with
+        `resource_url_prefix`. Other URLs are only resolved if they are relative `/static/<name>` course asset URLs,
+        which are looked up in `asset_root`, if configured.
+        """
+        if self.resource_url_prefix and url.startswith(self.resource_url_prefix):
+            return self._file_within(PUBLIC_DIR, urlparse.urlparse(url[len(self.resource_url_prefix):]).path)
+        parsed_url = urlparse.urlparse(url)
+        if parsed_url.scheme or parsed_url.netloc:
+            return None
+        path = parsed_url.path
+        if path.startswith(self.STATIC_PREFIX) and self.asset_root:
+            return self._file_within(self.asset_root, path[len(self.STATIC_PREFIX):])
+        if path.startswith('public/'):
+            return self._file_within(PUBLIC_DIR, path[len('public/'):])
+        return None
+
+    @staticmethod
+    def _file_within(root, relative_path):
+        """
+        Returns path of existing file `relative_path` inside `root` directory, or None.
+        """
+        root = os.path.abspath(root)
+        path = os.path.abspath(os.path.join(root, relative_path))
+        if not path.startswith(root + os.sep) or not os.path.isfile(path):
+            return None
+        return path
+
+    def oversized(self, info):
+        """
+        Checks if image described by `info` is larger than allowed by the settings.
+        """
+        return info.bytes > self.max_bytes or max(info.width, info.height) > self.max_dimension
+
+    @property
+    def variants_configured(self):
+        """
+        Checks if downscaled image variants are configured; they may still be unavailable if Pillow is not installed.
+        """
+        return bool(self.variants_directory and self.variants_url)
+
+    @property
+    def variants_enabled(self):
+        """
+        Checks if downscaled image variants should be generated.
+        """
+        return bool(self.variants_configured and load_pillow())
+
+    def generate_variants(self, path, info):
+        """
+        Saves downscaled variants of image at `path`, described by `info`, unless they already exist.
+
+        Variant file names include a hash of the image content, so images with the same content share variants.
+        Returns a list of {"url": ..., "width": ...} dicts, ordered by width.
+        """
+        if not self.variants_enabled or info.format not in self.VARIANT_FORMATS:
+            return []
+        widths = [width for width in self.variant_widths if width < info.width]
+        if not widths:
+            return []
+        variants = []
+        pil_image = load_pillow()
+        try:
+            with open(path, 'rb') as image_file:
+                digest = hashlib.sha1(image_file.read()).hexdigest()[:12]
+            image = None
+            for width in widths:
+                name = '{}-{}w.{}'.format(digest, width, 'jpg' if info.format == 'jpeg' else info.format)
+                variant_path = os.path.join(self.variants_directory, name)
+                if not os.path.exists(variant_path):
+                    if image is None:
+                        image = pil_image.open(path)
+                        image.load()
+                    height = max(1, int(round(float(info.height) * width / info.width)))
+                    variant = image.resize((width, height), pil_image.ANTIALIAS)
+                    variant.save(variant_path, self.VARIANT_FORMATS[info.format])
+                variants.append({'url': self.variants_url.rstrip('/') + '/' + name, 'width': width})
+        except _pillow_errors(pil_image):
+            logger.exception("Unable to generate variants of image %s", path)
+            return []
+        return variants
+
+    @property
+    def sprites_configured(self):
+        """
+        Checks if item sprite sheets are configured; they are saved along with downscaled image variants.
+        """
+        return self.sprites_requested and self.variants_configured
+
+    def generate_sprite(self, images):
+        """
+        Packs images into a PNG sprite sheet, unless it already exists.
+
+        Arguments:
+            images - list of (url, path, info) tuples, in item order; None if any item has no probed image
+
+        Returns None if sprites are disabled, there are fewer than two images or any of them is too large;
+        otherwise a {"url": ..., "width": ..., "height": ..., "regions": {url: {"x", "y", "width", "height"}}} dict.
+        """
+        if not (self.sprites_configured and self.variants_enabled) or images is None:
+            return None
+        if any(info.bytes > self.sprite_max_bytes for _url, _path, info in images):
+            return None
+        unique_images, urls = [], set()
+        for url, path, info in images:
+            if url not in urls:
+                urls.add(url)
+                unique_images.append((url, path, info))
+        if len(unique_images) < 2:
+            return None
+        regions, width, height = self._pack([(url, info) for url, _path, info in unique_images])
+        name = self._save_sprite([(path, regions[url]) for url, path, _info in unique_images], (width, height))
+        if name is None:
+            return None
+        return {
+            'url': self.variants_url.rstrip('/') + '/' + name, 'width': width, 'height': height, 'regions': regions,
+        }
+
+    def _pack(self, images):
+        """
+        Places images of the given (url, info) list on shelves of a roughly square sheet.
+        Returns regions keyed by image URL, and dimensions of the sheet.
+        """
+        padding = self.SPRITE_PADDING
+        area = sum((info.width + padding) * (info.height + padding) for _url, info in images)
+        max_row_width = max(max(info.width for _url, info in images), int(math.ceil(math.sqrt(area))))
+        regions = {}
+        left = top = row_height = width = 0
+        for url, info in images:
+            if left and left + info.width > max_row_width:
+                left, top, row_height = 0, top + row_height + padding, 0
+            regions[url] = {'x': left, 'y': top, 'width': info.width, 'height': info.height}
+            width = max(width, left + info.width)
+            row_height = max(row_height, info.height)
+            left += info.width + padding
+        return regions, width, top + row_height
+
+    def _save_sprite(self, placed_images, size):
+        """
+        Saves sprite sheet of `size` with images of the given (path, region) list, unless it already exists.
+
+        Sheet file names include a hash of the images' content, so problems using the same images share sheets.
+        Returns name of the sheet file, or None if it can't be saved.
+        """
+        pil_image = load_pillow()
+        paths = [path for path, _region in placed_images]
+        try:
+            content_hash = hashlib.sha1()
+            for path in paths:
+                with open(path, 'rb') as image_file:
+                    content_hash.update(image_file.read())
+            name = '{}-sprite.png'.format(content_hash.hexdigest()[:12])
+            sprite_path = os.path.join(self.variants_directory, name)
+            if not os.path.exists(sprite_path):
+                sprite = pil_image.new('RGBA', size, (0, 0, 0, 0))
+                for path, region in placed_images:
+                    sprite.paste(pil_image.open(path).convert('RGBA'), (region['x'], region['y']))
+                sprite.save(sprite_path, 'PNG')
+        except _pillow_errors(pil_image):
+            logger.exception("Unable to generate sprite sheet of images %s", paths)
+            return None
+        return name
+
+
+def load_pillow():
+    """
+    Returns Pillow's Image module, or None if Pillow is not installed.
+
+    Pillow is only used when problems are saved, so it is imported on first use rather than on startup.
+    """
+    try:
+        from PIL import Image  # pylint: disable=import-error
+    except ImportError:
+        return None
+    return Image
+
+
+def _pillow_errors(pil_image):
+    """
+    Returns exception classes raised when images can't be processed: besides I/O errors, Pillow raises SyntaxError
+    on some malformed images and DecompressionBombError on images with a huge number of pixels.
+    """
+    return (IOError, OSError, ValueError, SyntaxError, getattr(pil_image, 'DecompressionBombError', IOError))
+
+
+def preload_hints(configuration, max_items):
+    """
+    Returns <link rel="preload"> tags for the target image and up to `max_items` item images (or the item sprite
+    sheet) of learner view `configuration`, so that browsers download them while the scripts load.
+
+    Images with downscaled variants are not preloaded: the learner view picks a variant based on the width of
+    the block, which is only known once it is displayed. Inlined images need no download.
+    """
+    urls = []
+    if configuration['target_img_expanded_url'] and not configuration['target_img_variants']:
+        urls.append(configuration['target_img_expanded_url'])
+    item_urls = []
+    if configuration['item_sprite']:
+        item_urls.append(configuration['item_sprite']['url'])
+    for item in configuration['items']:
+        url = item['expandedImageURL']
+        if not url or url.startswith('data:') or 'spriteRegion' in item or 'expandedImageVariants' in item:
+            continue
+        if url not in item_urls:
+            item_urls.append(url)
+    urls.extend(url for url in item_urls[:max_items] if url not in urls)
+    return [u'<link rel="preload" as="image" href="{}">'.format(cgi.escape(url, quote=True)) for url in urls]
+
+
+def file_signature(path):
+    """
+    Returns (modification time, size) of file at `path`, or None if it does not exist or can't be read.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime, stat.st_size
+
+
+def inline_image(path, max_bytes):
+    """
+    Returns data URI with content of PNG, GIF or JPEG image at `path`, or None if the image is larger than
+    `max_bytes` or can't be read.
+    """
+    info = probe_image(path)
+    if info is None or info.bytes > max_bytes:
+        return None
+    try:
+        with open(path, 'rb') as image_file:
+            content = image_file.read()
+    except IOError:
+        logger.exception("Unable to inline image %s", path)
+        return None
+    return 'data:image/{};base64,{}'.format(info.format, base64.b64encode(content))
+
+
+def probe_image(path):
+    """
+    Returns ImageInfo of PNG, GIF or JPEG image at `path`, reading only its header.
+    Returns None if the file can't be read or is not an image in one of those formats.
+    """
+    try:
+        with open(path, 'rb') as image_file:
+            header = image_file.read(26)
+            if header.startswith(PNG_SIGNATURE):
+                image_format, dimensions = 'png', _png_dimensions(header)
+            elif header[:6] in GIF_SIGNATURES:
+                image_format, dimensions = 'gif', _gif_dimensions(header)
+            elif header.startswith(JPEG_SOI):
+                image_file.seek(len(JPEG_SOI))
+                image_format, dimensions = 'jpeg', _jpeg_dimensions(image_file)
+            else:
+                return None
+            size = os.fstat(image_file.fileno()).st_size
+    except (IOError, OSError):
+        logger.exception("Unable to probe image %s", path)
+        return None
+    if dimensions is None:
+        return None
+    width, height = dimensions
+    return ImageInfo(format=image_format, width=width, height=height, bytes=size)
+
+
+def _png_dimensions(header):
+    """
+    Reads dimensions from IHDR chunk, which must come first in a PNG file.
+    """
+    if len(header) < 24 or header[12:16] != 'IHDR':
+        return None
+    return struct.unpack('>II', header[16:24])
+
+
+def _gif_dimensions(header):
+    """
+    Reads dimensions from GIF logical screen descriptor.
+    """
+    if len(header) < 10:
+        return None
+    return struct.unpack('<HH', header[6:10])
+
+
+def _jpeg_dimensions(stream):
+    """
+    Reads dimensions from the first start-of-frame segment, skipping other segments without reading them.
+    """
+    while True:
+        marker = stream.read(2)
+        if len(marker) < 2 or marker[0] != '\xff':
+            return None
+        code = ord(marker[1])
+        while code == 0xFF:  # Markers may be preceded by any number of fill bytes
+            byte = stream.read(1)
+            if not byte:
+                return None
+            code = ord(byte)
+        if code in JPEG_STANDALONE_MARKERS:
+            continue
+        length_bytes = stream.read(2)
+        if len(length_bytes) < 2:
+            return None
+        length, = struct.unpack('>H', length_bytes)
+        if code in JPEG_SOF_MARKERS:
+            segment = stream.read(5)
+            if len(segment) < 5:
+                return None
+            height, width = struct.unpack('>HH', segment[1:5])
+            return width, height
+        if length < 2:
+            return None
+        stream.seek(length - 2, os.SEEK_CUR)
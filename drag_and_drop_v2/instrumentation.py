@@ -0,0 +1,389 @@
+# -*- coding: utf-8 -*-
+""" Drag and Drop v2 XBlock - Handler instrumentation """
+import bisect
+import functools
+import importlib
+import logging
+import os
+import random
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from .utils import parse_positive
+
+logger = logging.getLogger(__name__)
+
+
+class NullTimer(object):
+    """
+    Timer used when instrumentation is disabled - does nothing, as cheaply as possible
+    """
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def phase(self, unused_name):
+        """ Returns no-op context manager """
+        return self
+
+
+NULL_TIMER = NullTimer()
+
+
+class HandlerTimer(object):
+    """
+    Measures time spent in phases of a single handler invocation.
+
+    Phases can be nested - time is always attributed to the innermost active phase, so that phase timings add up
+    to the total handler time. Time not spent in any phase is attributed to "other" phase.
+    """
+    OTHER = 'other'
+
+    def __init__(self, handler_name, clock=time.time):
+        self.handler_name = handler_name
+        self.phases = defaultdict(float)
+        self.total = None
+        self.request_bytes = None
+        self.response_bytes = None
+        self._clock = clock
+        self._stack = [self.OTHER]
+        self._started = self._mark = None
+
+    def _switch(self):
+        """
+        Attributes time passed since last switch to currently active phase
+        """
+        now = self._clock()
+        self.phases[self._stack[-1]] += now - self._mark
+        self._mark = now
+
+    def start(self):
+        """ Starts measuring handler time """
+        self._started = self._mark = self._clock()
+
+    def stop(self):
+        """ Stops measuring handler time """
+        self._switch()
+        self.total = self._mark - self._started
+
+    @contextmanager
+    def phase(self, name):
+        """ Context manager measuring time spent in phase `name` """
+        self._switch()
+        self._stack.append(name)
+        try:
+            yield
+        finally:
+            self._switch()
+            self._stack.pop()
+
+
+class LoggingSink(object):
+    """
+    Writes handler timings to the log
+    """
+    def record(self, timer):  # pylint: disable=no-self-use
+        """ Logs timings of a single handler invocation """
+        phases = ", ".join(
+            "{}={:.2f}ms".format(phase, duration * 1000) for phase, duration in sorted(timer.phases.items())
+        )
+        logger.info("DnDv2 handler %s took %.2fms (%s)", timer.handler_name, timer.total * 1000, phases)
+
+
+class HistogramSink(object):
+    """
+    Aggregates handler and phase timings into in-memory histograms.
+
+    Histograms are keyed by (handler name, phase name); handler total time is recorded as "total" phase.
+    """
+    BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+
+    def _add(self, key, duration):
+        """ Adds a single measurement to histogram identified by `key` """
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = {
+                'count': 0,
+                'sum_ms': 0.0,
+                'buckets': [0] * (len(self.BUCKETS_MS) + 1),
+            }
+        duration_ms = duration * 1000
+        histogram['count'] += 1
+        histogram['sum_ms'] += duration_ms
+        histogram['buckets'][bisect.bisect_left(self.BUCKETS_MS, duration_ms)] += 1
+
+    def record(self, timer):
+        """ Records timings of a single handler invocation """
+        with self._lock:
+            self._add((timer.handler_name, 'total'), timer.total)
+            for phase, duration in timer.phases.items():
+                self._add((timer.handler_name, phase), duration)
+
+    def snapshot(self):
+        """
+        Returns a copy of collected histograms. Bucket `i` counts measurements not exceeding `BUCKETS_MS[i]`
+        milliseconds; last bucket counts measurements exceeding all bucket bounds.
+        """
+        with self._lock:
+            return {
+                key: dict(histogram, buckets=list(histogram['buckets']))
+                for key, histogram in self._histograms.items()
+            }
+
+    def reset(self):
+        """ Discards collected histograms """
+        with self._lock:
+            self._histograms = {}
+
+
+class Profiling(object):
+    """
+    On-demand profiling of handler calls.
+
+    A sampled fraction of instrumented handler calls is run under cProfile, and collected stats are written into
+    `.pstats` files in a local directory. Configured via the settings service, under the `profiling` key of the
+    block settings bucket:
+
+        "drag-and-drop-v2": {
+            "profiling": {
+                "sample_rate": 0.01,
+                "directory": "/var/tmp/dnd-profiles",
+                "max_files": 100,
+                "max_bytes": 104857600
+            }
+        }
+
+    Oldest files are removed once the directory holds more than `max_files` files or more than `max_bytes` bytes.
+    """
+    SETTINGS_KEY = "profiling"
+    DEFAULT_MAX_FILES = 100
+    DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+    FILE_SUFFIX = ".pstats"
+
+    def __init__(self, xblock_settings):
+        config = (xblock_settings or {}).get(self.SETTINGS_KEY) or {}
+        self.directory = config.get('directory')
+        self.sample_rate = parse_positive(config.get('sample_rate'), float, 0.0)
+        self.max_files = parse_positive(config.get('max_files'), int, self.DEFAULT_MAX_FILES, allow_zero=True)
+        self.max_bytes = parse_positive(config.get('max_bytes'), int, self.DEFAULT_MAX_BYTES, allow_zero=True)
+
+    def should_profile(self):
+        """ Decides if current handler call should be profiled """
+        return bool(self.directory) and self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def save(self, profiler, handler_name):
+        """
+        Writes stats collected by `profiler` into profiling directory and removes old stats files.
+        Errors are logged, but never propagated - profiling must not break handlers.
+        """
+        filename = "{handler}-{timestamp:.6f}-{pid}{suffix}".format(
+            handler=handler_name, timestamp=time.time(), pid=os.getpid(), suffix=self.FILE_SUFFIX
+        )
+        try:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory)
+            profiler.dump_stats(os.path.join(self.directory, filename))
+            self._rotate()
+        except (IOError, OSError):
+            logger.exception("Unable to save DnDv2 profile for %s handler", handler_name)
+
+    def _rotate(self):
+        """
+        Removes oldest stats files exceeding configured file count or total size
+        """
+        files = []
+        for filename in os.listdir(self.directory):
+            if not filename.endswith(self.FILE_SUFFIX):
+                continue
+            path = os.path.join(self.directory, filename)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue  # Removed by another process
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        total_bytes = 0
+        for index, (__, size, path) in enumerate(sorted(files, reverse=True)):
+            total_bytes += size
+            if index >= self.max_files or total_bytes > self.max_bytes:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+class Instrumentation(object):
+    """
+    Instrumentation configuration and sink registry.
+
+    Instrumentation is enabled via the settings service, under the `instrumentation` key of the block settings
+    bucket:
+
+        "drag-and-drop-v2": {
+            "instrumentation": {"sink": "histogram", "slow_handler_threshold_ms": 500}
+        }
+
+    `sink` is either one of the built-in sinks ("logging", "histogram") or a dotted path to a class implementing
+    `record(timer)` method. If `slow_handler_threshold_ms` is set, handler calls taking longer than that are logged
+    along with problem size and phase timings.
+    """
+    SETTINGS_KEY = "instrumentation"
+
+    BUILTIN_SINKS = {
+        'logging': LoggingSink,
+        'histogram': HistogramSink,
+    }
+
+    _sinks = {}
+    _lock = threading.Lock()
+
+    def __init__(self, xblock_settings):
+        config = (xblock_settings or {}).get(self.SETTINGS_KEY) or {}
+        sink_name = config.get('sink')
+        self.sink = self.get_sink(sink_name) if sink_name else None
+        threshold_ms = parse_positive(config.get('slow_handler_threshold_ms'), float, None, allow_zero=True)
+        self.slow_handler_threshold = threshold_ms / 1000 if threshold_ms is not None else None
+        self.profiling = Profiling(xblock_settings)
+
+    @property
+    def enabled(self):
+        """ True if handler timings should be collected """
+        return self.sink is not None or self.slow_handler_threshold is not None
+
+    @classmethod
+    def get_sink(cls, sink_name):
+        """
+        Returns sink instance for `sink_name`. Sinks are instantiated once per process, so that aggregating sinks
+        (i.e. HistogramSink) can be inspected by calling this method.
+        """
+        with cls._lock:
+            if sink_name not in cls._sinks:
+                cls._sinks[sink_name] = cls._make_sink(sink_name)
+            return cls._sinks[sink_name]
+
+    @classmethod
+    def _make_sink(cls, sink_name):
+        """
+        Instantiates sink; returns None if sink can't be instantiated
+        """
+        sink_class = cls.BUILTIN_SINKS.get(sink_name)
+        try:
+            if sink_class is None:
+                module_name, class_name = sink_name.rsplit('.', 1)
+                sink_class = getattr(importlib.import_module(module_name), class_name)
+            return sink_class()
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Unable to instantiate DnDv2 instrumentation sink %s", sink_name)
+            return None
+
+    def record(self, block, timer):
+        """
+        Sends handler timings to the configured sink and logs them if handler was slow
+        """
+        if self.sink is not None:
+            self.sink.record(timer)
+        if self.slow_handler_threshold is not None and timer.total >= self.slow_handler_threshold:
+            log_slow_handler(block, timer, self.slow_handler_threshold)
+
+
+def _payload_size(payload):
+    """
+    Returns size of request/response body or rendered fragment; None if size can't be determined
+    """
+    body = getattr(payload, 'body', None)
+    if body is None:
+        body = getattr(payload, 'content', None)
+    return len(body) if body is not None else None
+
+
+def log_slow_handler(block, timer, threshold):
+    """
+    Logs slow handler invocation, along with problem size and phase timings
+    """
+    data = block.data or {}
+    item_state = block.item_state or {}
+    phases = ", ".join(
+        "{}={:.2f}ms".format(phase, duration * 1000) for phase, duration in sorted(timer.phases.items())
+    )
+    logger.warning(
+        "Slow DnDv2 handler %s took %.2fms (threshold %.2fms) for %s: "
+        "items=%d, zones=%d, placed_items=%d, request_bytes=%s, response_bytes=%s; phases: %s",
+        timer.handler_name, timer.total * 1000, threshold * 1000, block.scope_ids.usage_id,
+        len(data.get('items', [])), len(data.get('zones', [])), len(item_state),
+        timer.request_bytes, timer.response_bytes, phases
+    )
+
+
+def _run_timed(instrumentation, handler_name, func, block, *args, **kwargs):
+    """
+    Runs `func`, collecting its timings if enabled by `instrumentation`
+    """
+    if not instrumentation.enabled:
+        return func(block, *args, **kwargs)
+
+    timer = HandlerTimer(handler_name)
+    if args:
+        timer.request_bytes = _payload_size(args[0])
+    block.timer = timer
+    timer.start()
+    result = None
+    try:
+        result = func(block, *args, **kwargs)
+        return result
+    finally:
+        timer.stop()
+        block.timer = NULL_TIMER
+        timer.response_bytes = _payload_size(result)
+        try:
+            instrumentation.record(block, timer)
+        except Exception:  # pylint: disable=broad-except
+            # Instrumentation must not break handlers, nor hide their errors
+            logger.exception("Unable to record DnDv2 timings of %s handler", handler_name)
+
+
+def instrumented(handler_name):
+    """
+    Decorator for XBlock handlers and views, collecting handler phase timings and profiles if enabled.
+
+    Should be applied on top of the `XBlock.handler`/`XBlock.json_handler` decorators, so that JSON
+    (de)serialization time is accounted for as well.
+    """
+    def decorator(func):
+        """ Decorator """
+        @functools.wraps(func)
+        def wrapper(block, *args, **kwargs):
+            """ Runs `func`, measuring its timings """
+            instrumentation = Instrumentation(block.get_xblock_settings(default={}))
+            if instrumentation.profiling.should_profile():
+                import cProfile  # Only needed for sampled calls - avoid importing it on startup
+                profiler = cProfile.Profile()
+                try:
+                    return profiler.runcall(_run_timed, instrumentation, handler_name, func, block, *args, **kwargs)
+                finally:
+                    instrumentation.profiling.save(profiler, handler_name)
+            return _run_timed(instrumentation, handler_name, func, block, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def timed(phase_name):
+    """
+    Decorator for XBlock methods, attributing time spent in the method to handler phase `phase_name`
+    """
+    def decorator(func):
+        """ Decorator """
+        @functools.wraps(func)
+        def wrapper(block, *args, **kwargs):
+            """ Runs `func` in handler phase """
+            with block.timer.phase(phase_name):
+                return func(block, *args, **kwargs)
+        return wrapper
+    return decorator
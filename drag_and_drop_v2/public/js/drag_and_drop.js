@@ -22,11 +22,7 @@ function DragAndDropTemplates(configuration) {
     };
 
     var getZone = function(zoneUID, ctx) {
-        for (var i = 0; i < ctx.zones.length; i++) {
-            if (ctx.zones[i].uid === zoneUID) {
-                return ctx.zones[i];
-            }
-        }
+        return ctx.zones_by_uid[zoneUID];
     };
 
     var bankItemWidthStyles = function(item, ctx) {
@@ -44,12 +40,43 @@ function DragAndDropTemplates(configuration) {
         return style;
     };
 
+    var spriteTemplate = function(item) {
+        // Show the item's region of the sprite sheet, scaled to the width of the element;
+        // percentages let the region scale along with the element.
+        var sheet = configuration.item_sprite;
+        var region = item.spriteRegion;
+        var position = function(offset, size, sheetSize) {
+            return (sheetSize > size ? offset / (sheetSize - size) * 100 : 0) + '%';
+        };
+        return h('span.item-sprite', {
+            attributes: { role: 'img', 'aria-label': item.imageDescription || '' },
+            style: { width: item.widthPercent ? '100%' : region.width + 'px' }
+        }, [
+            h('span.item-sprite-image', {
+                style: {
+                    paddingBottom: (region.height / region.width * 100) + '%',
+                    backgroundImage: 'url("' + sheet.url + '")',
+                    backgroundSize: (
+                        (sheet.width / region.width * 100) + '% ' + (sheet.height / region.height * 100) + '%'
+                    ),
+                    backgroundPosition: (
+                        position(region.x, region.width, sheet.width) + ' ' +
+                        position(region.y, region.height, sheet.height)
+                    )
+                }
+            })
+        ]);
+    };
+
     var itemContentTemplate = function(item) {
+        var key = item.value + '-content';
+        if (item.spriteRegion && configuration.item_sprite) {
+            return h('div', { key: key, className: "item-content" }, [spriteTemplate(item)]);
+        }
         var item_content_html = item.displayName;
         if (item.imageURL) {
             item_content_html = '<img src="' + item.imageURL + '" alt="' + item.imageDescription + '" />';
         }
-        var key = item.value + '-content';
         return h('div', { key: key, innerHTML: item_content_html, className: "item-content" });
     };
 
@@ -182,8 +209,7 @@ function DragAndDropTemplates(configuration) {
         var selector = ctx.display_zone_borders ? 'div.zone.zone-with-borders' : 'div.zone';
         // Mark item alignment and render its placed items as children
         var item_wrapper = 'div.item-wrapper.item-align.item-align-' + zone.align;
-        var is_item_in_zone = function(i) { return i.is_placed && (i.zone === zone.uid); };
-        var items_in_zone = $.grep(ctx.items, is_item_in_zone);
+        var items_in_zone = ctx.items_by_zone[zone.uid] || [];
         var zone_description_id = 'zone-' + zone.uid + '-description';
         if (items_in_zone.length == 0) {
           var zone_description = h(
@@ -478,7 +504,12 @@ function DragAndDropTemplates(configuration) {
                         [
                             itemFeedbackPopupTemplate(ctx),
                             h('div.target-img-wrapper', [
-                                h('img.target-img', {src: ctx.target_img_src, alt: ctx.target_img_description}),
+                                h('img.target-img', {
+                                    src: ctx.target_img_src,
+                                    alt: ctx.target_img_description,
+                                    // Known dimensions let the browser reserve space for the image while it loads.
+                                    attributes: {width: ctx.target_img_width, height: ctx.target_img_height}
+                                }),
                             ]
                         ),
                         renderCollection(zoneTemplate, ctx.zones, ctx)
@@ -503,6 +534,17 @@ function DragAndDropBlock(runtime, element, configuration) {
     DragAndDropBlock.STANDARD_MODE = 'standard';
     DragAndDropBlock.ASSESSMENT_MODE = 'assessment';
 
+    // Functions that render the pending state changes of blocks on the page, see applyState.
+    DragAndDropBlock.pendingRenders = DragAndDropBlock.pendingRenders || [];
+
+    /**
+     * Render pending state changes of all blocks on the page right away, instead of waiting
+     * for the next animation frame. Useful in tests that inspect the DOM after an interaction.
+     */
+    DragAndDropBlock.flushRenders = function() {
+        DragAndDropBlock.pendingRenders.slice().forEach(function(flush) { flush(); });
+    };
+
     var Selector = {
         popup_box: '.popup',
         close_button: '.popup .close-feedback-popup-button'
@@ -523,6 +565,14 @@ function DragAndDropBlock(runtime, element, configuration) {
     var state = undefined;
     var bgImgNaturalWidth = undefined; // pixel width of the background image (when not scaled)
     var __vdom = virtualDom.h();  // blank virtual DOM
+    var renderPending = false;  // true when state has changed since the DOM was last updated
+
+    var requestFrame = function(callback) {
+        if (window.requestAnimationFrame) {
+            return window.requestAnimationFrame(callback);
+        }
+        return setTimeout(callback, 16);
+    };
 
     // Event string size limit.
     var MAX_LENGTH = 255;
@@ -539,6 +589,14 @@ function DragAndDropBlock(runtime, element, configuration) {
     var $selectedItem;
     var $focusedElement;
 
+    // DOM elements that currently have draggable behavior attached, keyed by item ID
+    var draggableElements = {};
+
+    // Zone configurations keyed by zone UID
+    var zonesByUid = {};
+    // Memoized item render contexts keyed by item ID, see itemContext
+    var itemContexts = {};
+
     var init = function() {
         // Load the current user state, and load the image, then render the block.
         // We load the user state via AJAX rather than passing it in statically (like we do with
@@ -556,6 +614,7 @@ function DragAndDropBlock(runtime, element, configuration) {
             });
             state = stateResult[0]; // stateResult is an array of [data, statusText, jqXHR]
             migrateConfiguration(bgImg.width);
+            selectImageVariants();
             migrateState();
             markItemZoneAlign();
             bgImgNaturalWidth = bgImg.width;
@@ -582,6 +641,7 @@ function DragAndDropBlock(runtime, element, configuration) {
             element.addEventListener('load', webkitFix, true);
 
             applyState();
+            flushState();
             initDroppable();
 
             // Indicate that problem is done loading
@@ -658,9 +718,19 @@ function DragAndDropBlock(runtime, element, configuration) {
         $keyboardHelpDialog.find('.modal-dismiss-button').off();
     };
 
-    /** Asynchronously load the main background image used for this block. */
+    /**
+     * Asynchronously load the main background image used for this block.
+     * If the image dimensions were recorded when the block was saved, resolves right away,
+     * letting the problem render while the image is still downloading.
+     */
     var loadBackgroundImage = function() {
         var promise = $.Deferred();
+        if (configuration.target_img_width && configuration.target_img_height) {
+            return promise.resolve({
+                width: configuration.target_img_width,
+                height: configuration.target_img_height
+            });
+        }
         var img = new Image();
         img.addEventListener("load", function() {
             if (img.width > 0 && img.height > 0) {
@@ -675,7 +745,11 @@ function DragAndDropBlock(runtime, element, configuration) {
         return promise;
     };
 
-    /** Zones are specified in the configuration via pixel values - convert to percentages */
+    /**
+     * Zones are specified in the data via pixel values - convert to percentages.
+     * The server does this conversion when it knows the target image dimensions,
+     * so this is only needed for problems saved before they were recorded.
+     */
     var computeZoneDimension = function(zone, bg_image_width, bg_image_height) {
         if (zone.x_percent === undefined) {
             // We can assume that if 'x_percent' is not set, 'y_percent', 'width_percent', and
@@ -719,26 +793,43 @@ function DragAndDropBlock(runtime, element, configuration) {
         var itemId = $option.data('value');
         configuration.items.forEach(function(item) {
             if (item.id == itemId) {
-                item.imgNaturalWidth = event.target.naturalWidth;
+                // A downscaled variant of the image may be shown, so prefer the width of the original image.
+                item.imgNaturalWidth = item.imageWidth || event.target.naturalWidth;
             }
         });
-        setTimeout(applyState, 0); // Apply changes to the DOM after the event handling completes.
+        applyState();
     };
 
 
     var previousFeedback = undefined;
     /**
-     * Update the DOM to reflect 'state'.
+     * Schedule an update of the DOM to reflect 'state'.
+     * State changes are coalesced, so the DOM is updated at most once per animation frame;
+     * call flushState to update it right away when the code that follows reads the DOM.
+     */
+    var applyState = function() {
+        if (!renderPending) {
+            renderPending = true;
+            DragAndDropBlock.pendingRenders.push(flushState);
+            requestFrame(flushState);
+        }
+    };
+
+    /**
+     * Update the DOM to reflect 'state' if there are any pending changes.
      */
-    var applyState = function(keepDraggableInit) {
+    var flushState = function() {
+        if (!renderPending) {
+            return;
+        }
+        renderPending = false;
+        var idx = DragAndDropBlock.pendingRenders.indexOf(flushState);
+        if (idx !== -1) {
+            DragAndDropBlock.pendingRenders.splice(idx, 1);
+        }
         sendFeedbackPopupEvents();
         updateDOM();
-        if (!keepDraggableInit) {
-            destroyDraggable();
-            if (!state.finished) {
-                initDraggable();
-            }
-        }
+        syncDraggables();
     };
 
     var sendFeedbackPopupEvents = function() {
@@ -940,74 +1031,95 @@ function DragAndDropBlock(runtime, element, configuration) {
         }
     };
 
-    var initDraggable = function() {
-        $root.find('.drag-container .option[draggable=true]').each(function() {
-            var $item = $(this);
-
-            // Allow item to be "picked up" using the keyboard
-            $item.on('keydown', function(evt) {
-                if (isActionKey(evt)) {
-                    evt.preventDefault();
-                    evt.stopPropagation();
-                    state.keyboard_placement_mode = true;
-                    grabItem($item, 'keyboard');
-                    $selectedItem = $item;
-                    $root.find('.target .zone').first().focus();
-                }
-            });
+    /**
+     * Attach draggable behavior to items that became draggable and detach it from items that are
+     * no longer draggable, leaving items whose element and draggable status did not change untouched.
+     * The virtual DOM reuses elements of unchanged items, so their handlers stay valid across updates.
+     */
+    var syncDraggables = function() {
+        var current = {};
+        $root.find('.drag-container .option[data-value]').each(function() {
+            var item_id = $(this).data('value');
+            if (!state.finished && $(this).attr('draggable') === 'true') {
+                current[item_id] = this;
+            }
+        });
+        Object.keys(draggableElements).forEach(function(item_id) {
+            if (current[item_id] !== draggableElements[item_id]) {
+                destroyDraggable($(draggableElements[item_id]));
+                delete draggableElements[item_id];
+            }
+        });
+        Object.keys(current).forEach(function(item_id) {
+            if (draggableElements[item_id] === undefined) {
+                initDraggable($(current[item_id]));
+                draggableElements[item_id] = current[item_id];
+            }
+        });
+    };
 
-            // Make item draggable using the mouse
-            try {
-                $item.draggable({
-                    addClasses: false,  // don't add ui-draggable-* classes as they don't play well with virtual DOM.
-                    containment: $root.find('.drag-container'),
-                    cursor: 'move',
-                    stack: $root.find('.drag-container .option'),
-                    revert: 'invalid',
-                    revertDuration: 150,
-                    start: function(evt, ui) {
-                        var $item = $(this);
-                        // Store initial position of dragged item to be able to revert back to it on cancelled drag
-                        // (when user drops the item onto an area that is not a droppable zone).
-                        // The jQuery UI draggable library usually knows how to revert correctly, but our dropped items
-                        // have a translation transform that confuses jQuery UI draggable, so we "help" it do the right
-                        // thing by manually storing the initial position and resetting it in the 'stop' handler below.
-                        $item.data('initial-position', {
-                            left: $item.css('left'),
-                            top: $item.css('top')
-                        });
-                        grabItem($item, 'mouse');
-                        publishEvent({
-                            event_type: 'edx.drag_and_drop_v2.item.picked_up',
-                            item_id: $item.data('value'),
-                        });
-                    },
-                    stop: function(evt, ui) {
-                        // Revert to original position.
-                        $item.css($item.data('initial-position'));
-                        releaseItem($(this));
-                    }
-                });
-            } catch (e) {
-                // Initializing the draggable will fail if draggable was already
-                // initialized. That's expected, ignore the exception.
+    var initDraggable = function($item) {
+        // Allow item to be "picked up" using the keyboard
+        $item.on('keydown', function(evt) {
+            if (isActionKey(evt)) {
+                evt.preventDefault();
+                evt.stopPropagation();
+                state.keyboard_placement_mode = true;
+                grabItem($item, 'keyboard');
+                $selectedItem = $item;
+                $root.find('.target .zone').first().focus();
             }
         });
+
+        // Make item draggable using the mouse
+        try {
+            $item.draggable({
+                addClasses: false,  // don't add ui-draggable-* classes as they don't play well with virtual DOM.
+                containment: $root.find('.drag-container'),
+                cursor: 'move',
+                stack: $root.find('.drag-container .option'),
+                revert: 'invalid',
+                revertDuration: 150,
+                start: function(evt, ui) {
+                    var $item = $(this);
+                    // Store initial position of dragged item to be able to revert back to it on cancelled drag
+                    // (when user drops the item onto an area that is not a droppable zone).
+                    // The jQuery UI draggable library usually knows how to revert correctly, but our dropped items
+                    // have a translation transform that confuses jQuery UI draggable, so we "help" it do the right
+                    // thing by manually storing the initial position and resetting it in the 'stop' handler below.
+                    $item.data('initial-position', {
+                        left: $item.css('left'),
+                        top: $item.css('top')
+                    });
+                    grabItem($item, 'mouse');
+                    publishEvent({
+                        event_type: 'edx.drag_and_drop_v2.item.picked_up',
+                        item_id: $item.data('value'),
+                    });
+                },
+                stop: function(evt, ui) {
+                    // Revert to original position.
+                    $item.css($item.data('initial-position'));
+                    releaseItem($(this));
+                }
+            });
+        } catch (e) {
+            // Initializing the draggable will fail if draggable was already
+            // initialized. That's expected, ignore the exception.
+        }
     };
 
     var grabItem = function($item, interaction_type) {
         var item_id = $item.data('value');
         setGrabbedState(item_id, true, interaction_type);
         closePopup(false);
-        // applyState(true) skips destroying and initializing draggable
-        applyState(true);
+        applyState();
     };
 
     var releaseItem = function($item) {
         var item_id = $item.data('value');
         setGrabbedState(item_id, false);
-        // applyState(true) skips destroying and initializing draggable
-        applyState(true);
+        applyState();
     };
 
     var setGrabbedState = function(item_id, grabbed, interaction_type) {
@@ -1024,19 +1136,15 @@ function DragAndDropBlock(runtime, element, configuration) {
         });
     };
 
-    var destroyDraggable = function() {
-        $root.find('.drag-container .option[draggable=false]').each(function() {
-            var $item = $(this);
+    var destroyDraggable = function($item) {
+        $item.off();
 
-            $item.off();
-
-            try {
-                $item.draggable('destroy');
-            } catch (e) {
-                // Destroying the draggable will fail if draggable was
-                // not initialized in the first place. Ignore the exception.
-            }
-        });
+        try {
+            $item.draggable('destroy');
+        } catch (e) {
+            // Destroying the draggable will fail if draggable was
+            // not initialized in the first place. Ignore the exception.
+        }
     };
 
     var submitLocation = function(item_id, zone) {
@@ -1093,6 +1201,7 @@ function DragAndDropBlock(runtime, element, configuration) {
 
     var closePopup = function(manually_closed) {
         // do not apply state here - callers are responsible to call it when other appropriate state changes are applied
+        flushState(); // Popup visibility is read from the DOM, so render any pending changes first.
         if ($root.find(Selector.popup_box).is(":visible")) {
             state.closing = true;
             previousFeedback = state.feedback;
@@ -1109,6 +1218,7 @@ function DragAndDropBlock(runtime, element, configuration) {
         }).done(function(data) {
             state = data;
             applyState();
+            flushState();
             focusFirstDraggable();
         });
     };
@@ -1129,6 +1239,7 @@ function DragAndDropBlock(runtime, element, configuration) {
         }).always(function() {
             state.show_answer_spinner = false;
             applyState();
+            flushState();
             $root.find('.item-bank').focus();
         });
     };
@@ -1158,6 +1269,7 @@ function DragAndDropBlock(runtime, element, configuration) {
         }).always(function() {
             state.submit_spinner = false;
             applyState();
+            flushState();
             focusItemFeedbackPopup() || focusFirstDraggable();
         });
     };
@@ -1199,49 +1311,74 @@ function DragAndDropBlock(runtime, element, configuration) {
         return result;
     }
 
+    /**
+     * Return the render context of a single item.
+     * Contexts are memoized, and only rebuilt when the item or its state has changed.
+     */
+    var itemContext = function(item) {
+        var item_user_state = state.items[item.id];
+        var grabbed = false;
+        if (item.grabbed !== undefined) {
+            grabbed = item.grabbed;
+        }
+        var drag_disabled;
+        // In standard mode items placed in correct zone are no longer draggable.
+        // In assessment mode items are draggable and can be moved between zones
+        // until user explicitly submits the problem.
+        if (configuration.mode === DragAndDropBlock.STANDARD_MODE) {
+            drag_disabled = Boolean(state.finished || item_user_state);
+        } else {
+            drag_disabled = Boolean(state.finished);
+        }
+        var cache_key = JSON.stringify([
+            drag_disabled, grabbed, item.grabbed_with, item.imgNaturalWidth, item.widthPercent,
+            item_user_state && [item_user_state.zone, item_user_state.zone_align, item_user_state.submitting_location]
+        ]);
+        var cached = itemContexts[item.id];
+        if (cached && cached.key === cache_key) {
+            return cached.context;
+        }
+        var itemProperties = {
+            value: item.id,
+            drag_disabled: drag_disabled,
+            focusable: !drag_disabled,
+            class_name: drag_disabled ? 'fade' : undefined,
+            xhr_active: (item_user_state && item_user_state.submitting_location),
+            displayName: item.displayName,
+            imageURL: item.expandedImageURL,
+            imageDescription: item.imageDescription,
+            spriteRegion: item.spriteRegion,
+            has_image: !!item.expandedImageURL,
+            grabbed: grabbed,
+            grabbed_with: item.grabbed_with,
+            is_placed: Boolean(item_user_state),
+            widthPercent: item.widthPercent, // widthPercent may be undefined (auto width)
+            imgNaturalWidth: item.imgNaturalWidth,
+        };
+        if (item_user_state) {
+            itemProperties.zone = item_user_state.zone;
+            itemProperties.zone_align = item_user_state.zone_align;
+        }
+        if (configuration.item_background_color) {
+            itemProperties.background_color = configuration.item_background_color;
+        }
+        if (configuration.item_text_color) {
+            itemProperties.color = configuration.item_text_color;
+        }
+        itemContexts[item.id] = {key: cache_key, context: itemProperties};
+        return itemProperties;
+    };
+
     var render = function() {
-        var items = configuration.items.map(function(item) {
-            var item_user_state = state.items[item.id];
-            var grabbed = false;
-            if (item.grabbed !== undefined) {
-                grabbed = item.grabbed;
-            }
-            var drag_disabled;
-            // In standard mode items placed in correct zone are no longer draggable.
-            // In assessment mode items are draggable and can be moved between zones
-            // until user explicitly submits the problem.
-            if (configuration.mode === DragAndDropBlock.STANDARD_MODE) {
-                drag_disabled = Boolean(state.finished || item_user_state);
-            } else {
-                drag_disabled = Boolean(state.finished);
-            }
-            var itemProperties = {
-                value: item.id,
-                drag_disabled: drag_disabled,
-                focusable: !drag_disabled,
-                class_name: drag_disabled ? 'fade' : undefined,
-                xhr_active: (item_user_state && item_user_state.submitting_location),
-                displayName: item.displayName,
-                imageURL: item.expandedImageURL,
-                imageDescription: item.imageDescription,
-                has_image: !!item.expandedImageURL,
-                grabbed: grabbed,
-                grabbed_with: item.grabbed_with,
-                is_placed: Boolean(item_user_state),
-                widthPercent: item.widthPercent, // widthPercent may be undefined (auto width)
-                imgNaturalWidth: item.imgNaturalWidth,
-            };
-            if (item_user_state) {
-                itemProperties.zone = item_user_state.zone;
-                itemProperties.zone_align = item_user_state.zone_align;
-            }
-            if (configuration.item_background_color) {
-                itemProperties.background_color = configuration.item_background_color;
-            }
-            if (configuration.item_text_color) {
-                itemProperties.color = configuration.item_text_color;
+        var items = [];
+        var items_by_zone = {};
+        configuration.items.forEach(function(item) {
+            var itemProperties = itemContext(item);
+            items.push(itemProperties);
+            if (itemProperties.is_placed) {
+                items_by_zone[itemProperties.zone] = items_by_zone[itemProperties.zone] || [];
+                items_by_zone[itemProperties.zone].push(itemProperties);
             }
-            return itemProperties;
         });
 
         // In assessment mode, it is possible to move items back to the bank, so the bank should be able to
@@ -1262,10 +1399,14 @@ function DragAndDropBlock(runtime, element, configuration) {
             show_show_answer: configuration.mode == DragAndDropBlock.ASSESSMENT_MODE,
             target_img_src: configuration.target_img_expanded_url,
             target_img_description: configuration.target_img_description,
+            target_img_width: configuration.target_img_width,
+            target_img_height: configuration.target_img_height,
             display_zone_labels: configuration.display_zone_labels,
             display_zone_borders: configuration.display_zone_borders,
             zones: configuration.zones,
+            zones_by_uid: zonesByUid,
             items: items,
+            items_by_zone: items_by_zone,
             // state - parts that can change:
             attempts: state.attempts,
             last_action_correct: state.last_action_correct,
@@ -1295,9 +1436,43 @@ function DragAndDropBlock(runtime, element, configuration) {
             if (item.widthPercent === undefined && item.size && parseInt(item.size.width) > 0) {
                 item.widthPercent = parseInt(item.size.width) / bg_image_width * 100;
             }
+            // Use the image width recorded when the block was saved until the image itself loads:
+            if (item.imgNaturalWidth === undefined && item.imageWidth > 0) {
+                item.imgNaturalWidth = item.imageWidth;
+            }
         }
     };
 
+    /**
+     * selectImageVariants: Replace image URLs with the smallest downscaled variant of the image that is
+     * at least as wide as the image can be displayed on this device, if the server provided any variants.
+     */
+    var selectImageVariants = function() {
+        var blockWidth = $root.width();
+        if (!blockWidth) {
+            return;  // The block is not displayed, so its width is not known; keep the original images.
+        }
+        var maxWidth = blockWidth * (window.devicePixelRatio || 1);
+        configuration.target_img_expanded_url = pickImageVariant(
+            configuration.target_img_expanded_url, configuration.target_img_variants, maxWidth
+        );
+        configuration.items.forEach(function(item) {
+            // Items are at most ~30% as wide as the target image, unless the author has specified their width.
+            var widthFraction = (item.widthPercent || 30) / 100;
+            item.expandedImageURL = pickImageVariant(
+                item.expandedImageURL, item.expandedImageVariants, maxWidth * widthFraction
+            );
+        });
+    };
+
+    var pickImageVariant = function(url, variants, minWidth) {
+        var candidates = (variants || []).filter(function(variant) {
+            return variant.width >= minWidth;
+        });
+        candidates.sort(function(a, b) { return a.width - b.width; });
+        return candidates.length ? candidates[0].url : url;
+    };
+
     /**
      * migrateState: Apply any changes necessary to support the 'state' format used by older
      * versions of this XBlock.
@@ -1319,6 +1494,7 @@ function DragAndDropBlock(runtime, element, configuration) {
         configuration.zones.forEach(function(zone) {
             if (!zone.align) zone.align = DEFAULT_ZONE_ALIGN;
             zone_alignments[zone.uid] = zone.align;
+            zonesByUid[zone.uid] = zone;
         });
         Object.keys(state.items).forEach(function(item_id) {
             var item = state.items[item_id];
@@ -188,6 +188,9 @@ function DragAndDropEditBlock(runtime, element, params) {
                         .on('input', '.zone-row input', _fn.build.form.zone.changedInputHandler)
                         .on('change', '.zone-align-select', _fn.build.form.zone.changedInputHandler)
                         .on('click', '.target-image-form button', function(e) {
+                            // Dimensions of the previous image no longer apply; they are recorded when the new one loads.
+                            delete _fn.data.targetImgWidth;
+                            delete _fn.data.targetImgHeight;
                             var new_img_url = $.trim($('.target-image-form .background-url', element).val());
                             if (new_img_url) {
                                 // We may need to 'expand' the URL before it will be valid.
@@ -373,6 +376,12 @@ function DragAndDropEditBlock(runtime, element, params) {
                         },
                         imageLoaded: function() {
                             // The target background image has loaded (or reloaded, if changed).
+                            // Record its dimensions, so the learner view can lay out the problem before it loads.
+                            var img = _fn.build.$el.targetImage[0];
+                            if (img.naturalWidth > 0 && img.naturalHeight > 0) {
+                                _fn.data.targetImgWidth = img.naturalWidth;
+                                _fn.data.targetImgHeight = img.naturalHeight;
+                            }
                             _fn.build.form.zone.renderZonesPreview();
                         },
                     },
@@ -521,6 +530,13 @@ function DragAndDropEditBlock(runtime, element, params) {
                         $.post(handlerUrl, JSON.stringify(data), 'json').done(function(response) {
                             if (response.result === 'success') {
                                 runtime.notify('save', {state: 'end'});
+                                if (response.warnings) {
+                                    // The problem was saved, but some of its images are too large.
+                                    runtime.notify('error', {
+                                        'title': window.gettext("Some images may slow down loading the problem."),
+                                        'message': response.warnings.join(" ")
+                                    });
+                                }
                             } else {
                                 var message = response.messages.join(", ");
                                 runtime.notify('error', {
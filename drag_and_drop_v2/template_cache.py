@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+""" Drag and Drop v2 XBlock - Template cache """
+from django.template import Context, Template
+from django.utils import translation
+from xblockutils.resources import ResourceLoader
+
+
+class TemplateCache(object):
+    """
+    Caches template sources and compiled templates loaded from package resources for the life of the process.
+
+    Package resources do not change while the process runs, so nothing is ever invalidated. Concurrent misses may
+    load or compile the same template twice, which is harmless.
+    """
+    def __init__(self, loader):
+        self._loader = loader
+        self._sources = {}
+        self._templates = {}
+        self._rendered = {}
+
+    def load_unicode(self, template_path):
+        """ Returns template source """
+        source = self._sources.get(template_path)
+        if source is None:
+            source = self._sources[template_path] = self._loader.load_unicode(template_path)
+        return source
+
+    def get_template(self, template_path):
+        """ Returns compiled Django template """
+        template = self._templates.get(template_path)
+        if template is None:
+            template = self._templates[template_path] = Template(self.load_unicode(template_path))
+        return template
+
+    def render(self, template_path, context=None):
+        """ Renders Django template with `context` """
+        return self.get_template(template_path).render(Context(context or {}))
+
+    def render_static(self, template_path):
+        """
+        Renders Django template that does not take any context. Output is cached per active language, as it
+        still depends on translations.
+        """
+        key = (template_path, translation.get_language())
+        rendered = self._rendered.get(key)
+        if rendered is None:
+            rendered = self._rendered[key] = self.render(template_path)
+        return rendered
+
+
+TEMPLATE_CACHE = TemplateCache(ResourceLoader(__name__))
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+""" Drag and Drop v2 XBlock - Tracking event policies """
+import random
+import threading
+import time
+from collections import namedtuple
+
+from xblock.core import XBlockMixin
+from xblock.fields import Dict, Scope
+
+from .instrumentation import timed
+from .utils import _, parse_positive
+
+
+EventPolicy = namedtuple("EventPolicy", ["mode", "rate", "limit"])  # pylint: disable=invalid-name
+
+
+class EventPolicies(object):
+    """
+    Per-event-type publishing policies for high-volume tracking events.
+
+    Policies are configured via the settings service, under the `event_policies` key of the block
+    settings bucket, e.g.:
+
+        "drag-and-drop-v2": {
+            "event_policies": {
+                "edx.drag_and_drop_v2.item.dropped": {"mode": "sample", "rate": 0.1},
+                "edx.drag_and_drop_v2.feedback.opened": {"mode": "first", "limit": 5},
+                "edx.drag_and_drop_v2.item.picked_up": {"mode": "off"}
+            },
+            "event_summary_interval": 50,
+            "event_summary_period": 300
+        }
+
+    Event types without a configured policy are always published.
+    """
+    ALWAYS = "always"
+    SAMPLE = "sample"
+    FIRST = "first"
+    OFF = "off"
+
+    SETTINGS_KEY = "event_policies"
+    SUMMARY_INTERVAL_SETTINGS_KEY = "event_summary_interval"
+    DEFAULT_SUMMARY_INTERVAL = 50
+    SUMMARY_PERIOD_SETTINGS_KEY = "event_summary_period"
+    DEFAULT_SUMMARY_PERIOD = 300
+
+    SUMMARY_EVENT_TYPE = "edx.drag_and_drop_v2.events.suppressed"
+
+    DEFAULT_POLICY = EventPolicy(ALWAYS, 1.0, None)
+
+    def __init__(self, xblock_settings):
+        xblock_settings = xblock_settings or {}
+        self._policies = xblock_settings.get(self.SETTINGS_KEY) or {}
+        self.summary_interval = parse_positive(
+            xblock_settings.get(self.SUMMARY_INTERVAL_SETTINGS_KEY), int, self.DEFAULT_SUMMARY_INTERVAL
+        )
+        self.summary_period = parse_positive(
+            xblock_settings.get(self.SUMMARY_PERIOD_SETTINGS_KEY), int, self.DEFAULT_SUMMARY_PERIOD
+        )
+
+    def get(self, event_type):
+        """
+        Returns normalized EventPolicy for `event_type`.
+
+        Unknown modes and invalid parameters fall back to "always" - misconfiguration should never cause
+        events to be lost silently.
+        """
+        raw_policy = self._policies.get(event_type) or {}
+        mode = raw_policy.get('mode', self.ALWAYS)
+        try:
+            if mode == self.OFF:
+                return EventPolicy(self.OFF, 0.0, None)
+            elif mode == self.SAMPLE:
+                rate = min(max(float(raw_policy.get('rate')), 0.0), 1.0)
+                return EventPolicy(self.SAMPLE, rate, None)
+            elif mode == self.FIRST:
+                limit = max(int(raw_policy.get('limit')), 0)
+                return EventPolicy(self.FIRST, 1.0, limit)
+        except (ValueError, TypeError):
+            pass
+
+        return self.DEFAULT_POLICY
+
+    @classmethod
+    def should_publish(cls, policy, published_count):
+        """
+        Decides if an event governed by `policy` should be published.
+
+        Arguments:
+            policy - EventPolicy
+            published_count - number of events of the same type already published for the learner in current attempt
+        """
+        if policy.mode == cls.ALWAYS:
+            return True
+        elif policy.mode == cls.OFF:
+            return False
+        elif policy.mode == cls.SAMPLE:
+            return random.random() < policy.rate
+        elif policy.mode == cls.FIRST:
+            return published_count < policy.limit
+        return True
+
+    def describe(self, event_types):
+        """
+        Returns policy description for `event_types`, suitable for inclusion into summary event.
+        Allows analytics to rescale sampled event counts.
+        """
+        return {event_type: dict(self.get(event_type)._asdict()) for event_type in event_types}
+
+
+class SuppressedEventCounter(object):
+    """
+    Counts tracking events suppressed by event policies, per block, across all learners served by this process.
+
+    Counting per process rather than per learner keeps suppressed events from causing user state writes, and lets
+    summaries be published even if no single learner suppresses many events.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {}
+        self._counting_since = {}
+
+    def add(self, block_key, event_type, policies):
+        """
+        Counts suppressed event of `event_type` for block identified by `block_key`.
+
+        Returns suppressed counts per event type, which should be published in a summary event, once
+        `policies.summary_interval` events have been suppressed or `policies.summary_period` seconds have passed
+        since the first of them; None otherwise.
+        """
+        now = time.time()
+        with self._lock:
+            counts = self._counts.setdefault(block_key, {})
+            counting_since = self._counting_since.setdefault(block_key, now)
+            counts[event_type] = counts.get(event_type, 0) + 1
+            if sum(counts.values()) < policies.summary_interval and now - counting_since < policies.summary_period:
+                return None
+            del self._counts[block_key]
+            del self._counting_since[block_key]
+            return counts
+
+
+SUPPRESSED_EVENTS = SuppressedEventCounter()
+
+
+class TrackingEventsMixin(XBlockMixin):
+    """
+    Publishes tracking events subject to event policies. Used by DragAndDropBlock, which provides the `attempts`
+    field and block settings.
+    """
+
+    event_counters = Dict(
+        help=_(
+            "Counts of tracking events published for the learner in the current attempt. "
+            "Only used for event types limited to the first few events per attempt by event policies."
+        ),
+        scope=Scope.user_state,
+        default={},
+    )
+
+    @timed('publish')
+    def _publish_tracking_event(self, event_type, data):
+        """
+        Publishes tracking event, subject to event policy configured for `event_type`.
+
+        Suppressed events are counted per block in this process; once the number of suppressed events reaches
+        configured interval, or configured period passes, a summary event with suppressed counts and policies is
+        published, so analytics can rescale.
+        """
+        policies = EventPolicies(self.get_xblock_settings(default={}))
+        policy = policies.get(event_type)
+        if policy.mode == EventPolicies.ALWAYS:
+            self.runtime.publish(self, event_type, data)
+            return
+
+        published = {}
+        if policy.mode == EventPolicies.FIRST and self.event_counters.get('attempt') == self.attempts:
+            # Only "first N" limits depend on the learner's history; they are applied per attempt
+            published = self.event_counters.get('published', {})
+
+        if EventPolicies.should_publish(policy, published.get(event_type, 0)):
+            self.runtime.publish(self, event_type, data)
+            if policy.mode == EventPolicies.FIRST:
+                # Copy to make sure changes are detected and saved
+                published = dict(published)
+                published[event_type] = published.get(event_type, 0) + 1
+                self.event_counters = {'attempt': self.attempts, 'published': published}
+        else:
+            suppressed = SUPPRESSED_EVENTS.add(unicode(self.scope_ids.usage_id), event_type, policies)
+            if suppressed:
+                self._publish_suppressed_events_summary(policies, suppressed)
+
+    def _publish_suppressed_events_summary(self, policies, suppressed):
+        """
+        Publishes summary of tracking events suppressed by event policies.
+        """
+        self.runtime.publish(self, EventPolicies.SUMMARY_EVENT_TYPE, {
+            'suppressed': suppressed,
+            'policies': policies.describe(suppressed.keys()),
+        })
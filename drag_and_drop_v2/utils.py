@@ -9,6 +9,18 @@ def _(text):
     return text
 
 
+def parse_positive(raw_value, value_type, default, allow_zero=False):
+    """
+    Parses positive number of `value_type` from settings, falling back to `default` on invalid values.
+    Zero is accepted as well if `allow_zero` is set.
+    """
+    try:
+        value = value_type(raw_value)
+    except (ValueError, TypeError):
+        return default
+    return value if value > 0 or (allow_zero and value == 0) else default
+
+
 def ngettext_fallback(text_singular, text_plural, number):
     """ Dummy `ngettext` replacement to make string extraction tools scrape strings marked for translation """
     if number == 1:
@@ -290,3 +302,72 @@ class StateMigration(object):
             item.pop(attribute, None)
 
         return item
+
+
+class GradePublishingPolicy(object):
+    """
+    Controls how often grade events are published in standard mode.
+
+    Configured via the settings service, under the `grade_publishing` key of the block settings bucket, e.g.:
+
+        "drag-and-drop-v2": {
+            "grade_publishing": {"mode": "bucket", "buckets": 4}
+        }
+
+    Modes:
+        * always - grade is published every time it increases (default)
+        * completion - grade is published only when the problem is completed
+        * bucket - grade is published when it moves into the next of `buckets` equal grade ranges
+        * window - grade is published at most once per `window` seconds
+
+    Regardless of the mode, grade is always published when the problem is completed or the maximum grade is reached.
+    Deferred grades are only published when the learner drops another item - a learner who stops working on the
+    problem keeps the deferred grade, but the LMS only has the last published one.
+    """
+    ALWAYS = "always"
+    COMPLETION = "completion"
+    BUCKET = "bucket"
+    WINDOW = "window"
+
+    SETTINGS_KEY = "grade_publishing"
+    DEFAULT_BUCKETS = 4
+    DEFAULT_WINDOW = 60
+
+    def __init__(self, xblock_settings):
+        config = (xblock_settings or {}).get(self.SETTINGS_KEY) or {}
+        self.mode = config.get('mode', self.ALWAYS)
+        if self.mode not in (self.ALWAYS, self.COMPLETION, self.BUCKET, self.WINDOW):
+            self.mode = self.ALWAYS
+        self.buckets = parse_positive(config.get('buckets'), int, self.DEFAULT_BUCKETS)
+        self.window = parse_positive(config.get('window'), float, self.DEFAULT_WINDOW)
+
+    def _bucket(self, grade, max_grade):
+        """
+        Returns index of grade range `grade` falls into.
+        """
+        if not max_grade:
+            return 0
+        return int(grade / float(max_grade) * self.buckets)
+
+    def is_publish_due(  # pylint: disable=too-many-arguments
+            self, grade, published_grade, max_grade, completed, seconds_since_publish
+    ):
+        """
+        Checks if `grade` should be published now.
+
+        Arguments:
+            grade - current grade
+            published_grade - last published grade
+            max_grade - maximum grade
+            completed - whether the problem is completed
+            seconds_since_publish - seconds passed since last grade publish; None if grade was never published
+        """
+        if grade <= published_grade:
+            return False
+        if self.mode == self.ALWAYS or completed or grade >= max_grade:
+            return True
+        elif self.mode == self.BUCKET:
+            return self._bucket(grade, max_grade) != self._bucket(published_grade, max_grade)
+        elif self.mode == self.WINDOW:
+            return seconds_since_publish is None or seconds_since_publish >= self.window
+        return False
@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+"""
+Run benchmarks for the Drag and Drop V2 XBlock handlers.
+
+Like run_tests.py, this needs the xblock-sdk workbench settings.
+"""
+
+import logging
+import os
+import sys
+import workbench
+
+if __name__ == "__main__":
+    xblock_sdk_dir = os.path.dirname(os.path.dirname(workbench.__file__))
+    sys.path.append(xblock_sdk_dir)
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "workbench.settings")
+
+    # Silence too verbose logging, i.e. events logged by workbench runtime
+    logging.disable(logging.INFO)
+
+    import django
+    django.setup()
+
+    args = sys.argv[1:]
+    if args and args[0] == 'load':
+        from tests.benchmarks.load import main
+        main(args[1:])
+    elif args and args[0] == 'memory':
+        from tests.benchmarks.memory import main
+        main(args[1:])
+    elif args and args[0] == 'payload':
+        from tests.benchmarks.payload import main
+        main(args[1:])
+    elif args and args[0] == 'imports':
+        from tests.benchmarks.imports import main
+        main(args[1:])
+    else:
+        from tests.benchmarks.handlers import main
+        main(args)
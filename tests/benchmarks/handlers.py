@@ -0,0 +1,175 @@
+"""
+Benchmarks for Drag and Drop v2 XBlock handlers and views on synthetic problems of various sizes.
+
+Run via `python run_benchmarks.py`, see `python run_benchmarks.py --help` for options.
+"""
+import json
+import math
+import platform
+import time
+import unittest
+
+from drag_and_drop_v2.utils import Constants
+
+from ..generators import ProblemGenerator
+from ..utils import make_block, TestCaseMixin
+
+
+SIZES = (5, 50, 500, 5000)
+MODES = (Constants.STANDARD_MODE, Constants.ASSESSMENT_MODE)
+HANDLERS = ('drop_item', 'do_attempt', 'reset', 'show_answer', 'get_user_state', 'student_view', 'studio_view')
+
+# Handlers that are only available in assessment mode
+ASSESSMENT_ONLY_HANDLERS = ('do_attempt', 'show_answer')
+
+DEFAULT_ITERATIONS = 10
+DEFAULT_SEED = 0
+
+# Shape of generated problems, relative to problem size
+MULTI_ZONE_RATIO = 0.1
+DECOY_RATIO = 0.1
+IMAGE_RATIO = 0.1
+
+
+def _percentile(sorted_values, percentile):
+    """ Returns `percentile` of non-empty sorted list using nearest-rank method """
+    rank = int(math.ceil(percentile / 100.0 * len(sorted_values)))
+    return sorted_values[max(rank, 1) - 1]
+
+
+class HandlerBenchmark(TestCaseMixin, unittest.TestCase):
+    """
+    Times handler calls on a single block.
+
+    Reuses unit test helpers, so it is a TestCase, but it is not collected by test runners.
+    """
+    __test__ = False
+
+    def __init__(self, mode, size, seed=DEFAULT_SEED):
+        super(HandlerBenchmark, self).__init__()
+        self.mode = mode
+        self.size = size
+        self.generator = ProblemGenerator(seed)
+        self.patch_workbench()
+        self.apply_patch('workbench.runtime.WorkbenchRuntime.publish')
+        self.block = make_block()
+        self.block.data = self.generator.generate_data(
+            items=size, multi_zone_ratio=MULTI_ZONE_RATIO, decoy_ratio=DECOY_RATIO, image_ratio=IMAGE_RATIO
+        )
+        self.block.mode = mode
+        self.required_items = [item for item in self.block.data['items'] if item['zones']]
+
+    def runTest(self):
+        """ Benchmark is not meant to be run as a test """
+        pass
+
+    def _prepare(self, handler_name, iteration):
+        """
+        Brings block into a state where `handler_name` can be called, and returns a callable making the call.
+        """
+        self.block.attempts = 0
+        self.block.max_attempts = 0
+        self.block.item_state = self.generator.generate_item_state(self.block.data, completion=0.5)
+
+        if handler_name == 'drop_item':
+            item = self.required_items[iteration % len(self.required_items)]
+            data = {"val": item['id'], "zone": item['zones'][0]}
+            return lambda: self.call_handler(self.DROP_ITEM_HANDLER, data)
+        elif handler_name == 'do_attempt':
+            return lambda: self.call_handler(self.DO_ATTEMPT_HANDLER, {})
+        elif handler_name == 'reset':
+            return lambda: self.call_handler(self.RESET_HANDLER, {})
+        elif handler_name == 'show_answer':
+            self.block.attempts = self.block.max_attempts = 1
+            return lambda: self.call_handler(self.SHOW_ANSWER_HANDLER, {})
+        elif handler_name == 'get_user_state':
+            return lambda: self.call_handler(self.USER_STATE_HANDLER, method='GET')
+        else:
+            return lambda: self.block.runtime.render(self.block, handler_name, {})
+
+    def measure(self, handler_name, iterations):
+        """
+        Times `iterations` calls of `handler_name`. Returns timing statistics in milliseconds.
+        """
+        timings = []
+        for iteration in xrange(iterations):
+            call = self._prepare(handler_name, iteration)
+            started = time.time()
+            call()
+            timings.append((time.time() - started) * 1000)
+
+        timings.sort()
+        return {
+            "iterations": iterations,
+            "min_ms": timings[0],
+            "median_ms": _percentile(timings, 50),
+            "mean_ms": sum(timings) / len(timings),
+            "max_ms": timings[-1],
+        }
+
+
+def run_benchmarks(sizes=SIZES, modes=MODES, handlers=HANDLERS, iterations=DEFAULT_ITERATIONS, seed=DEFAULT_SEED):
+    """
+    Runs handler benchmarks, returns results as JSON-serializable dict.
+    """
+    results = []
+    for mode in modes:
+        for size in sizes:
+            benchmark = HandlerBenchmark(mode, size, seed)
+            try:
+                for handler_name in handlers:
+                    if handler_name in ASSESSMENT_ONLY_HANDLERS and mode != Constants.ASSESSMENT_MODE:
+                        continue
+                    result = {"mode": mode, "size": size, "handler": handler_name}
+                    result.update(benchmark.measure(handler_name, iterations))
+                    results.append(result)
+            finally:
+                benchmark.doCleanups()
+
+    return {
+        "python": platform.python_version(),
+        "timestamp": time.time(),
+        "seed": seed,
+        "results": results,
+    }
+
+
+def write_output(results, path):
+    """
+    Writes `results` as JSON into file at `path`, or to stdout if `path` is empty
+    """
+    output = json.dumps(results, indent=2, sort_keys=True)
+    if path:
+        with open(path, 'w') as output_file:
+            output_file.write(output)
+    else:
+        print output
+
+
+def main(argv=None):
+    """
+    Command line entry point
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark Drag and Drop v2 XBlock handlers.")
+    parser.add_argument(
+        '--sizes', default=','.join(str(size) for size in SIZES),
+        help="Comma-separated numbers of items and zones in generated problems"
+    )
+    parser.add_argument('--modes', default=','.join(MODES), help="Comma-separated problem modes")
+    parser.add_argument('--handlers', default=','.join(HANDLERS), help="Comma-separated handlers and views")
+    parser.add_argument('--iterations', type=int, default=DEFAULT_ITERATIONS, help="Calls per handler")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help="Problem generator seed")
+    parser.add_argument('--output', default=None, help="File to write JSON results to; stdout if omitted")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        sizes=[int(size) for size in args.sizes.split(',')],
+        modes=args.modes.split(','),
+        handlers=args.handlers.split(','),
+        iterations=args.iterations,
+        seed=args.seed,
+    )
+
+    write_output(results, args.output)
@@ -0,0 +1,65 @@
+"""
+Cold-start import benchmark for `drag_and_drop_v2` package.
+
+Each measurement imports the package in a fresh interpreter, so nothing is cached in `sys.modules`.
+Run via `python run_benchmarks.py imports`, see `python run_benchmarks.py imports --help` for options.
+"""
+import json
+import subprocess
+import sys
+
+from .handlers import _percentile, write_output
+
+
+DEFAULT_REPEAT = 10
+
+# Imported in fresh interpreter: measures import time and reports modules loaded by the import
+IMPORT_SCRIPT = """
+import json, sys, time
+before = set(sys.modules)
+started = time.time()
+import drag_and_drop_v2
+duration = time.time() - started
+# Python 2 records failed implicit relative imports as None entries - these are not modules
+modules = sorted(name for name in set(sys.modules) - before if sys.modules[name] is not None)
+print(json.dumps({"seconds": duration, "modules": modules}))
+"""
+
+
+def measure_import():
+    """
+    Imports `drag_and_drop_v2` in a fresh interpreter. Returns import duration and names of modules loaded.
+    """
+    output = subprocess.check_output([sys.executable, '-c', IMPORT_SCRIPT])
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run_import_benchmark(repeat=DEFAULT_REPEAT):
+    """
+    Measures cold import `repeat` times, returns results as JSON-serializable dict.
+    """
+    measurements = [measure_import() for __ in xrange(repeat)]
+    timings = sorted(measurement['seconds'] * 1000 for measurement in measurements)
+    modules = measurements[-1]['modules']
+    return {
+        'repeat': repeat,
+        'min_ms': timings[0],
+        'median_ms': _percentile(timings, 50),
+        'max_ms': timings[-1],
+        'modules_loaded': len(modules),
+        'package_modules': [name for name in modules if name.startswith('drag_and_drop_v2')],
+    }
+
+
+def main(argv=None):
+    """
+    Command line entry point
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Measure cold import time of drag_and_drop_v2 package.")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help="Number of fresh interpreters to use")
+    parser.add_argument('--output', default=None, help="File to write JSON results to; stdout if omitted")
+    args = parser.parse_args(argv)
+
+    write_output(run_import_benchmark(args.repeat), args.output)
@@ -0,0 +1,293 @@
+"""
+Multi-learner load test harness for Drag and Drop v2 XBlock.
+
+Simulates learners working through a generated problem - initial load, a sequence of drops, attempts and
+resets - against blocks running in an in-memory workbench runtime, using a thread or process pool.
+
+Run via `python run_benchmarks.py load`, see `python run_benchmarks.py load --help` for options.
+"""
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+import random
+import threading
+import time
+import unittest
+from collections import defaultdict
+
+from xblock.runtime import DictKeyValueStore
+
+from drag_and_drop_v2.utils import Constants
+
+from ..generators import ProblemGenerator
+from ..utils import make_block, reload_block, TestCaseMixin
+from .handlers import DEFAULT_SEED, DECOY_RATIO, MULTI_ZONE_RATIO, IMAGE_RATIO, _percentile, write_output
+
+
+DEFAULT_LEARNERS = 1000
+DEFAULT_WORKERS = 8
+DEFAULT_SIZE = 20
+DEFAULT_MAX_ATTEMPTS = 3
+
+# Probability of a drop going to a wrong zone, and of a learner resetting the problem mid-way
+WRONG_DROP_RATE = 0.2
+RESET_RATE = 0.1
+
+
+class CountingKeyValueStore(DictKeyValueStore):
+    """
+    DictKeyValueStore counting reads and writes
+    """
+    def __init__(self, storage=None):
+        super(CountingKeyValueStore, self).__init__(storage)
+        self.reads = 0
+        self.writes = 0
+        self._lock = threading.Lock()
+
+    def _count(self, reads=0, writes=0):
+        """ Updates counters """
+        with self._lock:
+            self.reads += reads
+            self.writes += writes
+
+    def get(self, key):
+        self._count(reads=1)
+        return super(CountingKeyValueStore, self).get(key)
+
+    def has(self, key):
+        self._count(reads=1)
+        return super(CountingKeyValueStore, self).has(key)
+
+    def set(self, key, value):
+        self._count(writes=1)
+        super(CountingKeyValueStore, self).set(key, value)
+
+    def set_many(self, other_dict):
+        self._count(writes=len(other_dict))
+        super(CountingKeyValueStore, self).set_many(other_dict)
+
+    def delete(self, key):
+        self._count(writes=1)
+        super(CountingKeyValueStore, self).delete(key)
+
+    def reset_counters(self):
+        """ Resets read and write counters """
+        with self._lock:
+            self.reads = self.writes = 0
+
+
+class LearnerSession(TestCaseMixin, unittest.TestCase):
+    """
+    Single learner working through a problem.
+
+    Each simulated request is handled by a new block instance, so that field reads are not served from values
+    cached by the block during earlier requests.
+
+    Reuses unit test helpers, so it is a TestCase, but it is not collected by test runners.
+    """
+    __test__ = False
+
+    def __init__(self, data, mode, seed, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        super(LearnerSession, self).__init__()
+        self.random = random.Random(seed)
+        self.data = data
+        self.mode = mode
+        self.key_store = CountingKeyValueStore()
+        self.block = make_block(self.key_store)
+        self.block.data = data
+        self.block.mode = mode
+        self.block.max_attempts = max_attempts
+        self.block.save()
+        self.key_store.reset_counters()
+        self.timings = []
+
+    def runTest(self):
+        """ Session is not meant to be run as a test """
+        pass
+
+    def _request(self, name, call, *args, **kwargs):
+        """
+        Calls `call` on a new block instance, recording its duration under `name`
+        """
+        self.block = reload_block(self.block, self.key_store)
+        started = time.time()
+        result = call(*args, **kwargs)
+        self.timings.append((name, (time.time() - started) * 1000))
+        return result
+
+    def _saved_state(self):
+        """
+        Returns block instance reading saved learner state without counting reads, for the simulation to inspect
+        """
+        return reload_block(self.block, DictKeyValueStore(self.key_store.db_dict))
+
+    def _render_student_view(self):
+        """ Renders student view of current block instance """
+        return self.block.runtime.render(self.block, 'student_view', {})
+
+    def _drop_items(self):
+        """ Drops items in random order, some of them into a wrong zone first """
+        zone_uids = [zone['uid'] for zone in self.data['zones']]
+        items = [item for item in self.data['items'] if item['zones']]
+        self.random.shuffle(items)
+        for item in items:
+            wrong_zones = [uid for uid in zone_uids if uid not in item['zones']]
+            if wrong_zones and self.random.random() < WRONG_DROP_RATE:
+                zone = self.random.choice(wrong_zones)
+                self._request('drop_item', self.call_handler, self.DROP_ITEM_HANDLER, {"val": item['id'], "zone": zone})
+            if self.mode == Constants.ASSESSMENT_MODE and self._saved_state().item_state.get(str(item['id'])):
+                continue  # Wrongly placed item stays in place until attempt is submitted
+            zone = self.random.choice(item['zones'])
+            self._request('drop_item', self.call_handler, self.DROP_ITEM_HANDLER, {"val": item['id'], "zone": zone})
+
+    def run_session(self):
+        """
+        Simulates learner session: initial load, drops, resets and attempts until problem is solved or
+        attempts are exhausted.
+        """
+        self._request('student_view', self._render_student_view)
+        self._request('get_user_state', self.call_handler, self.USER_STATE_HANDLER, method='GET')
+
+        if self.random.random() < RESET_RATE:
+            self._drop_items()
+            self._request('reset', self.call_handler, self.RESET_HANDLER, {})
+
+        if self.mode == Constants.STANDARD_MODE:
+            self._drop_items()
+            return
+
+        while self._saved_state().attempts_remain:
+            self._drop_items()
+            result = self._request('do_attempt', self.call_handler, self.DO_ATTEMPT_HANDLER, {})
+            if result['correct']:
+                return
+        self._request('show_answer', self.call_handler, self.SHOW_ANSWER_HANDLER, {})
+
+
+def _run_learner(args):
+    """
+    Pool worker: runs single learner session, returns its handler timings and KVS access counts
+    """
+    data, mode, seed = args
+    session = LearnerSession(data, mode, seed)
+    session.run_session()
+    return {
+        'timings': session.timings,
+        'reads': session.key_store.reads,
+        'writes': session.key_store.writes,
+    }
+
+
+class _Patches(TestCaseMixin, unittest.TestCase):
+    """ Holds workbench patches for the duration of load test """
+    __test__ = False
+
+    def runTest(self):
+        """ Not a test """
+        pass
+
+
+def run_load_test(
+        learners=DEFAULT_LEARNERS, workers=DEFAULT_WORKERS, size=DEFAULT_SIZE, mode=Constants.STANDARD_MODE,
+        processes=False, seed=DEFAULT_SEED
+):  # pylint: disable=too-many-arguments
+    """
+    Runs load test, returns report as JSON-serializable dict.
+
+    Arguments:
+        learners - number of simulated learners
+        workers - number of concurrent learners (pool size)
+        size - number of items and zones in generated problem
+        mode - problem mode
+        processes - use process pool instead of thread pool
+    """
+    data = ProblemGenerator(seed).generate_data(
+        items=size, multi_zone_ratio=MULTI_ZONE_RATIO, decoy_ratio=DECOY_RATIO, image_ratio=IMAGE_RATIO
+    )
+    tasks = [(data, mode, seed + learner) for learner in xrange(learners)]
+
+    # Patches must be applied once, before workers start: patching is not thread-safe
+    patches = _Patches()
+    patches.patch_workbench()
+    patches.apply_patch('workbench.runtime.WorkbenchRuntime.publish')
+    pool = multiprocessing.Pool(workers) if processes else ThreadPool(workers)
+    try:
+        started = time.time()
+        results = pool.map(_run_learner, tasks)
+        duration = time.time() - started
+    finally:
+        pool.close()
+        pool.join()
+        patches.doCleanups()
+
+    report = {
+        'learners': learners,
+        'workers': workers,
+        'pool': 'process' if processes else 'thread',
+        'size': size,
+        'mode': mode,
+        'seed': seed,
+    }
+    report.update(_summarize(results, duration, learners))
+    return report
+
+
+def _summarize(results, duration, learners):
+    """
+    Aggregates learner session results into throughput, latency and KVS access statistics
+    """
+    timings = defaultdict(list)
+    for result in results:
+        for handler_name, duration_ms in result['timings']:
+            timings[handler_name].append(duration_ms)
+    calls = sum(len(handler_timings) for handler_timings in timings.values())
+    reads = sum(result['reads'] for result in results)
+    writes = sum(result['writes'] for result in results)
+
+    handlers = {}
+    for handler_name, handler_timings in timings.iteritems():
+        handler_timings.sort()
+        handlers[handler_name] = {
+            'calls': len(handler_timings),
+            'p50_ms': _percentile(handler_timings, 50),
+            'p99_ms': _percentile(handler_timings, 99),
+        }
+
+    return {
+        'duration_s': duration,
+        'calls': calls,
+        'calls_per_second': calls / duration,
+        'learners_per_second': learners / duration,
+        'handlers': handlers,
+        'kvs': {
+            'reads': reads,
+            'writes': writes,
+            'reads_per_learner': reads / float(learners),
+            'writes_per_learner': writes / float(learners),
+        },
+    }
+
+
+def main(argv=None):
+    """
+    Command line entry point
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Simulate learners working through Drag and Drop v2 problem.")
+    parser.add_argument('--learners', type=int, default=DEFAULT_LEARNERS, help="Number of simulated learners")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help="Number of concurrent learners")
+    parser.add_argument('--size', type=int, default=DEFAULT_SIZE, help="Number of items and zones in the problem")
+    parser.add_argument(
+        '--mode', default=Constants.STANDARD_MODE, choices=[Constants.STANDARD_MODE, Constants.ASSESSMENT_MODE]
+    )
+    parser.add_argument('--processes', action='store_true', help="Use process pool instead of thread pool")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help="Problem generator seed")
+    parser.add_argument('--output', default=None, help="File to write JSON report to; stdout if omitted")
+    args = parser.parse_args(argv)
+
+    report = run_load_test(
+        learners=args.learners, workers=args.workers, size=args.size, mode=args.mode,
+        processes=args.processes, seed=args.seed,
+    )
+
+    write_output(report, args.output)
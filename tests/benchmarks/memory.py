@@ -0,0 +1,130 @@
+"""
+Memory allocation measurements for Drag and Drop v2 XBlock handlers.
+
+Measurements count objects tracked by the garbage collector (dicts, lists, instances etc. - the bulk of what
+handlers allocate), which works on every Python version. The collector is disabled during each call, so that
+its allocation counter is only decreased when objects are freed:
+
+    * peak_objects - the largest number of objects allocated during the call and alive at the same time
+    * allocated_objects - objects allocated during the call; a lower bound, since objects allocated and freed
+      between two consecutive function calls or returns cancel out
+    * retained_bytes - shallow size of objects allocated during the call and still alive after it,
+      response included
+    * garbage_objects - objects left in reference cycles once the response is released, which are only freed
+      by the garbage collector
+
+Run via `python run_benchmarks.py memory`, see `python run_benchmarks.py memory --help` for options.
+"""
+import gc
+import sys
+
+from .handlers import write_output
+from .scenarios import PROBLEMS, ProblemScenario, load_budgets as _load_budgets, make_budgets_parser, save_budgets
+
+
+BUDGETS_FILENAME = 'memory_budgets.json'
+
+# Budgets store measured values as they are; exact object counts change with Python, XBlock and Django releases,
+# so measurements may exceed them by this fraction...
+BUDGET_TOLERANCE = 0.25
+# ... or by this many objects or bytes, whichever is more, so that small values don't fail on a few extra objects
+BUDGET_MIN_TOLERANCE = {
+    'peak_objects': 50,
+    'allocated_objects': 50,
+    'retained_bytes': 4096,
+    'garbage_objects': 50,
+}
+
+
+def load_budgets():
+    """ Loads stored memory budgets """
+    return _load_budgets(BUDGETS_FILENAME)
+
+
+def budget_limit(metric, budget):
+    """
+    Returns the largest acceptable measurement of `metric` with stored `budget`
+    """
+    return max(int(budget * (1 + BUDGET_TOLERANCE)), budget + BUDGET_MIN_TOLERANCE[metric])
+
+
+class AllocationCounter(object):
+    """
+    Samples the garbage collector's allocation counter on every function call and return, via a profile hook.
+    """
+
+    def __init__(self):
+        self.peak = 0
+        self.allocated = 0
+        self._last = 0
+
+    def __call__(self, _frame, _event, _arg):
+        count = gc.get_count()[0]
+        if count > self._last:
+            self.allocated += count - self._last
+        self.peak = max(self.peak, count)
+        self._last = count
+
+
+def measure_call(call):
+    """
+    Measures memory allocated by calling `call`; returns dict of the metrics described in the module docstring.
+    """
+    gc.collect()
+    gc.disable()
+    try:
+        # Holding on to existing objects keeps their IDs from being reused by objects allocated during the call
+        existing_objects = gc.get_objects()
+        existing_ids = set(id(obj) for obj in existing_objects)
+        counter = AllocationCounter()
+        gc.collect()  # Resets the allocation counter
+        sys.setprofile(counter)
+        try:
+            response = call()
+        finally:
+            sys.setprofile(None)
+        retained_bytes = sum(
+            sys.getsizeof(obj) for obj in gc.get_objects()
+            if id(obj) not in existing_ids and obj is not existing_objects and obj is not existing_ids
+        )
+        del response
+        garbage_objects = gc.collect()
+    finally:
+        gc.enable()
+    return {
+        'peak_objects': counter.peak,
+        'allocated_objects': counter.allocated,
+        'retained_bytes': retained_bytes,
+        'garbage_objects': garbage_objects,
+    }
+
+
+def measure_memory(problem):
+    """
+    Measures memory allocated by each handler on canonical `problem`.
+
+    Returns dict mapping handler name to the metrics described in the module docstring.
+    """
+    scenario = ProblemScenario(problem)
+    results = {}
+    try:
+        for handler_name in scenario.handlers:
+            # Warm up: first call populates caches and imports modules lazily
+            scenario.prepare(handler_name)()
+            results[handler_name] = measure_call(scenario.prepare(handler_name))
+    finally:
+        scenario.doCleanups()
+    return results
+
+
+def main(argv=None):
+    """
+    Command line entry point
+    """
+    parser = make_budgets_parser("Measure memory allocated by Drag and Drop v2 XBlock handlers.")
+    args = parser.parse_args(argv)
+
+    results = {problem: measure_memory(problem) for problem in PROBLEMS}
+    if args.update_budgets:
+        save_budgets(BUDGETS_FILENAME, results)
+    write_output(results, args.output)
@@ -0,0 +1,54 @@
+"""
+Serialized sizes of Drag and Drop v2 XBlock configuration and handler responses.
+
+Run via `python run_benchmarks.py payload`, see `python run_benchmarks.py payload --help` for options.
+"""
+import json
+
+from .handlers import write_output
+from .scenarios import PROBLEMS, ProblemScenario, load_budgets as _load_budgets, make_budgets_parser, save_budgets
+
+
+BUDGETS_FILENAME = 'payload_budgets.json'
+
+# Headroom added on top of measured values when budgets are updated
+BUDGET_HEADROOM = 1.1
+
+# Handler responses measured, in addition to `initialize_js` configuration payload
+PAYLOAD_HANDLERS = ('get_user_state', 'drop_item', 'do_attempt')
+
+
+def load_budgets():
+    """ Loads stored payload size budgets """
+    return _load_budgets(BUDGETS_FILENAME)
+
+
+def measure_payloads(problem):
+    """
+    Measures serialized sizes of `initialize_js` configuration and handler responses on canonical `problem`.
+
+    Returns dict mapping payload name to {'bytes': size}.
+    """
+    scenario = ProblemScenario(problem)
+    try:
+        results = {'initialize_js': {'bytes': len(json.dumps(scenario.block.get_configuration()))}}
+        for handler_name in scenario.handlers:
+            if handler_name in PAYLOAD_HANDLERS:
+                response = scenario.prepare(handler_name)()
+                results[handler_name] = {'bytes': len(response.body)}
+    finally:
+        scenario.doCleanups()
+    return results
+
+
+def main(argv=None):
+    """
+    Command line entry point
+    """
+    parser = make_budgets_parser("Measure Drag and Drop v2 XBlock payload sizes.", BUDGET_HEADROOM)
+    args = parser.parse_args(argv)
+
+    results = {problem: measure_payloads(problem) for problem in PROBLEMS}
+    if args.update_budgets:
+        save_budgets(BUDGETS_FILENAME, results, BUDGET_HEADROOM)
+    write_output(results, args.output)
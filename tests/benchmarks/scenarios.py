@@ -0,0 +1,144 @@
+"""
+Canonical problems for memory and payload size budgets: the default problem and unit test fixtures.
+"""
+import json
+import os
+import unittest
+
+from xblock.runtime import DictKeyValueStore
+from xblockutils.resources import ResourceLoader
+
+from drag_and_drop_v2.utils import Constants
+
+from ..generators import ProblemGenerator
+from ..utils import make_block, make_request, reload_block, TestCaseMixin
+
+
+# Unit test fixtures live in tests/unit/data
+loader = ResourceLoader('tests.unit')
+
+DEFAULT = 'default'
+PROBLEMS = (DEFAULT, 'plain', 'html', 'assessment', 'old')
+
+BUDGETS_DIR = os.path.join(os.path.dirname(__file__), 'data')
+
+HANDLERS = ('student_view', 'get_user_state', 'drop_item', 'do_attempt', 'reset', 'show_answer')
+ASSESSMENT_ONLY_HANDLERS = ('do_attempt', 'show_answer')
+
+
+class ProblemScenario(TestCaseMixin, unittest.TestCase):
+    """
+    Block set up with one of the canonical problems, able to call each handler in a representative state.
+
+    Reuses unit test helpers, so it is a TestCase, but it is not collected by test runners.
+    """
+    __test__ = False
+
+    def __init__(self, problem):
+        super(ProblemScenario, self).__init__()
+        self.problem = problem
+        self.patch_workbench()
+        self.apply_patch('workbench.runtime.WorkbenchRuntime.publish')
+        self.key_store = DictKeyValueStore()
+        self.block = make_block(self.key_store)
+        if problem != DEFAULT:
+            for field, value in self._load('settings').iteritems():
+                setattr(self.block, field, value)
+            self.block.data = self._load('data')
+
+    def runTest(self):
+        """ Scenario is not meant to be run as a test """
+        pass
+
+    def _load(self, name):
+        """ Loads fixture file """
+        return json.loads(loader.load_unicode('data/{}/{}.json'.format(self.problem, name)))
+
+    @property
+    def handlers(self):
+        """ Handlers and views available in problem's mode """
+        if self.block.mode == Constants.ASSESSMENT_MODE:
+            return HANDLERS
+        return tuple(handler for handler in HANDLERS if handler not in ASSESSMENT_ONLY_HANDLERS)
+
+    def _first_item_drop(self):
+        """ Returns drop_item payload placing first non-decoy item into its zone """
+        item = next(item for item in self.block.data['items'] if ProblemGenerator.item_zones(item))
+        return {"val": item['id'], "zone": ProblemGenerator.item_zones(item)[0]}
+
+    def prepare(self, handler_name):
+        """
+        Resets block into a state where `handler_name` can be called, and returns a callable making the call.
+        The callable returns handler response or rendered fragment.
+
+        The call is made on a new block instance, which reads all fields from the key value store, as it would
+        in a new request.
+        """
+        first_item_drop = self._first_item_drop()
+        self.block.item_state = {}
+        self.block.attempts = 0
+        self.block.completed = False
+        self._reload()
+
+        if handler_name == 'student_view':
+            return lambda: self.block.runtime.render(self.block, 'student_view', {})
+        elif handler_name == 'get_user_state':
+            return self._handler_call(self.USER_STATE_HANDLER, method='GET')
+        elif handler_name == 'drop_item':
+            return self._handler_call(self.DROP_ITEM_HANDLER, first_item_drop)
+        elif handler_name == 'show_answer':
+            self.block.attempts = self.block.max_attempts
+            self._reload()
+            return self._handler_call(self.SHOW_ANSWER_HANDLER, {})
+
+        self.call_handler(self.DROP_ITEM_HANDLER, first_item_drop)
+        self._reload()
+        return self._handler_call(handler_name, {})
+
+    def _reload(self):
+        """ Saves block state and replaces block with a new instance, which has no field values cached """
+        self.block.save()
+        self.block = reload_block(self.block, self.key_store)
+
+    def _handler_call(self, handler_name, data=None, method='POST'):
+        """ Returns callable invoking handler and returning its raw response """
+        return lambda: self.block.handle(handler_name, make_request(data, method=method))
+
+
+def load_budgets(filename):
+    """ Loads budgets stored in `filename` in budgets directory """
+    with open(os.path.join(BUDGETS_DIR, filename)) as budgets_file:
+        return json.load(budgets_file)
+
+
+def save_budgets(filename, results, headroom=1):
+    """
+    Stores measured `results` ({problem: {name: {metric: value}}}), increased by `headroom` factor, as budgets
+    """
+    budgets = {
+        problem: {
+            name: {metric: int(value * headroom) for metric, value in metrics.items()}
+            for name, metrics in problem_results.items()
+        }
+        for problem, problem_results in results.items()
+    }
+    with open(os.path.join(BUDGETS_DIR, filename), 'w') as budgets_file:
+        json.dump(budgets, budgets_file, indent=2, sort_keys=True, separators=(',', ': '))
+        budgets_file.write('\n')
+
+
+def make_budgets_parser(description, headroom=1):
+    """
+    Returns command line parser for budgeted measurements
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        '--update-budgets', action='store_true',
+        help="Store measured values{} as new budgets".format(
+            ", plus {:.0%} headroom,".format(headroom - 1) if headroom > 1 else ""
+        )
+    )
+    parser.add_argument('--output', default=None, help="File to write JSON results to; stdout if omitted")
+    return parser
@@ -0,0 +1,20 @@
+import unittest
+
+from drag_and_drop_v2.utils import Constants
+
+from .handlers import HANDLERS, ASSESSMENT_ONLY_HANDLERS, run_benchmarks
+
+
+class HandlerBenchmarksTest(unittest.TestCase):
+    """ Smoke test making sure benchmarks keep working as the block evolves """
+
+    def test_run_benchmarks(self):
+        results = run_benchmarks(sizes=[5], iterations=2)['results']
+
+        standard = [result['handler'] for result in results if result['mode'] == Constants.STANDARD_MODE]
+        assessment = [result['handler'] for result in results if result['mode'] == Constants.ASSESSMENT_MODE]
+        self.assertEqual(standard, [handler for handler in HANDLERS if handler not in ASSESSMENT_ONLY_HANDLERS])
+        self.assertEqual(assessment, list(HANDLERS))
+        for result in results:
+            self.assertEqual(result['iterations'], 2)
+            self.assertLessEqual(result['min_ms'], result['max_ms'])
@@ -0,0 +1,19 @@
+import unittest
+
+from .imports import measure_import
+
+
+class ColdImportTest(unittest.TestCase):
+    """ Makes sure modules needed only by specific handlers are not loaded on package import """
+
+    LAZY_MODULES = (
+        'cProfile', 'static_replace', 'PIL', 'rcssmin', 'rjsmin',
+        'drag_and_drop_v2.assets', 'drag_and_drop_v2.definition', 'drag_and_drop_v2.field_access',
+        'drag_and_drop_v2.images', 'drag_and_drop_v2.template_cache',
+    )
+
+    def test_lazy_modules_not_imported(self):
+        modules = measure_import()['modules']
+        self.assertIn('drag_and_drop_v2.drag_and_drop_v2', modules)
+        for module_name in self.LAZY_MODULES:
+            self.assertNotIn(module_name, modules)
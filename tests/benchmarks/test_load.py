@@ -0,0 +1,31 @@
+import ddt
+import unittest
+
+from drag_and_drop_v2.utils import Constants
+
+from .load import CountingKeyValueStore, run_load_test
+
+
+@ddt.ddt
+class LoadTest(unittest.TestCase):
+    """ Smoke test for load test harness """
+
+    def test_counting_key_value_store(self):
+        store = CountingKeyValueStore()
+        store.set('a', 1)
+        store.set_many({'b': 2, 'c': 3})
+        self.assertTrue(store.has('a'))
+        self.assertEqual(store.get('b'), 2)
+        store.delete('c')
+        self.assertEqual((store.reads, store.writes), (2, 4))
+
+    @ddt.data(Constants.STANDARD_MODE, Constants.ASSESSMENT_MODE)
+    def test_run_load_test(self, mode):
+        report = run_load_test(learners=4, workers=2, size=5, mode=mode)
+
+        self.assertEqual(report['handlers']['student_view']['calls'], 4)
+        self.assertEqual(report['handlers']['get_user_state']['calls'], 4)
+        self.assertGreaterEqual(report['handlers']['drop_item']['calls'], 4 * 4)
+        self.assertEqual(report['calls'], sum(handler['calls'] for handler in report['handlers'].values()))
+        self.assertGreater(report['kvs']['reads'], 0)
+        self.assertGreater(report['kvs']['writes'], 0)
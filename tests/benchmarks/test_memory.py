@@ -0,0 +1,36 @@
+import ddt
+import unittest
+
+from .memory import budget_limit, load_budgets, measure_memory
+from .scenarios import PROBLEMS, ProblemScenario
+
+
+@ddt.ddt
+class MemoryBudgetsTest(unittest.TestCase):
+    """ Fails when memory allocated by handlers exceeds stored budgets by more than the tolerance """
+
+    def test_budgets_cover_all_handlers(self):
+        budgets = load_budgets()
+        for problem in PROBLEMS:
+            scenario = ProblemScenario(problem)
+            scenario.doCleanups()
+            self.assertEqual(sorted(budgets[problem]), sorted(scenario.handlers))
+
+    @ddt.data(*PROBLEMS)
+    def test_budgets(self, problem):
+        budgets = load_budgets()[problem]
+        for handler_name, usage in measure_memory(problem).items():
+            for key, value in usage.items():
+                limit = budget_limit(key, budgets[handler_name][key])
+                self.assertLessEqual(
+                    value, limit,
+                    "{} {} {} is over budget: {} > {} (budget {})".format(
+                        problem, handler_name, key, value, limit, budgets[handler_name][key]
+                    )
+                )
+
+    def test_budget_limit(self):
+        self.assertEqual(budget_limit('allocated_objects', 1000), 1250)
+        self.assertEqual(budget_limit('allocated_objects', 100), 150)
+        self.assertEqual(budget_limit('garbage_objects', 0), 50)
+        self.assertEqual(budget_limit('retained_bytes', 100000), 125000)
@@ -0,0 +1,22 @@
+import ddt
+import unittest
+
+from .payload import load_budgets, measure_payloads
+from .scenarios import PROBLEMS
+
+
+@ddt.ddt
+class PayloadBudgetsTest(unittest.TestCase):
+    """ Fails when configuration or handler responses grow over stored budgets """
+
+    @ddt.data(*PROBLEMS)
+    def test_budgets(self, problem):
+        budgets = load_budgets()[problem]
+        payloads = measure_payloads(problem)
+
+        self.assertEqual(sorted(payloads), sorted(budgets))
+        for name, size in payloads.items():
+            self.assertLessEqual(
+                size['bytes'], budgets[name]['bytes'],
+                "{} {} is over budget: {} > {} bytes".format(problem, name, size['bytes'], budgets[name]['bytes'])
+            )
@@ -0,0 +1,158 @@
+"""
+Seeded generator of synthetic Drag and Drop v2 problems and learner states.
+
+Used to drive benchmarks, load and scaling tests. Same seed and arguments always produce the same output.
+"""
+import math
+import random
+
+
+class ProblemGenerator(object):
+    """
+    Generates problem `data` dicts and matching `item_state` snapshots.
+
+    Usage:
+        generator = ProblemGenerator(seed=42)
+        data = generator.generate_data(items=50, zones=10, multi_zone_ratio=0.2, decoy_ratio=0.1)
+        item_state = generator.generate_item_state(data, completion=0.5, correctness=0.8)
+    """
+    ZONE_SIZE = 50
+    MAX_ZONES_PER_ITEM = 3
+
+    def __init__(self, seed=0):
+        self.random = random.Random(seed)
+
+    def generate_data(
+            self, items=5, zones=None, multi_zone_ratio=0.0, decoy_ratio=0.0, image_ratio=0.0, legacy=False
+    ):  # pylint: disable=too-many-arguments,too-many-locals
+        """
+        Generates problem data with `items` items and `zones` zones (same number as items if omitted).
+
+        Arguments:
+            multi_zone_ratio - fraction of non-decoy items accepted by more than one zone
+            decoy_ratio - fraction of items that do not belong to any zone
+            image_ratio - fraction of items displayed as images
+            legacy - emit v1 data format: zones identified by title, items with single `zone` instead of `zones`.
+                Multiple zones per item are not supported by v1 format, so `multi_zone_ratio` is ignored.
+        """
+        zones = items if zones is None else zones
+        zone_list = [self._make_zone(index, zones, legacy) for index in xrange(zones)]
+        zone_uids = [self.zone_uid(zone) for zone in zone_list]
+
+        item_ids = range(items)
+        decoys = set(self.random.sample(item_ids, self._count(items, decoy_ratio)))
+        required = [item_id for item_id in item_ids if item_id not in decoys]
+        multi_zone = set() if legacy else set(
+            self.random.sample(required, self._count(len(required), multi_zone_ratio))
+        )
+        images = set(self.random.sample(item_ids, self._count(items, image_ratio)))
+
+        item_list = []
+        for item_id in item_ids:
+            if item_id in decoys or not zone_uids:
+                item_zones = []
+            elif item_id in multi_zone:
+                count = self.random.randint(2, min(self.MAX_ZONES_PER_ITEM, len(zone_uids)))
+                item_zones = self.random.sample(zone_uids, count)
+            else:
+                item_zones = [zone_uids[item_id % len(zone_uids)]]
+            item_list.append(self._make_item(item_id, item_zones, item_id in images, legacy))
+
+        return {
+            "targetImgDescription": "Generated target image",
+            "zones": zone_list,
+            "items": item_list,
+            "feedback": {"start": "Start", "finish": "Finish"},
+        }
+
+    # pylint: disable=too-many-locals
+    def generate_item_state(self, data, completion=1.0, correctness=1.0, legacy=False):
+        """
+        Generates `item_state` for problem `data`.
+
+        Arguments:
+            completion - fraction of non-decoy items placed on the board
+            correctness - fraction of placed items placed into a correct zone. Only correctly placed items are
+                stored in standard mode, so this should be 1.0 for standard mode problems.
+            legacy - emit v1.5 item state: items positioned with `top`/`left` and no zone or correctness info.
+                Legacy state can only represent items placed into their first zone, so `correctness` is ignored.
+        """
+        zone_uids = [self.zone_uid(zone) for zone in data['zones']]
+        required = [item for item in data['items'] if self.item_zones(item)]
+        placed = self.random.sample(required, self._count(len(required), completion))
+        incorrect = set(
+            item['id'] for item in self.random.sample(placed, len(placed) - self._count(len(placed), correctness))
+        )
+
+        item_state = {}
+        for item in placed:
+            item_zones = self.item_zones(item)
+            if legacy:
+                state = {'top': '{}px'.format(self.random.randint(0, 500)), 'left': '{}px'.format(item['id'])}
+            elif item['id'] in incorrect and len(item_zones) < len(zone_uids):
+                wrong_zones = [uid for uid in zone_uids if uid not in item_zones]
+                state = {'zone': self.random.choice(wrong_zones), 'correct': False}
+            else:
+                state = {'zone': self.random.choice(item_zones), 'correct': True}
+            item_state[str(item['id'])] = state
+
+        return item_state
+
+    @staticmethod
+    def zone_uid(zone):
+        """ Returns zone UID for both current and legacy zone formats """
+        return zone.get('uid', zone.get('title'))
+
+    @staticmethod
+    def item_zones(item):
+        """ Returns zones accepting `item` for both current and legacy item formats """
+        if item.get('zones') is not None:
+            return item['zones']
+        zone = item.get('zone')
+        return [zone] if zone is not None and zone != 'none' else []
+
+    @staticmethod
+    def _count(total, ratio):
+        """ Returns number of elements out of `total` corresponding to `ratio` """
+        return int(round(total * min(max(ratio, 0.0), 1.0)))
+
+    def _make_zone(self, index, total, legacy):
+        """ Makes zone definition; zones are laid out in a grid """
+        columns = int(math.ceil(math.sqrt(total)))
+        zone = {
+            "title": "Zone {}".format(index),
+            "x": (index % columns) * self.ZONE_SIZE,
+            "y": (index // columns) * self.ZONE_SIZE,
+            "width": self.ZONE_SIZE,
+            "height": self.ZONE_SIZE,
+        }
+        if legacy:
+            zone.update({"id": "zone-{}".format(index), "index": index + 1})
+        else:
+            zone.update({
+                "uid": "zone-{}".format(index),
+                "description": "Description of zone {}".format(index),
+                "align": self.random.choice(["left", "center", "right"]),
+            })
+        return zone
+
+    @staticmethod
+    def _make_item(item_id, item_zones, is_image, legacy):
+        """ Makes item definition """
+        item = {
+            "id": item_id,
+            "displayName": "Item {}".format(item_id),
+            "imageURL": "/static/item-{}.png".format(item_id) if is_image else "",
+            "feedback": {
+                "correct": "Correct {}".format(item_id) if item_zones else "",
+                "incorrect": "Incorrect {}".format(item_id),
+            },
+        }
+        if is_image:
+            item["imageDescription"] = "Image of item {}".format(item_id)
+        if legacy:
+            item["zone"] = item_zones[0] if item_zones else "none"
+            item["size"] = {"width": "190px", "height": "auto"}
+        else:
+            item["zones"] = item_zones
+        return item
@@ -180,6 +180,16 @@ class BaseIntegrationTest(SeleniumBaseTest):
             return self.browser.execute_script("return typeof(jQuery)!='undefined' && jQuery.active==0")
 
         EmptyPromise(is_ajax_finished, "Finished waiting for ajax requests.", timeout=timeout).fulfill()
+        self.flush_renders()
+
+    def flush_renders(self):
+        """
+        Render state changes that the blocks on the page have scheduled for the next animation frame.
+        """
+        self.browser.execute_script(
+            "if (typeof(DragAndDropBlock) != 'undefined' && DragAndDropBlock.flushRenders) "
+            "{ DragAndDropBlock.flushRenders(); }"
+        )
 
 
 class DefaultDataTestMixin(object):
@@ -0,0 +1,86 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import build_assets
+from drag_and_drop_v2 import assets
+from drag_and_drop_v2.drag_and_drop_v2 import loader
+
+from ..utils import make_block, TestCaseMixin
+
+
+class AssetBundlesTest(TestCaseMixin, unittest.TestCase):
+    """ Tests for static asset bundles """
+
+    def setUp(self):
+        self.block = make_block()
+        self.patch_workbench()
+        self.patch_xblock_settings()
+
+    def _resource_urls(self, mimetype):
+        fragment = self.block.student_view({})
+        return [resource.data for resource in fragment.resources if resource.mimetype == mimetype]
+
+    def test_bundles_up_to_date(self):
+        # Run `python build_assets.py` after changing learner view CSS or JS
+        self.assertEqual(assets.load_manifest(loader)['sources_hash'], build_assets.sources_hash())
+
+    def test_student_view_uses_bundles(self):
+        bundles = assets.load_manifest(loader)['bundles']
+        self.assertEqual(
+            self._resource_urls('text/css'),
+            ['/expanded/url/to/drag_and_drop_v2/' + bundles['student_view.css']]
+        )
+        self.assertEqual(
+            self._resource_urls('application/javascript'),
+            ['/expanded/url/to/drag_and_drop_v2/' + bundles['student_view.js']]
+        )
+
+    def test_debug_assets(self):
+        self.xblock_settings = {'debug_assets': True}
+        self.assertEqual(
+            self._resource_urls('application/javascript'),
+            ['/expanded/url/to/drag_and_drop_v2/' + path for path in assets.STUDENT_VIEW_JS]
+        )
+
+    def test_missing_manifest(self):
+        self.apply_patch('drag_and_drop_v2.assets._MANIFEST_CACHE', {'manifest': {}})
+        self.assertEqual(
+            self._resource_urls('text/css'),
+            ['/expanded/url/to/drag_and_drop_v2/' + path for path in assets.STUDENT_VIEW_CSS]
+        )
+
+    def test_rewrite_css_urls(self):
+        css = (
+            'a{background:url("images/a.png")} b{background:url(../img/b.png)} '
+            'c{background:url(data:image/png;base64,AAAA)} d{background:url(\'/static/d.png\')}'
+        )
+        self.assertEqual(
+            build_assets.rewrite_css_urls(css, 'public/css/vendor/x.css', 'public/bundles/y.css'),
+            'a{background:url("../css/vendor/images/a.png")} b{background:url(../css/img/b.png)} '
+            'c{background:url(data:image/png;base64,AAAA)} d{background:url(\'/static/d.png\')}'
+        )
+
+    def test_build_bundles(self):
+        package_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, package_dir)
+        for path in assets.STUDENT_VIEW_CSS + assets.STUDENT_VIEW_JS:
+            source_dir = os.path.join(package_dir, os.path.dirname(path))
+            if not os.path.isdir(source_dir):
+                os.makedirs(source_dir)
+            shutil.copy(os.path.join(assets.PACKAGE_DIR, path), os.path.join(package_dir, path))
+        stale_bundle = os.path.join(package_dir, assets.BUNDLES_DIR, 'student_view.0123456789ab.js')
+        os.makedirs(os.path.dirname(stale_bundle))
+        open(stale_bundle, 'w').close()
+
+        manifest = build_assets.build_bundles(package_dir)
+
+        self.assertEqual(sorted(manifest['bundles']), ['student_view.css', 'student_view.js'])
+        self.assertEqual(manifest['sources_hash'], build_assets.sources_hash(package_dir))
+        self.assertEqual(
+            sorted(os.listdir(os.path.join(package_dir, assets.BUNDLES_DIR))),
+            sorted(['manifest.json'] + [os.path.basename(path) for path in manifest['bundles'].values()])
+        )
+        with open(os.path.join(package_dir, manifest['bundles']['student_view.js'])) as bundle:
+            self.assertIn('DragAndDropBlock', bundle.read())
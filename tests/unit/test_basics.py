@@ -1,3 +1,4 @@
+# -*- coding: utf-8 -*-
 import ddt
 import unittest
 
@@ -47,6 +48,14 @@ class BasicTests(TestCaseMixin, unittest.TestCase):
         self.assertIn('<section class="themed-xblock xblock--drag-and-drop">', student_fragment.content)
         self.assertIn('Loading drag and drop problem.', student_fragment.content)
 
+    def test_studio_view_data(self):
+        self.block.data = dict(DEFAULT_DATA, feedback={"start": u"Début", "finish": u"Fin"})
+        studio_fragment = self.block.runtime.render(self.block, 'studio_view', {})
+        # Problem data is sent to the editor only once, via initialize_js arguments
+        self.assertEqual(studio_fragment.content.count('"targetImgDescription"'), 1)
+        self.assertNotIn('%22targetImgDescription%22', studio_fragment.content)
+        self.assertNotIn('D%C3%A9but', studio_fragment.content)
+
     def test_get_configuration(self):
         """
         Test the get_configuration() method.
@@ -67,11 +76,29 @@ class BasicTests(TestCaseMixin, unittest.TestCase):
             "show_problem_header": True,
             "target_img_expanded_url": '/expanded/url/to/drag_and_drop_v2/public/img/triangle.png',
             "target_img_description": TARGET_IMG_DESCRIPTION,
+            "target_img_width": 514,
+            "target_img_height": 486,
+            "target_img_variants": [],
+            "item_sprite": None,
             "item_background_color": None,
             "item_text_color": None,
             "url_name": "",
         })
-        self.assertEqual(zones, DEFAULT_DATA["zones"])
+        # Zone geometry is converted to percentages of the default target image size (514x486):
+        self.assertEqual(zones, [
+            {
+                "uid": zone["uid"],
+                "title": zone["title"],
+                "description": zone["description"],
+                "align": zone["align"],
+                "prefixed_uid": "-" + zone["uid"],
+                "x_percent": round(zone["x"] / 514.0 * 100, 4),
+                "y_percent": round(zone["y"] / 486.0 * 100, 4),
+                "width_percent": round(zone["width"] / 514.0 * 100, 4),
+                "height_percent": round(zone["height"] / 486.0 * 100, 4),
+            }
+            for zone in DEFAULT_DATA["zones"]
+        ])
         # Items should contain no answer data:
         self.assertEqual(items, [
             {"id": i, "displayName": display_name, "imageURL": "", "expandedImageURL": ""}
@@ -238,3 +265,17 @@ class BasicTests(TestCaseMixin, unittest.TestCase):
             self.block.get_configuration()["target_img_expanded_url"],
             '/course/test-course/assets/foo.png',
         )
+
+    def test_image_dimensions(self):
+        """ Ensure that target image dimensions are only sent when known """
+        self.block.data["targetImg"] = "/static/foo.png"
+        config = self.block.get_configuration()
+        self.assertEqual((config["target_img_width"], config["target_img_height"]), (None, None))
+
+        self.block.data.update(targetImgWidth=800, targetImgHeight=600)
+        config = self.block.get_configuration()
+        self.assertEqual((config["target_img_width"], config["target_img_height"]), (800, 600))
+
+        self.block.data.update(targetImgWidth=0)
+        config = self.block.get_configuration()
+        self.assertEqual((config["target_img_width"], config["target_img_height"]), (None, None))
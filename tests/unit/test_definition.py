@@ -0,0 +1,87 @@
+import copy
+import unittest
+
+import mock
+
+from drag_and_drop_v2 import definition
+from drag_and_drop_v2.default_data import DEFAULT_DATA
+
+
+class CompileDefinitionTest(unittest.TestCase):
+    """ Tests for compiled learner-facing problem definitions """
+
+    def setUp(self):
+        patcher = mock.patch.dict(definition._CACHE, clear=True)  # pylint: disable=protected-access
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.data = copy.deepcopy(DEFAULT_DATA)
+
+    def test_cached_per_version(self):
+        compiled = definition.compile_definition(self.data, 'name', (514, 486))
+        self.assertIs(definition.compile_definition(copy.deepcopy(self.data), 'name', (514, 486)), compiled)
+        self.assertIsNot(definition.compile_definition(self.data, 'other', (514, 486)), compiled)
+
+        self.data['zones'][0]['x'] = 0
+        recompiled = definition.compile_definition(self.data, 'name', (514, 486))
+        self.assertNotEqual(recompiled.version, compiled.version)
+        self.assertEqual(recompiled.zones[0]['x_percent'], 0)
+
+    def test_cached_per_image_dimensions(self):
+        compiled = definition.compile_definition(self.data, 'name', (514, 486))
+        resized = definition.compile_definition(self.data, 'name', (1028, 972))
+        self.assertIsNot(resized, compiled)
+        self.assertAlmostEqual(resized.zones[0]['x_percent'], compiled.zones[0]['x_percent'] / 2, places=3)
+        self.assertEqual(definition.compile_definition(self.data, 'name', (None, None)).zones[0], dict(
+            self.data['zones'][0], prefixed_uid='name-' + self.data['zones'][0]['uid']
+        ))
+
+    def test_recorded_version(self):
+        with mock.patch.object(definition, 'definition_version', wraps=definition.definition_version) as version:
+            compiled = definition.compile_definition(self.data, 'name', (514, 486), version='recorded')
+            self.assertIs(definition.compile_definition(self.data, 'name', (514, 486), version='recorded'), compiled)
+        self.assertEqual(compiled.version, 'recorded')
+        self.assertFalse(version.called)
+
+    def test_least_recently_used_evicted(self):
+        with mock.patch.object(definition, 'CACHE_SIZE', 2):
+            first = definition.compile_definition(self.data, 'a', (514, 486))
+            definition.compile_definition(self.data, 'b', (514, 486))
+            self.assertIs(definition.compile_definition(self.data, 'a', (514, 486)), first)
+            definition.compile_definition(self.data, 'c', (514, 486))
+
+            self.assertEqual(len(definition._CACHE), 2)  # pylint: disable=protected-access
+            self.assertIs(definition.compile_definition(self.data, 'a', (514, 486)), first)
+            self.assertEqual(
+                [key[1] for key in definition._CACHE],  # pylint: disable=protected-access
+                ['c', 'a']
+            )
+
+    def test_zone_geometry(self):
+        self.data['zones'] = [
+            {'uid': 'zone 1', 'x': '100', 'y': 50, 'width': 200, 'height': 100},
+            {'uid': 'zone/2', 'x_percent': 1, 'y_percent': 2, 'width_percent': 3, 'height_percent': 4},
+            {'uid': 'zone 3', 'x': 'invalid', 'y': 50, 'width': 200, 'height': 100},
+        ]
+        zones = definition.compile_definition(self.data, 'name', (400, 300)).zones
+        self.assertEqual(zones[0], {
+            'uid': 'zone 1', 'align': 'center', 'prefixed_uid': 'name-zone_1',
+            'x_percent': 25, 'y_percent': 16.6667, 'width_percent': 50, 'height_percent': 33.3333,
+        })
+        self.assertEqual(zones[1], {
+            'uid': 'zone/2', 'align': 'center', 'prefixed_uid': 'name-zone_2',
+            'x_percent': 1, 'y_percent': 2, 'width_percent': 3, 'height_percent': 4,
+        })
+        self.assertEqual(zones[2]['x'], 'invalid')
+        self.assertNotIn('x_percent', zones[2])
+
+    def test_unknown_image_dimensions(self):
+        zones = definition.compile_definition(self.data, 'name', (None, None)).zones
+        for zone, data_zone in zip(zones, self.data['zones']):
+            self.assertEqual(zone, dict(data_zone, prefixed_uid='name-' + data_zone['uid']))
+
+    def test_items_without_answers(self):
+        items = definition.compile_definition(self.data, 'name', (514, 486)).items
+        self.assertEqual(len(items), len(self.data['items']))
+        for item in items:
+            self.assertFalse(set(item) & {'feedback', 'zone', 'zones'})
+        self.assertIn('feedback', self.data['items'][0])
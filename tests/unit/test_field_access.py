@@ -0,0 +1,67 @@
+import json
+import unittest
+
+from xblock.field_data import DictFieldData
+from xblock.fields import ScopeIds
+from xblock.runtime import DictKeyValueStore, KvsFieldData
+
+import drag_and_drop_v2
+from drag_and_drop_v2.default_data import TOP_ZONE_ID
+from drag_and_drop_v2.field_access import FieldAccessRecorder
+
+from ..utils import make_block, TestCaseMixin
+
+
+class FieldAccessTest(TestCaseMixin, unittest.TestCase):
+    """ Tests for field access accounting """
+
+    def setUp(self):
+        self.key_store = DictKeyValueStore()
+        self.block = make_block(self.key_store)
+        self.patch_workbench()
+        self.patch_xblock_settings()
+
+    def _recorded_block(self):
+        """ Returns new instance of the block reading its fields through a recorder, and the recorder """
+        recorder = FieldAccessRecorder(KvsFieldData(self.key_store))
+        block = drag_and_drop_v2.DragAndDropBlock(self.block.runtime, recorder, scope_ids=self.block.scope_ids)
+        return block, recorder
+
+    def test_handler_field_access(self):
+        self.block, recorder = self._recorded_block()
+        self.call_handler(self.DROP_ITEM_HANDLER, {"val": 0, "zone": TOP_ZONE_ID})
+
+        summary = recorder.summary()
+        item_state = summary['user_state']['item_state']
+        self.assertEqual(item_state['writes'], 1)
+        self.assertEqual(item_state['write_bytes'], len(json.dumps(self.block.item_state)))
+        self.assertEqual(summary['user_state']['grade']['writes'], 1)
+        self.assertEqual(summary['content']['data'], {'reads': 1, 'writes': 0, 'read_bytes': 0, 'write_bytes': 0})
+        self.assertEqual(summary['settings']['mode']['writes'], 0)
+
+        totals = recorder.totals()
+        self.assertEqual(totals['writes'], sum(
+            counts['writes'] for fields in summary.values() for counts in fields.values()
+        ))
+
+    def test_each_request(self):
+        self.call_handler(self.DROP_ITEM_HANDLER, {"val": 0, "zone": TOP_ZONE_ID})
+
+        self.block, recorder = self._recorded_block()
+        self.call_handler(self.USER_STATE_HANDLER, method='GET')
+
+        summary = recorder.summary()
+        self.assertGreater(summary['user_state']['item_state']['reads'], 0)
+        self.assertGreater(summary['user_state']['item_state']['read_bytes'], 0)
+        self.assertEqual(recorder.totals()['writes'], 0)
+
+    def test_not_saved(self):
+        recorder = FieldAccessRecorder(DictFieldData({}))
+        block = drag_and_drop_v2.DragAndDropBlock(
+            self.block.runtime, recorder, scope_ids=ScopeIds('user', 'drag_and_drop_v2', 'def', 'usage')
+        )
+        block.attempts = 1
+
+        self.assertEqual(recorder.totals()['writes'], 0)
+        block.save()
+        self.assertEqual(recorder.summary()['user_state']['attempts']['writes'], 1)
@@ -0,0 +1,67 @@
+import ddt
+import unittest
+
+from drag_and_drop_v2.utils import Constants
+
+from ..generators import ProblemGenerator
+from ..utils import make_block, TestCaseMixin
+
+
+@ddt.ddt
+class ProblemGeneratorTest(TestCaseMixin, unittest.TestCase):
+    """ Tests for synthetic problem and learner state generator """
+
+    def setUp(self):
+        self.block = make_block()
+        self.patch_workbench()
+        self.apply_patch('workbench.runtime.WorkbenchRuntime.publish')
+
+    def test_seeded(self):
+        data = ProblemGenerator(seed=1).generate_data(items=20, multi_zone_ratio=0.5, decoy_ratio=0.2)
+        self.assertEqual(ProblemGenerator(seed=1).generate_data(items=20, multi_zone_ratio=0.5, decoy_ratio=0.2), data)
+        self.assertNotEqual(ProblemGenerator(seed=2).generate_data(items=20, multi_zone_ratio=0.5), data)
+
+    def test_generate_data(self):
+        generator = ProblemGenerator()
+        data = generator.generate_data(items=20, zones=4, multi_zone_ratio=0.25, decoy_ratio=0.2, image_ratio=0.1)
+
+        self.assertEqual(len(data['zones']), 4)
+        self.assertEqual(len(data['items']), 20)
+        item_zones = [item['zones'] for item in data['items']]
+        self.assertEqual(len([zones for zones in item_zones if not zones]), 4)
+        self.assertEqual(len([zones for zones in item_zones if len(zones) > 1]), 4)
+        self.assertEqual(len([item for item in data['items'] if item['imageURL']]), 2)
+
+    @ddt.data(
+        # completion, correctness, expected placed, expected correctly placed
+        (0.0, 1.0, 0, 0),
+        (0.5, 1.0, 8, 8),
+        (1.0, 0.5, 16, 8),
+    )
+    @ddt.unpack
+    def test_generate_item_state(self, completion, correctness, expected_placed, expected_correct):
+        generator = ProblemGenerator()
+        self.block.data = generator.generate_data(items=20, decoy_ratio=0.2, multi_zone_ratio=0.2)
+        self.block.mode = Constants.ASSESSMENT_MODE
+        self.block.item_state = generator.generate_item_state(self.block.data, completion, correctness)
+
+        stats = self.block._get_item_raw_stats()  # pylint: disable=protected-access
+        self.assertEqual(len(stats.placed), expected_placed)
+        self.assertEqual(len(stats.correctly_placed), expected_correct)
+        for item_id, state in self.block.item_state.iteritems():
+            self.assertEqual(state['correct'], state['zone'] in self.block.get_item_zones(int(item_id)))
+
+    def test_legacy(self):
+        generator = ProblemGenerator()
+        self.block.data = generator.generate_data(items=10, decoy_ratio=0.2, multi_zone_ratio=0.5, legacy=True)
+        self.block.item_state = generator.generate_item_state(self.block.data, completion=0.5, legacy=True)
+
+        self.assertTrue(all('uid' not in zone for zone in self.block.data['zones']))
+        self.assertTrue(all('zones' not in item for item in self.block.data['items']))
+        self.assertEqual(len(self.block.zones), 10)
+        self.assertEqual(self.block.grade, 0)
+
+        res = self.call_handler(self.USER_STATE_HANDLER, method='GET')
+        self.assertEqual(len(res['items']), 4)
+        for state in res['items'].values():
+            self.assertIn(state['zone'], [zone['uid'] for zone in self.block.zones])
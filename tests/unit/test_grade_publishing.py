@@ -0,0 +1,135 @@
+import ddt
+import unittest
+
+from drag_and_drop_v2.default_data import TOP_ZONE_ID, MIDDLE_ZONE_ID, BOTTOM_ZONE_ID
+from drag_and_drop_v2.utils import Constants, GradePublishingPolicy
+
+from ..utils import make_block, TestCaseMixin
+
+
+@ddt.ddt
+class GradePublishingPolicyTest(unittest.TestCase):
+    """ Tests for grade publishing policy """
+
+    @ddt.data(
+        ({}, GradePublishingPolicy.ALWAYS, 4, 60),
+        ({'mode': 'unknown'}, GradePublishingPolicy.ALWAYS, 4, 60),
+        ({'mode': 'bucket', 'buckets': 10}, GradePublishingPolicy.BUCKET, 10, 60),
+        ({'mode': 'bucket', 'buckets': -1}, GradePublishingPolicy.BUCKET, 4, 60),
+        ({'mode': 'window', 'window': '5'}, GradePublishingPolicy.WINDOW, 4, 5),
+        ({'mode': 'window', 'window': 'soon'}, GradePublishingPolicy.WINDOW, 4, 60),
+    )
+    @ddt.unpack
+    def test_settings(self, config, expected_mode, expected_buckets, expected_window):
+        policy = GradePublishingPolicy({'grade_publishing': config})
+        self.assertEqual(policy.mode, expected_mode)
+        self.assertEqual(policy.buckets, expected_buckets)
+        self.assertEqual(policy.window, expected_window)
+
+    @ddt.data(
+        {'mode': 'always', 'grade': 0.5, 'published_grade': 0.5, 'completed': False, 'seconds_since_publish': None,
+         'expected': False},
+        {'mode': 'always', 'grade': 0.6, 'published_grade': 0.5, 'completed': False, 'seconds_since_publish': 0,
+         'expected': True},
+        {'mode': 'completion', 'grade': 0.6, 'published_grade': 0.5, 'completed': False, 'seconds_since_publish': None,
+         'expected': False},
+        {'mode': 'completion', 'grade': 1, 'published_grade': 0.5, 'completed': True, 'seconds_since_publish': 0,
+         'expected': True},
+        {'mode': 'completion', 'grade': 1, 'published_grade': 0.5, 'completed': False, 'seconds_since_publish': 0,
+         'expected': True},
+        {'mode': 'bucket', 'grade': 0.45, 'published_grade': 0.3, 'completed': False, 'seconds_since_publish': 0,
+         'expected': False},
+        {'mode': 'bucket', 'grade': 0.5, 'published_grade': 0.3, 'completed': False, 'seconds_since_publish': 0,
+         'expected': True},
+        {'mode': 'bucket', 'grade': 0.6, 'published_grade': 0.3, 'completed': True, 'seconds_since_publish': 0,
+         'expected': True},
+        {'mode': 'window', 'grade': 0.6, 'published_grade': 0.5, 'completed': False, 'seconds_since_publish': 10,
+         'expected': False},
+        {'mode': 'window', 'grade': 0.6, 'published_grade': 0.5, 'completed': False, 'seconds_since_publish': 60,
+         'expected': True},
+        {'mode': 'window', 'grade': 0.6, 'published_grade': 0.5, 'completed': False, 'seconds_since_publish': None,
+         'expected': True},
+        {'mode': 'window', 'grade': 1, 'published_grade': 0.5, 'completed': True, 'seconds_since_publish': 10,
+         'expected': True},
+    )
+    @ddt.unpack
+    def test_is_publish_due(self, mode, expected, **publish_state):
+        policy = GradePublishingPolicy({'grade_publishing': {'mode': mode}})
+        self.assertEqual(policy.is_publish_due(max_grade=1, **publish_state), expected)
+
+
+class GradePublishingTest(TestCaseMixin, unittest.TestCase):
+    """ Tests for coalesced grade publishing in standard mode """
+
+    def setUp(self):
+        self.block = make_block()
+        self.patch_workbench()
+        self.publish = self.apply_patch('workbench.runtime.WorkbenchRuntime.publish')
+        self.time = self.apply_patch('time.time', return_value=1000)
+        self.patch_xblock_settings()
+
+    def _published_grades(self):
+        return [call[0][2]['value'] for call in self.publish.call_args_list if call[0][1] == 'grade']
+
+    def _solve(self):
+        for item_id, zone in enumerate([TOP_ZONE_ID, MIDDLE_ZONE_ID, BOTTOM_ZONE_ID, MIDDLE_ZONE_ID]):
+            self.call_handler(self.DROP_ITEM_HANDLER, {"val": item_id, "zone": zone})
+
+    def test_always(self):
+        self._solve()
+        self.assertEqual(self._published_grades(), [0.4, 0.6, 0.8, 1.0])
+        self.assertEqual(self.block.published_grade, 1.0)
+        self.assertEqual(self.block.grade_published_at, 1000)
+
+    def test_completion(self):
+        self.xblock_settings = {'grade_publishing': {'mode': 'completion'}}
+        self._solve()
+        self.assertEqual(self._published_grades(), [1.0])
+
+    def test_bucket(self):
+        self.xblock_settings = {'grade_publishing': {'mode': 'bucket', 'buckets': 2}}
+        self._solve()
+        self.assertEqual(self._published_grades(), [0.6, 1.0])
+
+    def test_window(self):
+        self.xblock_settings = {'grade_publishing': {'mode': 'window', 'window': 30}}
+        self.call_handler(self.DROP_ITEM_HANDLER, {"val": 0, "zone": TOP_ZONE_ID})
+        self.call_handler(self.DROP_ITEM_HANDLER, {"val": 1, "zone": MIDDLE_ZONE_ID})
+        self.assertEqual(self._published_grades(), [0.4])
+
+        # Deferred grade is published with next item drop once window has passed, even if the drop is incorrect
+        self.call_handler(self.DROP_ITEM_HANDLER, {"val": 2, "zone": TOP_ZONE_ID})
+        self.assertEqual(self._published_grades(), [0.4])
+        self.time.return_value = 1030
+        self.call_handler(self.DROP_ITEM_HANDLER, {"val": 2, "zone": TOP_ZONE_ID})
+        self.assertEqual(self._published_grades(), [0.4, 0.6])
+
+        self.call_handler(self.DROP_ITEM_HANDLER, {"val": 2, "zone": BOTTOM_ZONE_ID})
+        self.call_handler(self.DROP_ITEM_HANDLER, {"val": 3, "zone": MIDDLE_ZONE_ID})
+        self.assertEqual(self._published_grades(), [0.4, 0.6, 1.0])
+
+    def test_not_published_on_load(self):
+        self.xblock_settings = {'grade_publishing': {'mode': 'window', 'window': 30}}
+        self.call_handler(self.DROP_ITEM_HANDLER, {"val": 0, "zone": TOP_ZONE_ID})
+        self.call_handler(self.DROP_ITEM_HANDLER, {"val": 1, "zone": MIDDLE_ZONE_ID})
+        self.time.return_value = 1030
+        self.call_handler(self.USER_STATE_HANDLER, method='GET')
+        self.assertEqual(self._published_grades(), [0.4])
+
+    def test_legacy_grade_not_republished(self):
+        self.xblock_settings = {'grade_publishing': {'mode': 'completion'}}
+        self.block.grade = 0.6
+        self.call_handler(self.USER_STATE_HANDLER, method='GET')
+        self.call_handler(self.DROP_ITEM_HANDLER, {"val": 0, "zone": TOP_ZONE_ID})
+        self.assertEqual(self._published_grades(), [])
+
+        self._solve()
+        self.assertEqual(self._published_grades(), [1.0])
+
+    def test_assessment_mode_not_affected(self):
+        self.xblock_settings = {'grade_publishing': {'mode': 'completion'}}
+        self.block.mode = Constants.ASSESSMENT_MODE
+        self.block.max_attempts = 3
+        self.call_handler(self.DROP_ITEM_HANDLER, {"val": 0, "zone": TOP_ZONE_ID})
+        self.call_handler(self.DO_ATTEMPT_HANDLER, {})
+        self.assertEqual(self._published_grades(), [0.4])
@@ -0,0 +1,410 @@
+import base64
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+
+import mock
+
+from drag_and_drop_v2 import definition
+from drag_and_drop_v2.images import (
+    PUBLIC_DIR, ImageInfo, ImageSettings, inline_image, load_pillow, preload_hints, probe_image
+)
+
+from ..utils import make_block, TestCaseMixin
+
+
+PILImage = load_pillow()
+
+
+def make_gif(width, height):
+    """ Returns header of a GIF image """
+    return 'GIF89a' + struct.pack('<HH', width, height) + '\x00' * 20
+
+
+def make_png(path, size, color):
+    """ Saves a PNG image of a single color """
+    PILImage.new('RGB', size, color).save(path, 'PNG')
+
+
+def make_jpeg(width, height):
+    """ Returns header of a JPEG image with an APP0 segment and fill bytes before the frame segment """
+    app0 = '\xff\xe0' + struct.pack('>H', 16) + 'JFIF\x00' + '\x00' * 9
+    sof0 = '\xff\xff\xc0' + struct.pack('>HBHH', 17, 8, height, width) + '\x00' * 10
+    return '\xff\xd8' + app0 + sof0
+
+
+class ProbeImageTest(unittest.TestCase):
+    """ Tests for reading image headers """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def _write(self, name, content):
+        path = os.path.join(self.directory, name)
+        with open(path, 'wb') as image_file:
+            image_file.write(content)
+        return path
+
+    def test_png(self):
+        path = os.path.join(PUBLIC_DIR, 'img', 'triangle.png')
+        self.assertEqual(probe_image(path), ImageInfo('png', 514, 486, os.path.getsize(path)))
+
+    def test_gif(self):
+        path = self._write('image.gif', make_gif(640, 480))
+        self.assertEqual(probe_image(path), ImageInfo('gif', 640, 480, 30))
+
+    def test_jpeg(self):
+        content = make_jpeg(1024, 768)
+        path = self._write('image.jpg', content)
+        self.assertEqual(probe_image(path), ImageInfo('jpeg', 1024, 768, len(content)))
+
+    def test_inline_image(self):
+        content = make_gif(2, 2)
+        path = self._write('image.gif', content)
+        self.assertEqual(inline_image(path, 30), 'data:image/gif;base64,' + base64.b64encode(content))
+        self.assertIsNone(inline_image(path, 29))
+        self.assertIsNone(inline_image(self._write('text.png', 'not an image'), 100))
+
+    def test_invalid(self):
+        self.assertIsNone(probe_image(self._write('text.png', 'not an image')))
+        self.assertIsNone(probe_image(self._write('truncated.jpg', make_jpeg(10, 10)[:24])))
+        self.assertIsNone(probe_image(os.path.join(self.directory, 'missing.png')))
+
+
+class ImageSettingsTest(unittest.TestCase):
+    """ Tests for resolving image URLs to local files """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        with open(os.path.join(self.directory, 'image.gif'), 'wb') as image_file:
+            image_file.write(make_gif(1, 1))
+
+    def test_resolve_package_image(self):
+        settings = ImageSettings({}, resource_url_prefix='/resource/drag-and-drop-v2/public/')
+        triangle = os.path.join(PUBLIC_DIR, 'img', 'triangle.png')
+        self.assertEqual(settings.resolve('public/img/triangle.png'), triangle)
+        self.assertEqual(settings.resolve('/resource/drag-and-drop-v2/public/img/triangle.png'), triangle)
+        self.assertIsNone(settings.resolve('/resource/other-block/public/img/triangle.png'))
+        self.assertIsNone(settings.resolve('http://example.com/public/img/triangle.png'))
+        self.assertIsNone(settings.resolve('public/../setup.py'))
+        self.assertIsNone(settings.resolve('/resource/drag-and-drop-v2/public/../../setup.py'))
+        self.assertIsNone(settings.resolve('/static/image.gif'))
+
+    def test_public_path_in_asset_url(self):
+        settings = ImageSettings({}, resource_url_prefix='/resource/drag-and-drop-v2/public/')
+        self.assertIsNone(settings.resolve('/static/x/public/img/triangle.png'))
+        self.assertIsNone(ImageSettings({}).resolve('/resource/drag-and-drop-v2/public/img/triangle.png'))
+
+    def test_resolve_asset(self):
+        settings = ImageSettings({'images': {'asset_root': self.directory}})
+        self.assertEqual(settings.resolve('/static/image.gif'), os.path.join(self.directory, 'image.gif'))
+        self.assertIsNone(settings.resolve('/static/missing.gif'))
+        self.assertIsNone(settings.resolve('/static/../image.gif'))
+
+    @unittest.skipIf(PILImage is None, "Pillow is not installed")
+    def test_generate_variants(self):
+        settings = ImageSettings({'images': {'variants': {
+            'directory': self.directory, 'url': '/variants/', 'widths': [200, 'invalid', 100, 600]
+        }}})
+        path = os.path.join(PUBLIC_DIR, 'img', 'triangle.png')
+        info = probe_image(path)
+
+        variants = settings.generate_variants(path, info)
+        self.assertEqual([variant['width'] for variant in variants], [100, 200])
+        for variant in variants:
+            self.assertRegexpMatches(variant['url'], r'^/variants/[0-9a-f]{12}-%dw\.png$' % variant['width'])
+            variant_info = probe_image(os.path.join(self.directory, variant['url'].rsplit('/', 1)[1]))
+            expected_height = int(round(variant['width'] * 486 / 514.0))
+            self.assertEqual((variant_info.width, variant_info.height), (variant['width'], expected_height))
+
+        # Existing variants are reused:
+        with mock.patch.object(PILImage, 'open') as pil_open:
+            self.assertEqual(settings.generate_variants(path, info), variants)
+        self.assertFalse(pil_open.called)
+
+    @unittest.skipIf(PILImage is None, "Pillow is not installed")
+    def test_unreadable_images(self):
+        settings = ImageSettings({'images': {
+            'variants': {'directory': self.directory, 'url': '/variants/'}, 'sprites': {'max_bytes': 100000},
+        }})
+        path = os.path.join(PUBLIC_DIR, 'img', 'triangle.png')
+        info = probe_image(path)
+        for error in (SyntaxError("broken PNG file"), PILImage.DecompressionBombError("too many pixels")):
+            with mock.patch.object(PILImage, 'open', side_effect=error):
+                self.assertEqual(settings.generate_variants(path, info), [])
+                self.assertIsNone(settings.generate_sprite([('a.png', path, info), ('b.png', path, info)]))
+
+    def test_variants_disabled(self):
+        path = os.path.join(PUBLIC_DIR, 'img', 'triangle.png')
+        self.assertEqual(ImageSettings({}).generate_variants(path, probe_image(path)), [])
+        settings = ImageSettings({'images': {'variants': {'directory': self.directory, 'url': '/variants/'}}})
+        gif_path = os.path.join(self.directory, 'image.gif')
+        self.assertEqual(settings.generate_variants(gif_path, probe_image(gif_path)), [])
+
+    @unittest.skipIf(PILImage is None, "Pillow is not installed")
+    def test_generate_sprite(self):
+        settings = ImageSettings({'images': {
+            'variants': {'directory': self.directory, 'url': '/variants/'}, 'sprites': {'max_bytes': 1000},
+        }})
+        images = []
+        for name, size, color in (('red.png', (30, 20), 'red'), ('blue.png', (10, 40), 'blue')):
+            path = os.path.join(self.directory, name)
+            make_png(path, size, color)
+            images.append(('/static/' + name, path, probe_image(path)))
+
+        sprite = settings.generate_sprite(images + images[:1])
+        self.assertRegexpMatches(sprite['url'], r'^/variants/[0-9a-f]{12}-sprite\.png$')
+        self.assertEqual(sprite['regions'], {
+            '/static/red.png': {'x': 0, 'y': 0, 'width': 30, 'height': 20},
+            '/static/blue.png': {'x': 0, 'y': 22, 'width': 10, 'height': 40},
+        })
+        self.assertEqual((sprite['width'], sprite['height']), (30, 62))
+        sheet = PILImage.open(os.path.join(self.directory, sprite['url'].rsplit('/', 1)[1])).convert('RGBA')
+        self.assertEqual(sheet.size, (30, 62))
+        self.assertEqual(sheet.getpixel((29, 19)), (255, 0, 0, 255))
+        self.assertEqual(sheet.getpixel((0, 21))[3], 0)
+        self.assertEqual(sheet.getpixel((9, 61)), (0, 0, 255, 255))
+
+    def test_sprite_not_generated(self):
+        path = os.path.join(self.directory, 'image.gif')
+        images = [('/static/image.gif', path, probe_image(path)), ('/static/other.gif', path, probe_image(path))]
+        self.assertIsNone(ImageSettings({}).generate_sprite(images))
+        settings = ImageSettings({'images': {
+            'variants': {'directory': self.directory, 'url': '/variants/'}, 'sprites': {'max_bytes': 20},
+        }})
+        self.assertIsNone(settings.generate_sprite(None))
+        self.assertIsNone(settings.generate_sprite(images[:1]))
+        self.assertIsNone(settings.generate_sprite(images))  # The images are larger than 20 bytes
+
+    def test_oversized(self):
+        settings = ImageSettings({'images': {'max_bytes': 1000, 'max_dimension': 'invalid'}})
+        self.assertEqual(settings.max_dimension, ImageSettings.DEFAULT_MAX_DIMENSION)
+        self.assertFalse(settings.oversized(ImageInfo('png', 2400, 100, 1000)))
+        self.assertTrue(settings.oversized(ImageInfo('png', 100, 2401, 1000)))
+        self.assertTrue(settings.oversized(ImageInfo('png', 100, 100, 1001)))
+
+
+class StudioSubmitImagesTest(TestCaseMixin, unittest.TestCase):
+    """ Tests for probing images when the problem is saved """
+
+    def setUp(self):
+        self.block = make_block()
+        self.patch_workbench()
+        self.directory = self.make_temp_directory()
+        with open(os.path.join(self.directory, 'large.jpg'), 'wb') as image_file:
+            image_file.write(make_jpeg(3000, 2000))
+        shutil.copy(os.path.join(PUBLIC_DIR, 'img', 'triangle.png'), self.directory)
+        self.patch_xblock_settings({'images': {'asset_root': self.directory}})
+
+    def _submit(self, data):
+        return self.call_handler('studio_submit', {
+            'display_name': "Test Drag & Drop",
+            'mode': 'standard',
+            'max_attempts': 1,
+            'show_title': False,
+            'problem_text': "Problem Drag & Drop",
+            'show_problem_header': False,
+            'item_background_color': '',
+            'item_text_color': '',
+            'weight': '1',
+            'data': data,
+        })
+
+    def test_probe_images(self):
+        res = self._submit({
+            'targetImg': '/static/large.jpg',
+            'items': [
+                {'id': 0, 'imageURL': 'public/img/triangle.png'},
+                {'id': 1, 'imageURL': '/static/missing.png'},
+                {'id': 2, 'backgroundImage': '/static/large.jpg'},
+            ],
+        })
+
+        self.assertEqual(len(res['warnings']), 1)
+        self.assertIn('/static/large.jpg is 3000x2000 pixels', res['warnings'][0])
+        self.assertEqual((self.block.data['targetImgWidth'], self.block.data['targetImgHeight']), (3000, 2000))
+        items = self.block.data['items']
+        self.assertEqual((items[0]['imageWidth'], items[0]['imageHeight']), (514, 486))
+        self.assertNotIn('imageWidth', items[1])
+        self.assertEqual((items[2]['imageWidth'], items[2]['imageHeight']), (3000, 2000))
+
+        metadata = self.block.get_image_metadata()
+        self.assertEqual(sorted(metadata), ['/static/large.jpg', 'public/img/triangle.png'])
+        self.assertEqual(metadata['/static/large.jpg'], {
+            'format': 'jpeg', 'width': 3000, 'height': 2000, 'bytes': len(make_jpeg(3000, 2000)), 'variants': [],
+        })
+
+        self.block.data = dict(self.block.data, targetImg='/static/other.png')
+        self.assertEqual(self.block.get_image_metadata(), {})
+
+    @unittest.skipIf(PILImage is None, "Pillow is not installed")
+    def test_image_variants(self):
+        self.xblock_settings['images']['variants'] = {'directory': self.directory, 'url': '/variants/'}
+        self._submit({
+            'targetImg': '/static/triangle.png',
+            'items': [{'id': 0, 'imageURL': '/static/triangle.png', 'feedback': {}}, {'id': 1, 'feedback': {}}],
+        })
+
+        config = self.block.get_configuration()
+        self.assertEqual([variant['width'] for variant in config['target_img_variants']], [480])
+        self.assertEqual(config['items'][0]['expandedImageVariants'], config['target_img_variants'])
+        self.assertNotIn('expandedImageVariants', config['items'][1])
+
+        # Stored variants are not used once variants are no longer configured:
+        del self.xblock_settings['images']['variants']
+        config = self.block.get_configuration()
+        self.assertEqual(config['target_img_variants'], [])
+        self.assertNotIn('expandedImageVariants', config['items'][0])
+
+    def test_data_version(self):
+        self.assertEqual(self.block.data_version, definition.definition_version(self.block.data))
+        self._submit({'items': [{'id': 0, 'imageURL': 'public/img/triangle.png', 'feedback': {}}]})
+        self.assertEqual(self.block.data_version, self.block.image_metadata['version'])
+        self.assertEqual(self.block.data_version, definition.definition_version(self.block.data))
+
+        with mock.patch('drag_and_drop_v2.definition.definition_version') as definition_version:
+            self.block.get_configuration()
+        self.assertFalse(definition_version.called)
+
+    def test_no_warnings(self):
+        res = self._submit({'items': [{'id': 0, 'imageURL': 'public/img/triangle.png'}]})
+        self.assertEqual(res, {'result': 'success'})
+
+    def test_inline_images(self):
+        patcher = mock.patch.dict(definition._CACHE, clear=True)  # pylint: disable=protected-access
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for name in ('a.gif', 'b.gif', 'c.gif'):
+            with open(os.path.join(self.directory, name), 'wb') as image_file:
+                image_file.write(make_gif(2, 2))
+        gif_uri = 'data:image/gif;base64,' + base64.b64encode(make_gif(2, 2))
+        # Shared images are charged for each item showing them: a.gif twice, b.gif once.
+        self.xblock_settings['images']['inline'] = {'max_bytes': 100, 'budget': 3 * len(gif_uri)}
+        self.block.data = {
+            'targetImg': '/static/a.gif',
+            'zones': [],
+            'items': [
+                {'id': 0, 'imageURL': '/static/a.gif', 'feedback': {}},
+                {'id': 1, 'imageURL': '/static/triangle.png', 'feedback': {}},
+                {'id': 2, 'imageURL': '/static/b.gif', 'feedback': {}},
+                {'id': 3, 'imageURL': '/static/a.gif', 'feedback': {}},
+                {'id': 4, 'imageURL': '/static/c.gif', 'feedback': {}},
+            ],
+        }
+
+        config = self.block.get_configuration()
+        self.assertEqual(config['target_img_expanded_url'], '/course/test-course/assets/a.gif')
+        urls = [item['expandedImageURL'] for item in config['items']]
+        self.assertEqual(urls, [
+            gif_uri, '/course/test-course/assets/triangle.png', gif_uri, gif_uri, '/course/test-course/assets/c.gif'
+        ])
+
+        # Four items showing the same image would exceed the budget:
+        self.block.data['items'] = [{'id': i, 'imageURL': '/static/a.gif', 'feedback': {}} for i in range(4)]
+        urls = [item['expandedImageURL'] for item in self.block.get_configuration()['items']]
+        self.assertEqual(urls, ['/course/test-course/assets/a.gif'] * 4)
+
+        # Image files replaced in place are inlined again:
+        self.block.data['items'] = self.block.data['items'][:1]
+        self.assertEqual(self.block.get_configuration()['items'][0]['expandedImageURL'], gif_uri)
+        path = os.path.join(self.directory, 'a.gif')
+        modified = os.stat(path).st_mtime
+        with open(path, 'wb') as image_file:
+            image_file.write(make_gif(3, 3))
+        os.utime(path, (modified + 1, modified + 1))  # Same size, so make sure the change is seen on coarse clocks
+        self.assertEqual(
+            self.block.get_configuration()['items'][0]['expandedImageURL'],
+            'data:image/gif;base64,' + base64.b64encode(make_gif(3, 3))
+        )
+
+        del self.xblock_settings['images']['inline']
+        urls = [item['expandedImageURL'] for item in self.block.get_configuration()['items']]
+        self.assertNotIn(gif_uri, urls)
+
+    @unittest.skipIf(PILImage is None, "Pillow is not installed")
+    def test_item_sprite(self):
+        self.xblock_settings['images']['variants'] = {'directory': self.directory, 'url': '/variants/'}
+        self.xblock_settings['images']['sprites'] = {'max_bytes': 1000}
+        make_png(os.path.join(self.directory, 'a.png'), (20, 20), 'red')
+        make_png(os.path.join(self.directory, 'b.png'), (20, 10), 'blue')
+        items = [
+            {'id': 0, 'imageURL': '/static/a.png', 'feedback': {}},
+            {'id': 1, 'imageURL': '/static/b.png', 'feedback': {}},
+        ]
+        self._submit({'targetImg': '/static/triangle.png', 'items': items})
+
+        config = self.block.get_configuration()
+        self.assertRegexpMatches(config['item_sprite'].pop('url'), r'^/variants/[0-9a-f]{12}-sprite\.png$')
+        self.assertEqual(config['item_sprite'], {'width': 20, 'height': 32})
+        self.assertEqual(
+            [item['spriteRegion'] for item in config['items']],
+            [{'x': 0, 'y': 0, 'width': 20, 'height': 20}, {'x': 0, 'y': 22, 'width': 20, 'height': 10}]
+        )
+
+        # The stored sprite sheet is not used once sprites are no longer configured:
+        del self.xblock_settings['images']['sprites']
+        config = self.block.get_configuration()
+        self.assertIsNone(config['item_sprite'])
+        self.assertNotIn('spriteRegion', config['items'][0])
+        self.xblock_settings['images']['sprites'] = {'max_bytes': 1000}
+
+        # Items without images can't be shown from a sprite sheet:
+        self._submit({'items': items + [{'id': 2, 'displayName': 'Text', 'feedback': {}}]})
+        config = self.block.get_configuration()
+        self.assertIsNone(config['item_sprite'])
+        self.assertNotIn('spriteRegion', config['items'][0])
+
+
+class PreloadHintsTest(TestCaseMixin, unittest.TestCase):
+    """ Tests for preloading images of the learner view """
+
+    def setUp(self):
+        self.block = make_block()
+        self.patch_workbench()
+        self.patch_xblock_settings()
+
+    def _html_resources(self):
+        fragment = self.block.student_view({})
+        return [
+            resource.data for resource in fragment.resources
+            if resource.mimetype == 'text/html' and resource.placement == 'head'
+        ]
+
+    def test_student_view(self):
+        target_url = self.block.get_configuration()['target_img_expanded_url']
+        self.assertEqual(self._html_resources(), ['<link rel="preload" as="image" href="{}">'.format(target_url)])
+
+        self.xblock_settings = {'images': {'preload_items': 2}}
+        self.block.data = dict(self.block.data, items=[
+            {'id': 0, 'imageURL': '/static/a.png', 'feedback': {}},
+            {'id': 1, 'displayName': 'Text', 'feedback': {}},
+            {'id': 2, 'imageURL': '/static/a.png', 'feedback': {}},
+            {'id': 3, 'imageURL': '/static/b&c.png', 'feedback': {}},
+            {'id': 4, 'imageURL': '/static/d.png', 'feedback': {}},
+        ])
+        self.assertEqual(self._html_resources(), [
+            '<link rel="preload" as="image" href="{}">'.format(url)
+            for url in (target_url, '/course/test-course/assets/a.png', '/course/test-course/assets/b&amp;c.png')
+        ])
+
+    def test_skipped_images(self):
+        configuration = {
+            'target_img_expanded_url': '/target.png',
+            'target_img_variants': [{'url': '/target-480w.png', 'width': 480}],
+            'item_sprite': {'url': '/sprite.png', 'width': 100, 'height': 100},
+            'items': [
+                {'expandedImageURL': '/a.png', 'spriteRegion': {'x': 0, 'y': 0, 'width': 10, 'height': 10}},
+                {'expandedImageURL': 'data:image/gif;base64,R0lGODlh'},
+                {'expandedImageURL': '/b.png', 'expandedImageVariants': [{'url': '/b-480w.png', 'width': 480}]},
+                {'expandedImageURL': '/c.png'},
+            ],
+        }
+        self.assertEqual(preload_hints(configuration, 10), [
+            '<link rel="preload" as="image" href="/sprite.png">',
+            '<link rel="preload" as="image" href="/c.png">',
+        ])
+        self.assertEqual(preload_hints(configuration, 0), [])
@@ -0,0 +1,192 @@
+import itertools
+import os
+import pstats
+import unittest
+
+from drag_and_drop_v2.default_data import TOP_ZONE_ID
+from drag_and_drop_v2.instrumentation import NULL_TIMER, HandlerTimer, HistogramSink, Instrumentation
+
+from ..utils import make_block, TestCaseMixin
+
+
+class RecordingSink(object):
+    """ Instrumentation sink that keeps recorded timers """
+    timers = []
+
+    def record(self, timer):
+        self.timers.append(timer)
+
+
+class FailingSink(object):
+    """ Instrumentation sink that fails to record timers """
+
+    def record(self, timer):  # pylint: disable=no-self-use
+        raise ValueError("Unable to record {}".format(timer.handler_name))
+
+
+class HandlerTimerTest(unittest.TestCase):
+    """ Tests for handler phase timer """
+
+    def test_nested_phases(self):
+        clock = itertools.count().next
+        timer = HandlerTimer('drop_item', clock=clock)
+        timer.start()                          # 0
+        with timer.phase('validation'):        # 1
+            pass                               # 2
+        with timer.phase('stats'):             # 3
+            with timer.phase('migration'):     # 4
+                pass                           # 5
+        timer.stop()                           # 7
+
+        self.assertEqual(timer.total, 7)
+        self.assertEqual(dict(timer.phases), {'other': 3, 'validation': 1, 'stats': 2, 'migration': 1})
+        self.assertEqual(sum(timer.phases.values()), timer.total)
+
+
+class HistogramSinkTest(unittest.TestCase):
+    """ Tests for in-memory histogram sink """
+
+    def test_record(self):
+        sink = HistogramSink()
+        for duration in (0.0005, 0.003, 0.003, 10):
+            timer = HandlerTimer('do_attempt')
+            timer.phases['stats'] = duration
+            timer.total = duration
+            sink.record(timer)
+
+        histograms = sink.snapshot()
+        self.assertEqual(sorted(histograms.keys()), [('do_attempt', 'stats'), ('do_attempt', 'total')])
+        histogram = histograms[('do_attempt', 'total')]
+        self.assertEqual(histogram['count'], 4)
+        self.assertAlmostEqual(histogram['sum_ms'], 10006.5)
+        self.assertEqual(histogram['buckets'], [1, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1])
+
+        sink.reset()
+        self.assertEqual(sink.snapshot(), {})
+
+
+class InstrumentedHandlersTest(TestCaseMixin, unittest.TestCase):
+    """ Tests for handler instrumentation """
+
+    def setUp(self):
+        self.block = make_block()
+        self.patch_workbench()
+        self.patch_xblock_settings()
+        RecordingSink.timers = []
+
+    def test_disabled(self):
+        self.call_handler(self.DROP_ITEM_HANDLER, {"val": 0, "zone": TOP_ZONE_ID})
+        self.assertIs(self.block.timer, NULL_TIMER)
+        self.assertFalse(Instrumentation(self.xblock_settings).enabled)
+
+    def test_histogram_sink(self):
+        self.xblock_settings = {'instrumentation': {'sink': 'histogram'}}
+        sink = Instrumentation.get_sink('histogram')
+        sink.reset()
+
+        self.call_handler(self.DROP_ITEM_HANDLER, {"val": 0, "zone": TOP_ZONE_ID})
+        self.call_handler(self.USER_STATE_HANDLER, method='GET')
+
+        histograms = sink.snapshot()
+        for phase in (
+                'total', 'validation', 'state_load', 'migration', 'stats', 'feedback', 'publish', 'serialization',
+                'other'
+        ):
+            self.assertEqual(histograms[('drop_item', phase)]['count'], 1)
+        self.assertEqual(histograms[('get_user_state', 'serialization')]['count'], 1)
+        self.assertIs(self.block.timer, NULL_TIMER)
+
+    def test_custom_sink(self):
+        self.xblock_settings = {'instrumentation': {'sink': 'tests.unit.test_instrumentation.RecordingSink'}}
+        self.block.mode = 'assessment'
+        self.call_handler(self.DROP_ITEM_HANDLER, {"val": 0, "zone": TOP_ZONE_ID})
+        self.call_handler(self.DO_ATTEMPT_HANDLER, {})
+
+        self.assertEqual([timer.handler_name for timer in RecordingSink.timers], ['drop_item', 'do_attempt'])
+        timer = RecordingSink.timers[1]
+        self.assertIn('serialization', timer.phases)
+        self.assertAlmostEqual(sum(timer.phases.values()), timer.total)
+
+    def test_failing_sink(self):
+        self.xblock_settings = {'instrumentation': {'sink': 'tests.unit.test_instrumentation.FailingSink'}}
+        logger = self.apply_patch('drag_and_drop_v2.instrumentation.logger')
+        res = self.call_handler(self.DROP_ITEM_HANDLER, {"val": 0, "zone": TOP_ZONE_ID})
+
+        self.assertTrue(res['correct'])
+        self.assertIs(self.block.timer, NULL_TIMER)
+        logger.exception.assert_called_once_with("Unable to record DnDv2 timings of %s handler", 'drop_item')
+
+    def test_invalid_sink(self):
+        self.xblock_settings = {'instrumentation': {'sink': 'no.such.Sink'}}
+        res = self.call_handler(self.DROP_ITEM_HANDLER, {"val": 0, "zone": TOP_ZONE_ID})
+        self.assertTrue(res['correct'])
+
+    def test_slow_handler_logged(self):
+        self.xblock_settings = {'instrumentation': {'slow_handler_threshold_ms': 0}}
+        logger = self.apply_patch('drag_and_drop_v2.instrumentation.logger')
+        self.call_handler(self.DROP_ITEM_HANDLER, {"val": 0, "zone": TOP_ZONE_ID})
+
+        self.assertEqual(logger.warning.call_count, 1)
+        args = logger.warning.call_args[0]
+        handler_name, __, threshold, usage_id, items, zones, placed, request_bytes, response_bytes = args[1:10]
+        self.assertEqual(handler_name, 'drop_item')
+        self.assertEqual(threshold, 0)
+        self.assertEqual(usage_id, self.block.scope_ids.usage_id)
+        self.assertEqual((items, zones, placed), (5, 3, 1))
+        self.assertEqual(request_bytes, len('{"val": 0, "zone": "top"}'))
+        self.assertGreater(response_bytes, 0)
+        self.assertIn('validation=', args[10])
+
+    def test_fast_handler_not_logged(self):
+        self.xblock_settings = {'instrumentation': {'slow_handler_threshold_ms': 60000}}
+        logger = self.apply_patch('drag_and_drop_v2.instrumentation.logger')
+        self.call_handler(self.USER_STATE_HANDLER, method='GET')
+        self.assertFalse(logger.warning.called)
+
+
+class ProfilingTest(TestCaseMixin, unittest.TestCase):
+    """ Tests for on-demand handler profiling """
+
+    def setUp(self):
+        self.block = make_block()
+        self.patch_workbench()
+        self.directory = self.make_temp_directory()
+        self.patch_xblock_settings({'profiling': {'sample_rate': 1, 'directory': self.directory}})
+
+    def _profiles(self):
+        return sorted(os.listdir(self.directory))
+
+    def test_profile_saved(self):
+        self.call_handler(self.DROP_ITEM_HANDLER, {"val": 0, "zone": TOP_ZONE_ID})
+        self.block.student_view({})
+
+        profiles = self._profiles()
+        self.assertEqual([name.split('-')[0] for name in profiles], ['drop_item', 'student_view'])
+        stats = pstats.Stats(os.path.join(self.directory, profiles[0]))
+        self.assertTrue(any(func[2] == 'drop_item' for func in stats.stats))
+
+    def test_not_sampled(self):
+        self.xblock_settings['profiling']['sample_rate'] = 0.5
+        self.apply_patch('random.random', return_value=0.5)
+        self.call_handler(self.DROP_ITEM_HANDLER, {"val": 0, "zone": TOP_ZONE_ID})
+        self.assertEqual(self._profiles(), [])
+
+    def test_rotation(self):
+        self.xblock_settings['profiling']['max_files'] = 2
+        for __ in range(3):
+            self.call_handler(self.USER_STATE_HANDLER, method='GET')
+        self.assertEqual(len(self._profiles()), 2)
+
+        self.xblock_settings['profiling']['max_bytes'] = 1
+        self.call_handler(self.USER_STATE_HANDLER, method='GET')
+        self.assertEqual(self._profiles(), [])
+
+    def test_unwritable_directory(self):
+        path = os.path.join(self.directory, 'file')
+        open(path, 'w').close()
+        self.xblock_settings['profiling']['directory'] = path
+        logger = self.apply_patch('drag_and_drop_v2.instrumentation.logger')
+
+        res = self.call_handler(self.DROP_ITEM_HANDLER, {"val": 0, "zone": TOP_ZONE_ID})
+        self.assertTrue(res['correct'])
+        self.assertTrue(logger.exception.called)
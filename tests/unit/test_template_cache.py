@@ -0,0 +1,40 @@
+import mock
+import unittest
+
+from django.template import Template
+
+from drag_and_drop_v2.drag_and_drop_v2 import loader
+from drag_and_drop_v2.template_cache import TemplateCache
+
+
+class TemplateCacheTest(unittest.TestCase):
+    """ Tests for template cache """
+
+    def setUp(self):
+        self.loader = mock.Mock(wraps=loader)
+        self.cache = TemplateCache(self.loader)
+
+    def test_source_loaded_once(self):
+        source = self.cache.load_unicode('/templates/html/js_templates.html')
+        self.assertEqual(self.cache.load_unicode('/templates/html/js_templates.html'), source)
+        self.assertEqual(self.loader.load_unicode.call_count, 1)
+
+    def test_template_compiled_once(self):
+        with mock.patch('drag_and_drop_v2.template_cache.Template', wraps=Template) as template:
+            self.cache.render('/templates/html/drag_and_drop.html')
+            self.cache.render('/templates/html/drag_and_drop.html', {'unused': 1})
+        self.assertEqual(template.call_count, 1)
+
+    def test_render_static_per_language(self):
+        with mock.patch('django.utils.translation.get_language', return_value='en'):
+            rendered = self.cache.render_static('/templates/html/drag_and_drop.html')
+        self.assertIn('Loading drag and drop problem.', rendered)
+
+        with mock.patch.object(self.cache, 'render', return_value=u'rendered') as render:
+            with mock.patch('django.utils.translation.get_language', return_value='en'):
+                self.assertEqual(self.cache.render_static('/templates/html/drag_and_drop.html'), rendered)
+            self.assertFalse(render.called)
+
+            with mock.patch('django.utils.translation.get_language', return_value='de'):
+                self.assertEqual(self.cache.render_static('/templates/html/drag_and_drop.html'), u'rendered')
+            self.assertEqual(render.call_count, 1)
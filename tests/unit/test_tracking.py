@@ -0,0 +1,161 @@
+import ddt
+import mock
+import unittest
+
+from xblock.runtime import KvsFieldData, DictKeyValueStore
+
+from drag_and_drop_v2.default_data import TOP_ZONE_ID, MIDDLE_ZONE_ID, BOTTOM_ZONE_ID
+from drag_and_drop_v2.drag_and_drop_v2 import DragAndDropBlock
+from drag_and_drop_v2.tracking import EventPolicies, EventPolicy, SuppressedEventCounter
+
+from ..utils import make_block, TestCaseMixin
+
+
+ITEM_DROPPED = 'edx.drag_and_drop_v2.item.dropped'
+FEEDBACK_OPENED = 'edx.drag_and_drop_v2.feedback.opened'
+
+
+@ddt.ddt
+class EventPoliciesTest(unittest.TestCase):
+    """ Tests for tracking event policy parsing """
+
+    @ddt.data(
+        (None, EventPolicies.DEFAULT_POLICY),
+        ({}, EventPolicies.DEFAULT_POLICY),
+        ({'mode': 'always'}, EventPolicies.DEFAULT_POLICY),
+        ({'mode': 'unknown'}, EventPolicies.DEFAULT_POLICY),
+        ({'mode': 'off'}, EventPolicy('off', 0.0, None)),
+        ({'mode': 'sample', 'rate': 0.25}, EventPolicy('sample', 0.25, None)),
+        ({'mode': 'sample', 'rate': '0.5'}, EventPolicy('sample', 0.5, None)),
+        ({'mode': 'sample', 'rate': 2}, EventPolicy('sample', 1.0, None)),
+        ({'mode': 'sample'}, EventPolicies.DEFAULT_POLICY),
+        ({'mode': 'first', 'limit': 3}, EventPolicy('first', 1.0, 3)),
+        ({'mode': 'first', 'limit': 'many'}, EventPolicies.DEFAULT_POLICY),
+    )
+    @ddt.unpack
+    def test_get_policy(self, raw_policy, expected_policy):
+        policies = EventPolicies({'event_policies': {ITEM_DROPPED: raw_policy}})
+        self.assertEqual(policies.get(ITEM_DROPPED), expected_policy)
+        self.assertEqual(policies.get(FEEDBACK_OPENED), EventPolicies.DEFAULT_POLICY)
+
+    @ddt.data(
+        (None, EventPolicies.DEFAULT_SUMMARY_INTERVAL),
+        ('invalid', EventPolicies.DEFAULT_SUMMARY_INTERVAL),
+        (0, EventPolicies.DEFAULT_SUMMARY_INTERVAL),
+        (10, 10),
+    )
+    @ddt.unpack
+    def test_summary_interval(self, raw_interval, expected_interval):
+        policies = EventPolicies({'event_summary_interval': raw_interval})
+        self.assertEqual(policies.summary_interval, expected_interval)
+
+    def test_summary_period(self):
+        self.assertEqual(EventPolicies({}).summary_period, EventPolicies.DEFAULT_SUMMARY_PERIOD)
+        self.assertEqual(EventPolicies({'event_summary_period': '60'}).summary_period, 60)
+
+    def test_suppressed_event_counter(self):
+        counter = SuppressedEventCounter()
+        policies = EventPolicies({'event_summary_interval': 3, 'event_summary_period': 60})
+        with mock.patch('time.time', return_value=1000):
+            self.assertIsNone(counter.add('block-1', ITEM_DROPPED, policies))
+            self.assertIsNone(counter.add('block-1', FEEDBACK_OPENED, policies))
+            self.assertIsNone(counter.add('block-2', ITEM_DROPPED, policies))
+            self.assertEqual(counter.add('block-1', ITEM_DROPPED, policies), {ITEM_DROPPED: 2, FEEDBACK_OPENED: 1})
+            self.assertIsNone(counter.add('block-1', ITEM_DROPPED, policies))
+        # Counts are also reported once the summary period passes:
+        with mock.patch('time.time', return_value=1060):
+            self.assertEqual(counter.add('block-2', ITEM_DROPPED, policies), {ITEM_DROPPED: 2})
+
+    def test_should_publish_sample(self):
+        policy = EventPolicy('sample', 0.3, None)
+        with mock.patch('random.random', return_value=0.29):
+            self.assertTrue(EventPolicies.should_publish(policy, 100))
+        with mock.patch('random.random', return_value=0.3):
+            self.assertFalse(EventPolicies.should_publish(policy, 0))
+
+
+class EventPublishingTest(TestCaseMixin, unittest.TestCase):
+    """ Tests for tracking events publishing subject to event policies """
+
+    def setUp(self):
+        self.block = make_block()
+        self.patch_workbench()
+        self.publish = self.apply_patch('workbench.runtime.WorkbenchRuntime.publish')
+        self.apply_patch('drag_and_drop_v2.tracking.SUPPRESSED_EVENTS', SuppressedEventCounter())
+        self.patch_xblock_settings()
+
+    def _published_events(self, event_type=None):
+        events = [call[0][1:] for call in self.publish.call_args_list]
+        return [event for event in events if event_type is None or event[0] == event_type]
+
+    def _drop_incorrect(self, times):
+        for __ in range(times):
+            self.call_handler(self.DROP_ITEM_HANDLER, {"val": 0, "zone": BOTTOM_ZONE_ID})
+
+    def test_no_policies(self):
+        self._drop_incorrect(3)
+        self.call_handler('publish_event', {'event_type': FEEDBACK_OPENED, 'content': 'Foo'})
+
+        self.assertEqual(len(self._published_events(ITEM_DROPPED)), 3)
+        self.assertEqual(self._published_events(FEEDBACK_OPENED), [(FEEDBACK_OPENED, {'content': 'Foo'})])
+        self.assertEqual(self.block.event_counters, {})
+
+    def test_policy_off_with_summary(self):
+        self.xblock_settings = {
+            'event_policies': {ITEM_DROPPED: {'mode': 'off'}},
+            'event_summary_interval': 2,
+        }
+        self._drop_incorrect(3)
+
+        self.assertEqual(self._published_events(ITEM_DROPPED), [])
+        self.assertEqual(self._published_events(EventPolicies.SUMMARY_EVENT_TYPE), [
+            (EventPolicies.SUMMARY_EVENT_TYPE, {
+                'suppressed': {ITEM_DROPPED: 2},
+                'policies': {ITEM_DROPPED: {'mode': 'off', 'rate': 0.0, 'limit': None}},
+            })
+        ])
+        # Suppressed events are counted per block, not in learner's state:
+        self.assertEqual(self.block.event_counters, {})
+
+    def test_summary_across_learners(self):
+        self.xblock_settings = {
+            'event_policies': {ITEM_DROPPED: {'mode': 'off'}},
+            'event_summary_interval': 4,
+        }
+        self._drop_incorrect(3)
+        # Another learner, with their own state, viewing the same block:
+        scope_ids = self.block.scope_ids._replace(user_id='other-user')
+        self.block = DragAndDropBlock(self.block.runtime, KvsFieldData(DictKeyValueStore()), scope_ids=scope_ids)
+        self._drop_incorrect(1)
+
+        summaries = self._published_events(EventPolicies.SUMMARY_EVENT_TYPE)
+        self.assertEqual([summary[1]['suppressed'] for summary in summaries], [{ITEM_DROPPED: 4}])
+
+    def test_policy_sample(self):
+        self.xblock_settings = {'event_policies': {ITEM_DROPPED: {'mode': 'sample', 'rate': 0.5}}}
+        with mock.patch('random.random', side_effect=[0.1, 0.9, 0.4, 0.6]):
+            self._drop_incorrect(4)
+
+        self.assertEqual(len(self._published_events(ITEM_DROPPED)), 2)
+        self.assertEqual(self.block.event_counters, {})
+
+    def test_policy_first_n_per_attempt(self):
+        self.xblock_settings = {'event_policies': {ITEM_DROPPED: {'mode': 'first', 'limit': 2}}}
+        self._drop_incorrect(3)
+        self.assertEqual(len(self._published_events(ITEM_DROPPED)), 2)
+
+        # Limit is applied per attempt
+        self.block.attempts += 1
+        self.call_handler(self.DROP_ITEM_HANDLER, {"val": 0, "zone": TOP_ZONE_ID})
+        self.call_handler(self.DROP_ITEM_HANDLER, {"val": 1, "zone": MIDDLE_ZONE_ID})
+        self._drop_incorrect(1)
+
+        self.assertEqual(len(self._published_events(ITEM_DROPPED)), 4)
+        self.assertEqual(self.block.event_counters, {'attempt': 1, 'published': {ITEM_DROPPED: 2}})
+
+    def test_grade_is_not_subject_to_policies(self):
+        self.xblock_settings = {'event_policies': {ITEM_DROPPED: {'mode': 'off'}, 'grade': {'mode': 'off'}}}
+        self.call_handler(self.DROP_ITEM_HANDLER, {"val": 0, "zone": TOP_ZONE_ID})
+
+        self.assertEqual(len(self._published_events('grade')), 1)
+        self.assertEqual(self._published_events(ITEM_DROPPED), [])
@@ -1,6 +1,8 @@
 import json
 import random
 import re
+import shutil
+import tempfile
 
 from mock import patch
 from webob import Request
@@ -20,10 +22,10 @@ def make_request(data, method='POST'):
     return request
 
 
-def make_block():
+def make_block(key_store=None):
     """ Instantiate a DragAndDropBlock XBlock inside a WorkbenchRuntime """
     block_type = 'drag_and_drop_v2'
-    key_store = DictKeyValueStore()
+    key_store = key_store if key_store is not None else DictKeyValueStore()
     field_data = KvsFieldData(key_store)
     runtime = WorkbenchRuntime()
     def_id = runtime.id_generator.create_definition(block_type)
@@ -32,6 +34,14 @@ def make_block():
     return drag_and_drop_v2.DragAndDropBlock(runtime, field_data, scope_ids=scope_ids)
 
 
+def reload_block(block, key_store):
+    """
+    Returns new instance of `block` reading its fields from `key_store`, as runtimes instantiate blocks for every
+    request - unlike `block`, it has no field values cached.
+    """
+    return drag_and_drop_v2.DragAndDropBlock(block.runtime, KvsFieldData(key_store), scope_ids=block.scope_ids)
+
+
 def generate_max_and_attempts(count=100):
     for _ in xrange(count):
         max_attempts = random.randint(1, 100)
@@ -61,6 +71,22 @@ class TestCaseMixin(object):
             create=True,
         )
 
+    def patch_xblock_settings(self, xblock_settings=None):
+        """
+        Patches blocks to use `self.xblock_settings` as their XBLOCK_SETTINGS; tests may modify or replace it.
+        """
+        self.xblock_settings = xblock_settings if xblock_settings is not None else {}
+        self.apply_patch(
+            'drag_and_drop_v2.drag_and_drop_v2.DragAndDropBlock.get_xblock_settings',
+            lambda _block, default=None: self.xblock_settings
+        )
+
+    def make_temp_directory(self):
+        """ Creates temporary directory, removed on test cleanup """
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        return directory
+
     def apply_patch(self, *args, **kwargs):
         new_patch = patch(*args, **kwargs)
         mock = new_patch.start()